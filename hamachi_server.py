@@ -8,6 +8,21 @@ import threading  # Module pour le multithreading - gère plusieurs clients simu
 import json  # Module JSON - format d'échange de données entre client/serveur
 import random  # Module aléatoire - génère des positions aléatoires pour la nourriture
 import time  # Module temps - gère les timings et les boucles de jeu
+import argparse  # Lecture des options de la ligne de commande
+from snake_bot import PathfindingBot, BotScheduler, BotWorld  # Joueurs contrôlés par l'ordinateur
+from snake_flowfield import FlowField, DangerMap, FlowFieldBot  # Bots en grand nombre (champ partagé)
+import snake_policy  # Bots à réseau de neurones (NumPy optionnel)
+from snake_history import add_history_argument, create_history  # Historique des parties terminées
+
+# Taille de la grille par défaut (20x20 cellules, identique aux clients)
+GRID_SIZE = 20
+# Stratégies de bots disponibles :
+# - 'astar' : chaque bot cherche son chemin (A* + flood fill), pour quelques bots
+# - 'flowfield' : un champ de distances partagé, pour des centaines de bots
+# - 'policy' : réseau de neurones évalué en un seul lot pour tous les bots (NumPy)
+BOT_MODES = ('astar', 'flowfield', 'policy')
+# Durée d'un tick de jeu en secondes (100ms = 10 mouvements/seconde)
+TICK_SECONDS = 0.1
 
 
 class HamachiSnakeServer:
@@ -20,15 +35,25 @@ class HamachiSnakeServer:
     - Boucle de jeu principale
     """
 
-    def __init__(self, host='0.0.0.0', port=5555):
+    def __init__(self, host='0.0.0.0', port=5555, min_players=0, bot_budget_ms=20.0,
+                 bot_mode='astar', grid_size=GRID_SIZE, policy_path=None, history=None):
         """
         CONSTRUCTEUR : Initialise le serveur
         Paramètres :
             host : '0.0.0.0' signifie "écouter sur toutes les interfaces réseau"
             port : 5555 (port standard pour notre jeu)
+            min_players : nombre minimal de serpents, les places vides sont occupées par des bots
+            bot_budget_ms : temps CPU maximal consacré aux bots à chaque tick (mode 'astar')
+            bot_mode : stratégie des bots, 'astar' ou 'flowfield' (voir BOT_MODES)
+            grid_size : nombre de cellules par côté (les clients affichent 20x20)
+            policy_path : fichier .npz des poids (mode 'policy'), None = poids aléatoires
+            history : journal des parties (HistoryLog), une ligne par joueur humain qui part
         """
+        if bot_mode not in BOT_MODES:
+            raise ValueError(f"Mode de bots inconnu : {bot_mode}")
         self.host = host
         self.port = port
+        self.grid_size = grid_size
 
         # Création du socket serveur
         # AF_INET = IPv4, SOCK_STREAM = TCP (connexion fiable)
@@ -51,6 +76,29 @@ class HamachiSnakeServer:
 
         self.running = True  # Flag pour la boucle principale
 
+        # Historique : la partie d'un joueur humain est notée à son départ (None : aucun journal)
+        self.history = history
+
+        # Compteur d'identifiants : un ID n'est jamais réutilisé, même après un départ
+        self.next_client_id = 0
+
+        # === BOTS ===
+        # Les bots sont des "clients virtuels" (conn = None) qui occupent les places vides
+        self.min_players = min_players
+        self.bot_mode = bot_mode
+        self.bot_scheduler = BotScheduler(bot_budget_ms)
+        # Mode 'flowfield' : champ de distances et carte de danger communs à tous les bots,
+        # mis à jour une fois par tick
+        self.flow_field = FlowField(grid_size)
+        self.danger_map = DangerMap(self.flow_field)
+        # Mode 'policy' : un seul PolicyRunner évalue tous les bots en un lot
+        self.policy_runner = None
+        if bot_mode == 'policy':
+            layers = snake_policy.load_weights(policy_path) if policy_path else None
+            self.policy_runner = snake_policy.PolicyRunner(layers)
+        # Verrou : le thread d'acceptation et la boucle de jeu modifient tous deux self.clients
+        self.clients_lock = threading.RLock()
+
         print("🐍 SERVEUR SNAKE HAMACHI")
 
     def start(self):
@@ -77,6 +125,9 @@ class HamachiSnakeServer:
             print(f"   Port : {self.port}")
             print("👥 En attente de joueurs...")
 
+            # === BOTS INITIAUX ===
+            self.fill_bot_slots()
+
             # === THREAD DE LA BOUCLE DE JEU ===
             # Daemon = True : ce thread s'arrête quand le thread principal s'arrête
             game_thread = threading.Thread(target=self.game_loop)
@@ -90,25 +141,28 @@ class HamachiSnakeServer:
                 print(f"✅ {addr[0]} connecté!")
 
                 # Attribue un ID unique au client (0, 1, 2...)
-                client_id = len(self.clients)
+                client_id = self.allocate_client_id()
 
                 # Crée l'entrée du client dans le dictionnaire
-                self.clients[client_id] = {
-                    'conn': conn,  # Socket de communication
-                    'addr': addr,  # Adresse (IP, port)
-                    'name': f"Joueur {client_id + 1}",  # Nom par défaut
-                    'snake': {
-                        'body': [[6 + client_id * 2, 9], [5 + client_id * 2, 9], [4 + client_id * 2, 9]],
-                        # Position de départ décalée selon l'ID
-                        # Joueur 0 : [[6,9], [5,9], [4,9]]
-                        # Joueur 1 : [[8,9], [7,9], [6,9]]
-                        # etc.
-                        'direction': [1, 0],  # Direction initiale (droite)
-                        'score': 0,  # Score initial
-                        'alive': True  # Le serpent est vivant
-                    },
-                    'last_update': time.time()  # Timestamp de dernière activité
-                }
+                with self.clients_lock:
+                    self.clients[client_id] = {
+                        'conn': conn,  # Socket de communication
+                        'addr': addr,  # Adresse (IP, port)
+                        'name': f"Joueur {client_id + 1}",  # Nom par défaut
+                        'snake': {
+                            'body': self.spawn_body(),
+                            # Position de départ : 3 cellules libres, comme pour les bots
+                            # (les ID ne sont jamais réutilisés : une position calculée à partir
+                            # de l'ID finirait hors de la grille)
+                            'direction': [1, 0],  # Direction initiale (droite)
+                            'score': 0,  # Score initial
+                            'alive': True  # Le serpent est vivant
+                        },
+                        'last_update': time.time(),  # Timestamp de dernière activité
+                        'joined': time.time()  # Arrivée du joueur (durée de sa partie)
+                    }
+                    # Un humain arrive : un bot lui cède sa place si nécessaire
+                    self.fill_bot_slots()
 
                 # === ENVOI IMMÉDIAT DE L'ID AU CLIENT ===
                 # TRÈS IMPORTANT : le client doit connaître son ID pour s'identifier
@@ -161,6 +215,9 @@ class HamachiSnakeServer:
             data : dictionnaire Python à envoyer
         Retourne : bool (True si succès, False si échec)
         """
+        if conn is None:
+            # Client virtuel (bot) : rien à envoyer
+            return True
         try:
             # Convertit le dictionnaire en chaîne JSON, puis en bytes
             message = json.dumps(data).encode('utf-8')
@@ -240,98 +297,256 @@ class HamachiSnakeServer:
         """
         MÉTHODE : BOUCLE PRINCIPALE DU JEU
         S'exécute dans un thread séparé
-        Fréquence : ~10 FPS (time.sleep(0.1) = 100ms)
-        Rôle :
-        1. Mettre à jour la position de tous les serpents
-        2. Vérifier les collisions avec la nourriture
-        3. Générer de nouvelle nourriture si nécessaire
-        4. Envoyer l'état mis à jour à TOUS les clients
+        Fréquence : ~10 FPS (TICK_SECONDS = 100ms)
+        Appelle tick() puis attend le reste de la période
         """
         while self.running:
             try:
-                # === MISE À JOUR DE TOUS LES SERPENTS ===
-                # list() crée une copie pour éviter les erreurs si un client se déconnecte
-                for client_id, client in list(self.clients.items()):
-                    # Ignore les serpents morts
-                    if not client['snake']['alive']:
-                        continue
-
-                    snake = client['snake']
-                    head = snake['body'][0]
-                    direction = snake['direction']
-
-                    # NOUVELLE TÊTE : position actuelle + direction
-                    new_head = [
-                        (head[0] + direction[0]) % 20,  # wrap-around horizontal
-                        (head[1] + direction[1]) % 20  # wrap-around vertical
-                    ]
-
-                    # Ajoute la nouvelle tête au début du corps
-                    snake['body'].insert(0, new_head)
-
-                    # === VÉRIFICATION DE LA NOURRITURE ===
-                    if new_head == self.game_state['food1']:
-                        # Mange la pomme : +10 points, génère nouvelle pomme
-                        snake['score'] += 10
-                        self.game_state['food1'] = self.generate_food_position()
-                    elif new_head == self.game_state['food2']:
-                        # Mange le champignon : +15 points, génère nouveau champignon
-                        snake['score'] += 15
-                        self.game_state['food2'] = self.generate_food_position()
-                    else:
-                        # Rien mangé : on retire la queue (longueur constante)
-                        snake['body'].pop()
-
-                # === BROADCAST : envoie l'état à tous les clients ===
-                self.broadcast_game_state()
+                started = time.perf_counter()
+                self.tick()
 
                 # Vitesse du jeu : 100ms = 10 mouvements/seconde
-                time.sleep(0.1)
+                # Le temps passé dans tick() (bots compris) est déduit de l'attente
+                time.sleep(max(0.0, TICK_SECONDS - (time.perf_counter() - started)))
 
             except Exception as e:
                 print(f"Erreur game loop: {e}")
                 time.sleep(1)
 
+    def tick(self):
+        """
+        MÉTHODE : Un pas de simulation
+        1. Les bots choisissent leur direction (budget CPU partagé)
+        2. Mettre à jour la position de tous les serpents
+        3. Vérifier les collisions avec la nourriture
+        4. Générer de nouvelle nourriture si nécessaire
+        5. Envoyer l'état mis à jour à TOUS les clients
+        """
+        with self.clients_lock:
+            # === DÉCISION DES BOTS ===
+            self.update_bots()
+
+            # === MISE À JOUR DE TOUS LES SERPENTS ===
+            # list() crée une copie pour éviter les erreurs si un client se déconnecte
+            for client_id, client in list(self.clients.items()):
+                # Ignore les serpents morts
+                if not client['snake']['alive']:
+                    continue
+
+                snake = client['snake']
+                head = snake['body'][0]
+                direction = snake['direction']
+
+                # NOUVELLE TÊTE : position actuelle + direction
+                new_head = [
+                    (head[0] + direction[0]) % self.grid_size,  # wrap-around horizontal
+                    (head[1] + direction[1]) % self.grid_size  # wrap-around vertical
+                ]
+
+                # Ajoute la nouvelle tête au début du corps
+                snake['body'].insert(0, new_head)
+
+                # === VÉRIFICATION DE LA NOURRITURE ===
+                if new_head == self.game_state['food1']:
+                    # Mange la pomme : +10 points, génère nouvelle pomme
+                    snake['score'] += 10
+                    self.game_state['food1'] = self.generate_food_position()
+                elif new_head == self.game_state['food2']:
+                    # Mange le champignon : +15 points, génère nouveau champignon
+                    snake['score'] += 15
+                    self.game_state['food2'] = self.generate_food_position()
+                else:
+                    # Rien mangé : on retire la queue (longueur constante)
+                    snake['body'].pop()
+
+        # === BROADCAST : envoie l'état à tous les clients ===
+        # Hors du verrou : un client lent ne bloque pas les arrivées ni les changements de direction
+        self.broadcast_game_state()
+
+    def blocked_cells(self):
+        """
+        MÉTHODE : Cellules bloquées = obstacles + corps de tous les serpents
+        """
+        blocked = {tuple(obstacle) for obstacle in self.game_state['obstacles']}
+        for client in self.clients.values():
+            blocked.update(tuple(segment) for segment in client['snake']['body'])
+        return blocked
+
+    def build_bot_world(self):
+        """
+        MÉTHODE : Construit la vue de la grille partagée par tous les bots pour ce tick
+        """
+        return BotWorld(self.grid_size, self.blocked_cells(),
+                        [self.game_state['food1'], self.game_state['food2']])
+
+    def update_bots(self):
+        """
+        MÉTHODE : Fait choisir une direction à chaque bot dans le budget du tick
+        """
+        bots = [(client_id, client) for client_id, client in self.clients.items()
+                if client.get('bot') is not None and client['snake']['alive']]
+        if not bots:
+            return
+        if self.bot_mode == 'flowfield':
+            self.update_flowfield_bots(bots)
+            return
+        if self.bot_mode == 'policy':
+            self.update_policy_bots(bots)
+            return
+        world = self.build_bot_world()
+        requests = [(client['bot'], client['snake']['body'][0], client['snake']['direction'],
+                     len(client['snake']['body'])) for _, client in bots]
+        directions = self.bot_scheduler.run(requests, world)
+        for (_, client), direction in zip(bots, directions):
+            client['snake']['direction'] = list(direction)
+
+    def update_flowfield_bots(self, bots):
+        """
+        MÉTHODE : Mode 'flowfield' - un seul calcul de grille par tick pour tous les bots
+        1. Le champ de distances à la nourriture est mis à jour (seules les cellules
+           occupées/libérées et la nourriture déplacée sont recalculées)
+        2. La carte de danger est construite depuis les têtes de TOUS les serpents
+        3. Chaque bot lit 4 cases voisines : O(1) par bot
+        """
+        self.flow_field.update(self.blocked_cells(),
+                               [tuple(self.game_state['food1']), tuple(self.game_state['food2'])])
+        self.danger_map.build(client['snake']['body'][0] for client in self.clients.values()
+                              if client['snake']['alive'])
+        for _, client in bots:
+            snake = client['snake']
+            direction = client['bot'].choose_direction(snake['body'][0], snake['direction'],
+                                                       self.flow_field, self.danger_map)
+            snake['direction'] = list(direction)
+
+    def update_policy_bots(self, bots):
+        """
+        MÉTHODE : Mode 'policy' - observations de tous les bots rassemblées en un tableau,
+        un seul passage du réseau, puis chaque bot reçoit son action
+        """
+        snakes = [client['snake'] for _, client in bots]
+        directions = self.policy_runner.act(
+            [snake['body'][0] for snake in snakes],
+            [snake['direction'] for snake in snakes],
+            self.blocked_cells(),
+            [self.game_state['food1'], self.game_state['food2']],
+            self.grid_size)
+        for snake, direction in zip(snakes, directions):
+            snake['direction'] = list(direction)
+
+    def create_bot(self):
+        """
+        MÉTHODE : Contrôleur d'un nouveau bot selon self.bot_mode
+        Le mode 'policy' partage le même PolicyRunner entre tous les bots
+        """
+        if self.bot_mode == 'flowfield':
+            return FlowFieldBot()
+        if self.bot_mode == 'policy':
+            return self.policy_runner
+        return PathfindingBot()
+
+    def allocate_client_id(self):
+        """
+        MÉTHODE : Renvoie un nouvel identifiant unique (jamais réutilisé)
+        """
+        with self.clients_lock:
+            client_id = self.next_client_id
+            self.next_client_id += 1
+            return client_id
+
+    def spawn_body(self):
+        """
+        MÉTHODE : Trouve 3 cellules libres alignées pour faire apparaître un serpent (bot ou humain)
+        Returns : corps [[x, y], [x-1, y], [x-2, y]]
+        """
+        occupied = {tuple(obstacle) for obstacle in self.game_state['obstacles']}
+        for client in self.clients.values():
+            occupied.update(tuple(segment) for segment in client['snake']['body'])
+        occupied.add(tuple(self.game_state['food1']))
+        occupied.add(tuple(self.game_state['food2']))
+        for _ in range(200):
+            x, y = random.randint(0, self.grid_size - 1), random.randint(0, self.grid_size - 1)
+            body = [[(x - k) % self.grid_size, y] for k in range(3)]
+            if all(tuple(segment) not in occupied for segment in body):
+                return body
+        # Grille saturée : on superpose (le bot trouvera une sortie au tick suivant)
+        return [[x, y], [(x - 1) % self.grid_size, y], [(x - 2) % self.grid_size, y]]
+
+    def add_bot(self):
+        """
+        MÉTHODE : Ajoute un joueur contrôlé par l'ordinateur (client virtuel)
+        Returns : l'ID du bot
+        """
+        with self.clients_lock:
+            client_id = self.allocate_client_id()
+            self.clients[client_id] = {
+                'conn': None,  # Pas de socket : client virtuel
+                'addr': None,
+                'name': f"Bot {client_id + 1}",
+                'bot': self.create_bot(),
+                'snake': {
+                    'body': self.spawn_body(),
+                    'direction': [1, 0],
+                    'score': 0,
+                    'alive': True
+                },
+                'last_update': time.time()
+            }
+            return client_id
+
+    def fill_bot_slots(self):
+        """
+        MÉTHODE : Maintient au moins min_players serpents en ajoutant/retirant des bots
+        Les bots cèdent leur place quand des humains arrivent
+        """
+        with self.clients_lock:
+            bot_ids = [cid for cid, client in self.clients.items() if client.get('bot') is not None]
+            humans = len(self.clients) - len(bot_ids)
+            wanted_bots = max(0, self.min_players - humans)
+            while len(bot_ids) < wanted_bots:
+                bot_ids.append(self.add_bot())
+            while len(bot_ids) > wanted_bots:
+                self.remove_client(bot_ids.pop())
+
     def generate_food_position(self):
         """
         MÉTHODE : Génère une position aléatoire VALIDE pour la nourriture
         Critères de validité :
         - Ne pas être sur un obstacle
         - Ne pas être sur un serpent
-        - Boucle jusqu'à trouver une position valide
+        - Tirage aléatoire, puis choix parmi les cellules libres si la grille est encombrée
         """
-        while True:
-            # Position aléatoire sur la grille 20x20
-            pos = [random.randint(0, 19), random.randint(0, 19)]
-
-            # Vérifie les obstacles
-            if pos in self.game_state['obstacles']:
-                continue
+        occupied = {tuple(obstacle) for obstacle in self.game_state['obstacles']}
+        for client in list(self.clients.values()):
+            occupied.update(tuple(segment) for segment in client['snake']['body'])
 
-            # Vérifie tous les serpents
-            on_snake = False
-            for client in self.clients.values():
-                if pos in client['snake']['body']:
-                    on_snake = True
-                    break
+        for _ in range(100):
+            # Position aléatoire sur la grille
+            pos = [random.randint(0, self.grid_size - 1), random.randint(0, self.grid_size - 1)]
 
-            if not on_snake:
+            # Vérifie les obstacles et tous les serpents
+            if tuple(pos) not in occupied:
                 return pos
 
+        # Grille presque pleine (beaucoup de bots) : choisit parmi les cellules libres restantes
+        free = [[x, y] for x in range(self.grid_size) for y in range(self.grid_size)
+                if (x, y) not in occupied]
+        return random.choice(free) if free else pos
+
     def prepare_game_state(self):
         """
         MÉTHODE : Prépare l'état du jeu pour l'envoi aux clients
         Convertit les données internes en format JSON-friendly
         """
         players = {}
-        for client_id, client in self.clients.items():
-            players[client_id] = {
-                'name': client['name'],
-                'body': client['snake']['body'],
-                'score': client['snake']['score'],
-                'alive': client['snake']['alive'],
-                'direction': client['snake']['direction']
-            }
+        with self.clients_lock:
+            for client_id, client in self.clients.items():
+                players[client_id] = {
+                    'name': client['name'],
+                    'body': client['snake']['body'],
+                    'score': client['snake']['score'],
+                    'alive': client['snake']['alive'],
+                    'direction': client['snake']['direction']
+                }
 
         return {
             'players': players,
@@ -344,24 +559,30 @@ class HamachiSnakeServer:
         """
         MÉTHODE : Envoie l'état du jeu à TOUS les clients connectés
         Gère les clients déconnectés silencieusement
+        L'état est sérialisé sous le verrou, puis envoyé sans le verrou (un socket lent ou
+        bloqué ne retient que la boucle de jeu, pas les threads des autres clients)
         """
-        if not self.clients:
-            return
-
-        # Prépare l'état une fois pour tous les clients
-        game_state = self.prepare_game_state()
-        message = {
-            'type': 'state',
-            'game_state': game_state
-        }
+        with self.clients_lock:
+            if not self.clients:
+                return
+
+            # Prépare l'état une fois pour tous les clients (octets prêts à envoyer)
+            message = json.dumps({
+                'type': 'state',
+                'game_state': self.prepare_game_state()
+            }).encode('utf-8')
+            # Copie des sockets : un client peut arriver ou partir pendant les envois
+            connections = [(client_id, client['conn'])
+                           for client_id, client in self.clients.items()
+                           if client['conn'] is not None]  # Bots : pas de socket
 
         # Liste des clients à supprimer
         dead_clients = []
 
-        for client_id, client in self.clients.items():
+        for client_id, conn in connections:
             try:
-                self.send_json(client['conn'], message)
-            except:
+                conn.send(message)
+            except OSError:
                 # Si l'envoi échoue, le client est déconnecté
                 dead_clients.append(client_id)
 
@@ -374,12 +595,25 @@ class HamachiSnakeServer:
         MÉTHODE : Retire proprement un client déconnecté
         Ferme le socket et supprime du dictionnaire
         """
-        if client_id in self.clients:
-            try:
-                self.clients[client_id]['conn'].close()
-            except:
-                pass
-            del self.clients[client_id]
+        with self.clients_lock:
+            if client_id not in self.clients:
+                return
+            client = self.clients.pop(client_id)
+            if client['conn'] is not None:
+                if self.history is not None:
+                    # Pas de mort en réseau : la partie d'un joueur se termine à son départ
+                    self.history.append(mode='network', level=None, theme=None,
+                                        player_id=str(client_id), name=client['name'],
+                                        score=client['snake']['score'],
+                                        length=len(client['snake']['body']), ticks=None,
+                                        duration_ms=round((time.time() - client['joined']) * 1000),
+                                        cause='left')
+                try:
+                    client['conn'].close()
+                except:
+                    pass
+                # Un humain part : un bot reprend sa place si nécessaire
+                self.fill_bot_slots()
 
 
 if __name__ == "__main__":
@@ -387,5 +621,26 @@ if __name__ == "__main__":
     POINT D'ENTRÉE : S'exécute quand le fichier est lancé directement
     Crée et démarre le serveur
     """
-    server = HamachiSnakeServer('0.0.0.0', 5555)
-    server.start()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Serveur Snake multijoueur (Hamachi)")
+    parser.add_argument('--port', type=int, default=5555, help="Port d'écoute (5555 par défaut)")
+    parser.add_argument('--bots', type=int, default=0,
+                        help="Nombre minimal de serpents : les places vides sont prises par des bots")
+    parser.add_argument('--bot-budget', type=float, default=20.0,
+                        help="Temps CPU maximal des bots par tick, en millisecondes (20 par défaut)")
+    parser.add_argument('--bot-mode', choices=BOT_MODES, default='astar',
+                        help="Stratégie des bots : 'astar' (par bot), 'flowfield' (centaines de bots) "
+                             "ou 'policy' (réseau de neurones, nécessite NumPy)")
+    parser.add_argument('--policy', metavar='POIDS.npz',
+                        help="Poids du réseau pour --bot-mode policy (W0, b0, W1, b1, ...)")
+    parser.add_argument('--grid', type=int, default=GRID_SIZE,
+                        help="Cellules par côté (20 par défaut, taille affichée par les clients)")
+    add_history_argument(parser)
+    args = parser.parse_args()
+
+    history = create_history(args)
+    server = HamachiSnakeServer('0.0.0.0', args.port, min_players=args.bots,
+                                bot_budget_ms=args.bot_budget, bot_mode=args.bot_mode,
+                                grid_size=args.grid, policy_path=args.policy, history=history)
+    server.start()
+    if history is not None:
+        history.close()  # Parties en attente écrites à l'arrêt du serveur
\ No newline at end of file
@@ -31,6 +31,49 @@ import json
 # Utilisé indirectement via pygame.image.load() pour vérifier l'existence des images.
 import os
 
+# Module argparse : lecture des options de la ligne de commande (ex: --bot).
+import argparse
+
+# Joueur contrôlé par l'ordinateur (A* + flood fill), utilisé avec l'option --bot.
+from snake_bot import PathfindingBot, BotWorld, cell
+
+# Gestionnaire d'images partagé : chaque image est chargée et convertie une seule fois,
+# puis mise en cache par taille de cellule (voir snake_assets.py).
+from snake_assets import assets
+
+# Profileur de frames par phase, activé par l'option --profile (voir snake_profiler.py).
+from snake_profiler import NULL_PROFILER, add_profile_arguments, create_profiler
+
+# Overlay de performances affiché avec la touche F3 (voir snake_hud.py).
+from snake_hud import PerfOverlay, add_hud_argument
+
+# Cache des couches statiques de l'écran (voir snake_background.py).
+from snake_background import BackgroundLayer, cells_key
+
+# Rendu par zones modifiées, option --dirty-rects (voir snake_dirty.py).
+from snake_dirty import add_dirty_argument, create_dirty_rects
+
+# Polices chargées une seule fois et cache des textes rendus (voir snake_text.py).
+from snake_text import fonts
+
+# Simulation à pas de temps fixe et déplacement interpolé des serpents (voir snake_loop.py).
+from snake_loop import interpolate
+
+# Menus pilotés par les événements : redessinés seulement quand ils changent (voir snake_menu.py).
+from snake_menu import MenuView
+
+# Fenêtre agrandie, le jeu étant dessiné à sa taille normale (voir snake_framebuffer.py).
+from snake_framebuffer import add_display_arguments, create_framebuffer
+
+# Banque de sons partagée par les deux serpents (importée avant pygame.init()).
+from snake_audio import sounds
+
+# Simulation dans la boucle principale ou sur un thread séparé (voir snake_pipeline.py).
+from snake_pipeline import add_threaded_argument, create_simulation
+
+# Historique de toutes les parties terminées, écrit par lots (voir snake_history.py).
+from snake_history import add_history_argument, create_history
+
 # Initialise tous les modules Pygame (affichage, mixeur audio, gestion des événements…).
 # Doit être appelé avant toute autre fonction Pygame.
 pygame.init()
@@ -83,10 +126,10 @@ TEXT_DARK = (44, 62, 80)
 UI_BG = (52, 73, 94)
 
 # POLICES DE CARACTÈRES
-# pygame.font.Font(None, taille) utilise la police par défaut du système.
-title_font = pygame.font.Font(None, 60)   # Police pour les gros titres (60px)
-score_font = pygame.font.Font(None, 40)   # Police pour l'affichage des scores (40px)
-info_font = pygame.font.Font(None, 28)    # Police pour les informations secondaires (28px)
+# fonts.get(taille) : police par défaut, chargée une seule fois ; ses textes rendus sont mis en cache.
+title_font = fonts.get(60)   # Police pour les gros titres (60px)
+score_font = fonts.get(40)   # Police pour l'affichage des scores (40px)
+info_font = fonts.get(28)    # Police pour les informations secondaires (28px)
 
 # PARAMÈTRES DE LA GRILLE DE JEU
 # Le terrain est divisé en cellules carrées de taille fixe.
@@ -151,24 +194,13 @@ class Food:
 
     def load_image(self):
         """
-        Charge l'image de la nourriture depuis le fichier et la redimensionne.
-        Si le fichier est introuvable, crée une surface avec un cercle de couleur de secours.
+        Récupère l'image de la nourriture depuis le gestionnaire d'images partagé.
+        Si le fichier est introuvable, un cercle de couleur de secours (mis en cache) est utilisé.
         """
-        try:
-            # Récupère le chemin du fichier image depuis le dictionnaire FOOD_TYPES
-            image_path = FOOD_TYPES[self.food_type]['image']
-            # Charge l'image dans une Surface Pygame
-            self.surface = pygame.image.load(image_path)
-            # Redimensionne l'image pour qu'elle corresponde exactement à la taille d'une cellule
-            self.surface = pygame.transform.scale(self.surface, (cell_size, cell_size))
-        except:
-            # En cas d'échec (fichier manquant, format non supporté, etc.)
-            # Crée une surface transparente (pygame.SRCALPHA active le canal alpha)
-            self.surface = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
-            # Choisit la couleur de secours : rouge pour pomme, orange pour champignon
-            color = RED if self.food_type == 'apple' else ORANGE
-            # Dessine un cercle au centre de la surface comme image de remplacement
-            pygame.draw.circle(self.surface, color, (cell_size//2, cell_size//2), cell_size//2)
+        # Couleur de secours : rouge pour pomme, orange pour champignon
+        color = RED if self.food_type == 'apple' else ORANGE
+        # Surface partagée entre toutes les nourritures du même type (ne pas la modifier)
+        self.surface = assets.food(FOOD_TYPES[self.food_type]['image'], color, cell_size)
 
     def draw(self, screen):
         """
@@ -259,14 +291,9 @@ class Obstacle:
             position (Vector2): Position de l'obstacle sur la grille.
         """
         self.position = position
-        try:
-            # Tentative de chargement de l'image de brique (fichier 'barier.png' – probablement 'barrier')
-            self.brick_image = pygame.image.load('barier.png')
-            # Redimensionne l'image à la taille d'une cellule
-            self.brick_image = pygame.transform.scale(self.brick_image, (cell_size, cell_size))
-        except:
-            # Si l'image est introuvable, on dessinera un motif de briques manuellement
-            self.brick_image = None
+        # Image de brique partagée (barier.png chargée une seule fois),
+        # ou motif de briques procédural dessiné une fois si le fichier est absent
+        self.brick_image = assets.obstacle(cell_size)
 
     def draw(self, screen):
         """
@@ -278,38 +305,8 @@ class Obstacle:
         # Conversion des coordonnées grille → pixels
         x = OFFSET + self.position.x * cell_size
         y = OFFSET + self.position.y * cell_size
-
-        if self.brick_image:
-            # Si l'image est chargée, on l'affiche simplement
-            screen.blit(self.brick_image, (x, y))
-        else:
-            # Sinon, on dessine un motif de briques réaliste avec des rectangles
-            # Couleurs pour simuler une brique
-            BRICK_RED = (192, 57, 43)    # Rouge brique
-            BRICK_DARK = (169, 50, 38)   # Rouge foncé pour les ombres
-            BRICK_LIGHT = (205, 97, 85)  # Rouge clair pour les reflets
-
-            # Rectangle principal de la brique
-            obstacle_rect = pygame.Rect(x, y, cell_size, cell_size)
-            # Fond de la brique avec coins arrondis
-            pygame.draw.rect(screen, BRICK_RED, obstacle_rect, border_radius=4)
-
-            # Hauteur d'une rangée de briques (3 rangées dans une cellule)
-            brick_height = cell_size // 3
-            # Largeur d'une brique (2 briques par rangée)
-            brick_width = cell_size // 2
-
-            # Rangée du haut : deux briques sombres (effet d'ombre)
-            pygame.draw.rect(screen, BRICK_DARK, (x, y, brick_width - 1, brick_height - 1))
-            pygame.draw.rect(screen, BRICK_DARK, (x + brick_width, y, brick_width - 1, brick_height - 1))
-            # Rangée du milieu : une brique claire sur toute la largeur
-            pygame.draw.rect(screen, BRICK_LIGHT, (x, y + brick_height, cell_size, brick_height - 1))
-            # Rangée du bas : deux briques sombres
-            pygame.draw.rect(screen, BRICK_DARK, (x, y + 2 * brick_height, brick_width - 1, brick_height))
-            pygame.draw.rect(screen, BRICK_DARK, (x + brick_width, y + 2 * brick_height, brick_width - 1, brick_height))
-
-            # Bordure sombre autour de l'obstacle (largeur 2 pixels)
-            pygame.draw.rect(screen, BRICK_DARK, obstacle_rect, 2, border_radius=4)
+        # Un seul blit d'une surface déjà convertie au format de l'écran
+        screen.blit(self.brick_image, (x, y))
 
 
 # CLASSE Snake
@@ -331,6 +328,8 @@ class Snake:
             Vector2(start_pos[0] - 1, start_pos[1]),      # Segment 1
             Vector2(start_pos[0] - 2, start_pos[1])       # Segment 2 (queue)
         ]
+        # Corps au tick précédent : le dessin glisse de ces cases vers les cases actuelles
+        self.prev_body = list(self.snake_body)
         # Direction initiale : vers la droite (1, 0)
         self.direction = Vector2(1, 0)
         # Drapeau : si True, un segment sera ajouté lors du prochain update (après avoir mangé)
@@ -344,33 +343,24 @@ class Snake:
         # (il est réinitialisé immédiatement après une collision)
         self.alive = True
 
-        # Chargement des effets sonores (optionnel)
-        try:
-            # Son joué quand le serpent mange de la nourriture
-            self.eat_sound = pygame.mixer.Sound("snake_eat.wav")
-            # Son joué lors d'une collision (mur, obstacle, autre serpent)
-            self.wall_hit_sound = pygame.mixer.Sound("snake_collision.wav")
-        except:
-            # Si les fichiers audio sont absents, on désactive les sons
-            self.eat_sound = None
-            self.wall_hit_sound = None
-
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Dessine le serpent à l'écran.
         
         Args:
             screen (pygame.Surface): Surface de la fenêtre.
+            alpha (float): Avancement entre le tick précédent et le tick courant
+                (1 : chaque segment est dessiné sur sa case).
         """
         if not self.alive:
             return
 
-        # Parcours de tous les segments du corps
-        for i, seg in enumerate(self.snake_body):
+        # Parcours de tous les segments du corps, entre leur case précédente et leur case actuelle
+        for i, (x, y) in enumerate(interpolate(self.prev_body, self.snake_body, alpha)):
             # Conversion grille → pixels
             seg_rect = pygame.Rect(
-                OFFSET + seg.x * cell_size,
-                OFFSET + seg.y * cell_size,
+                round(OFFSET + x * cell_size),
+                round(OFFSET + y * cell_size),
                 cell_size, cell_size
             )
             # Tête : couleur spéciale, corps : couleur normale
@@ -393,6 +383,9 @@ class Snake:
         if not self.alive:
             return
 
+        # Mémorise le corps avant le déplacement (interpolation du dessin)
+        self.prev_body = list(self.snake_body)
+
         # Calcule la nouvelle position de la tête = ancienne tête + direction
         new_head = self.snake_body[0] + self.direction
         # Effet de rebondissement : si le serpent sort par la droite (x = 20),
@@ -423,6 +416,8 @@ class Snake:
             Vector2(start_pos[0] - 1, start_pos[1]),
             Vector2(start_pos[0] - 2, start_pos[1])
         ]
+        # Pas de glissement depuis la position de la collision
+        self.prev_body = list(self.snake_body)
         self.direction = Vector2(1, 0)
         self.alive = True
 
@@ -489,6 +484,9 @@ class TwoPlayerGame:
         self.player2_name = player2_name
         self.level = level
 
+        # Sons décodés une seule fois et partagés par les deux serpents
+        sounds.load()
+
         # Création des deux serpents avec des positions de départ distinctes
         # Joueur 1 : départ à (6,9) – orientation droite
         self.snake1 = Snake([6, 9], p1_color, player1_name)
@@ -522,6 +520,11 @@ class TwoPlayerGame:
         self.score2 = 0
         # État du jeu (toujours RUNNING, pas de pause générale)
         self.state = "RUNNING"
+        # Ticks simulés et tick de départ de la vie en cours de chaque joueur (durée des parties)
+        self.ticks = 0
+        self.life_start = {1: 0, 2: 0}
+        # Journal des parties terminées (HistoryLog de snake_history.py), branché par main()
+        self.history = None
 
     def generate_obstacles(self, count):
         """
@@ -554,28 +557,28 @@ class TwoPlayerGame:
                     break  # Sort de la boucle interne, passe à l'obstacle suivant
         return obstacles
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
-        Dessine tous les éléments du jeu : obstacles, nourritures, serpents.
+        Dessine les éléments mobiles du jeu : nourritures, serpents.
+        Les obstacles font partie de l'arrière-plan en cache (voir paint_background).
         
         Args:
             screen (pygame.Surface): Surface de la fenêtre.
+            alpha (float): Avancement entre les deux derniers ticks (déplacement interpolé).
         """
-        # Dessin des obstacles
-        for obstacle in self.obstacles:
-            obstacle.draw(screen)
         # Dessin des nourritures
         self.food1.draw(screen)
         self.food2.draw(screen)
         # Dessin des serpents
-        self.snake1.draw(screen)
-        self.snake2.draw(screen)
+        self.snake1.draw(screen, alpha)
+        self.snake2.draw(screen, alpha)
 
     def update(self):
         """
         Met à jour la logique du jeu : déplacement des serpents et collisions.
         """
         if self.state == "RUNNING":
+            self.ticks += 1
             self.snake1.update()
             self.snake2.update()
             self.check_collisions()
@@ -594,67 +597,89 @@ class TwoPlayerGame:
             self.snake1.add_segment = True
             # Ajoute les points au score du joueur 1
             self.score1 += self.food1.get_points()
-            # Joue le son de "manger" si disponible
-            if self.snake1.eat_sound:
-                self.snake1.eat_sound.play()
+            # Joue le son de "manger" (rien si la banque est muette)
+            sounds.play('eat')
 
         # --- Joueur 1 mange food2 (champignon) ---
         if self.snake1.snake_body[0] == self.food2.position:
             self.food2.position = self.food2.generate_random_pos()
             self.snake1.add_segment = True
             self.score1 += self.food2.get_points()
-            if self.snake1.eat_sound:
-                self.snake1.eat_sound.play()
+            sounds.play('eat')
 
         # --- Joueur 2 mange food1 ---
         if self.snake2.snake_body[0] == self.food1.position:
             self.food1.position = self.food1.generate_random_pos()
             self.snake2.add_segment = True
             self.score2 += self.food1.get_points()
-            if self.snake2.eat_sound:
-                self.snake2.eat_sound.play()
+            sounds.play('eat')
 
         # --- Joueur 2 mange food2 ---
         if self.snake2.snake_body[0] == self.food2.position:
             self.food2.position = self.food2.generate_random_pos()
             self.snake2.add_segment = True
             self.score2 += self.food2.get_points()
-            if self.snake2.eat_sound:
-                self.snake2.eat_sound.play()
+            sounds.play('eat')
 
         # --- Collisions du Joueur 1 ---
-        if (self.snake1.check_collision_with_obstacles(self.obstacles) or
-            self.snake1.check_collision_with_tail() or
-            self.snake1.check_collision_with_other_snake(self.snake2)):
-            self.game_over_player(1)
+        cause = self.collision_cause(self.snake1, self.snake2)
+        if cause:
+            self.game_over_player(1, cause)
 
         # --- Collisions du Joueur 2 ---
-        if (self.snake2.check_collision_with_obstacles(self.obstacles) or
-            self.snake2.check_collision_with_tail() or
-            self.snake2.check_collision_with_other_snake(self.snake1)):
-            self.game_over_player(2)
+        cause = self.collision_cause(self.snake2, self.snake1)
+        if cause:
+            self.game_over_player(2, cause)
+
+    def collision_cause(self, snake, other_snake):
+        """
+        Cherche ce que le serpent a touché à ce tick.
+
+        Args:
+            snake (Snake): Serpent vérifié.
+            other_snake (Snake): Serpent de l'autre joueur.
 
-    def game_over_player(self, player_num):
+        Returns:
+            str: 'obstacle', 'tail' (sa propre queue), 'snake' (l'autre serpent) ou None.
+        """
+        if snake.check_collision_with_obstacles(self.obstacles):
+            return 'obstacle'
+        if snake.check_collision_with_tail():
+            return 'tail'
+        if snake.check_collision_with_other_snake(other_snake):
+            return 'snake'
+        return None
+
+    def game_over_player(self, player_num, cause):
         """
-        Gère la mort d'un joueur : réinitialise son serpent et son score à zéro,
-        et joue un son de collision.
+        Gère la mort d'un joueur : note la partie dans l'historique, réinitialise son
+        serpent et son score à zéro, et joue un son de collision.
         
         Args:
             player_num (int): 1 pour le joueur 1, 2 pour le joueur 2.
+            cause (str): Ce que le serpent a touché (voir collision_cause).
         """
+        if self.history is not None:
+            snake = self.snake1 if player_num == 1 else self.snake2
+            ticks = self.ticks - self.life_start[player_num]
+            self.history.append(mode='local', level=self.level, theme=None, player_id="",
+                                name=self.player1_name if player_num == 1 else self.player2_name,
+                                score=self.score1 if player_num == 1 else self.score2,
+                                length=len(snake.snake_body), ticks=ticks,
+                                duration_ms=ticks * LEVELS[self.level]['speed'], cause=cause)
+        self.life_start[player_num] = self.ticks
+
         if player_num == 1:
             # Réinitialise le serpent du joueur 1 à sa position de départ
             self.snake1.reset([6, 9])
-            if self.snake1.wall_hit_sound:
-                self.snake1.wall_hit_sound.play()
+            sounds.play('hit')
             self.score1 = 0
             # Affichage dans la console pour le debug
             print(f"{self.player1_name} died! Score reset.")
         else:
             # Réinitialise le serpent du joueur 2
             self.snake2.reset([14, 9])
-            if self.snake2.wall_hit_sound:
-                self.snake2.wall_hit_sound.play()
+            sounds.play('hit')
             self.score2 = 0
             print(f"{self.player2_name} died! Score reset.")
 
@@ -670,7 +695,7 @@ def select_level():
     pygame.display.set_caption("Select Level")
 
     selected = 1  # Niveau par défaut : Easy
-    clock = pygame.time.Clock()
+    view = MenuView()  # Attente des événements (aucun calcul tant que rien ne change)
 
     while True:
         # --- Arrière-plan dégradé vertical ---
@@ -683,7 +708,7 @@ def select_level():
             pygame.draw.line(screen, (r, g, b), (0, y), (800, y))
 
         # --- Titre ---
-        font_large = pygame.font.Font(None, 72)
+        font_large = fonts.get(72)
         title = font_large.render("SELECT LEVEL", True, WHITE)
         title_rect = title.get_rect(center=(400, 80))
         screen.blit(title, title_rect)
@@ -712,20 +737,20 @@ def select_level():
             pygame.draw.rect(screen, border_color, card_rect, 3, border_radius=12)
 
             # --- Numéro du niveau (grand) ---
-            num_font = pygame.font.Font(None, 90)
+            num_font = fonts.get(90)
             num_color = GOLD if level_num == selected else WHITE
             num_text = num_font.render(str(level_num), True, num_color)
             num_rect = num_text.get_rect(center=(x + card_width // 2, y_pos + 60))
             screen.blit(num_text, num_rect)
 
             # --- Nom du niveau ---
-            name_font = pygame.font.Font(None, 42)
+            name_font = fonts.get(42)
             name = name_font.render(LEVELS[level_num]['name'], True, WHITE)
             name_rect = name.get_rect(center=(x + card_width // 2, y_pos + 130))
             screen.blit(name, name_rect)
 
             # --- Statistiques : vitesse et nombre d'obstacles ---
-            stats_font = pygame.font.Font(None, 28)
+            stats_font = fonts.get(28)
             speed_text = f"Speed: {LEVELS[level_num]['speed']}ms"
             obstacles_text = f"Obstacles: {LEVELS[level_num]['obstacles']}"
             speed = stats_font.render(speed_text, True, (200, 200, 200))
@@ -736,7 +761,7 @@ def select_level():
             screen.blit(obstacles, obstacles_rect)
 
         # --- Instructions pour l'utilisateur ---
-        inst_font = pygame.font.Font(None, 32)
+        inst_font = fonts.get(32)
         inst = inst_font.render("Use Arrow Keys | Press ENTER to Confirm", True, WHITE)
         inst_rect = inst.get_rect(center=(400, 520))
         screen.blit(inst, inst_rect)
@@ -744,8 +769,8 @@ def select_level():
         # Rafraîchit l'affichage
         pygame.display.flip()
 
-        # --- Gestion des événements ---
-        for event in pygame.event.get():
+        # --- Gestion des événements (jusqu'à ce que la sélection change) ---
+        for event in view.events(lambda: selected):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -757,8 +782,6 @@ def select_level():
                 elif event.key == pygame.K_RETURN:
                     return selected   # Valide le choix et retourne le niveau
 
-        clock.tick(60)  # Limite à 60 images par seconde
-
 # FONCTION select_colors()
 # Écran de sélection des couleurs pour les deux serpents.
 # Permet à chaque joueur de choisir indépendamment sa couleur.
@@ -778,7 +801,7 @@ def select_colors():
     p2_selected = 1   # Joueur 2 : blue (indice 1)
     active_player = 1 # Joueur actif (1 ou 2)
 
-    clock = pygame.time.Clock()
+    view = MenuView()  # Attente des événements (aucun calcul tant que rien ne change)
 
     while True:
         # --- Arrière-plan dégradé ---
@@ -790,13 +813,13 @@ def select_colors():
             pygame.draw.line(screen, (r, g, b), (0, y), (900, y))
 
         # --- Titre ---
-        font_large = pygame.font.Font(None, 72)
+        font_large = fonts.get(72)
         title = font_large.render("SELECT COLORS", True, WHITE)
         title_rect = title.get_rect(center=(450, 60))
         screen.blit(title, title_rect)
 
         # --- Section Joueur 1 ---
-        font_medium = pygame.font.Font(None, 48)
+        font_medium = fonts.get(48)
         # Le titre du joueur est blanc s'il est actif, gris sinon
         p1_title_color = WHITE if active_player == 1 else (150, 150, 150)
         p1_title = font_medium.render("Player 1", True, p1_title_color)
@@ -820,7 +843,7 @@ def select_colors():
             # Si cette couleur est sélectionnée pour le joueur 1, ajoute une coche blanche
             if i == p1_selected:
                 pygame.draw.rect(screen, WHITE, box_rect, 4, border_radius=10)
-                font_check = pygame.font.Font(None, 60)
+                font_check = fonts.get(60)
                 check = font_check.render("✓", True, WHITE)
                 check_rect = check.get_rect(center=box_rect.center)
                 screen.blit(check, check_rect)
@@ -841,21 +864,21 @@ def select_colors():
 
             if i == p2_selected:
                 pygame.draw.rect(screen, WHITE, box_rect, 4, border_radius=10)
-                font_check = pygame.font.Font(None, 60)
+                font_check = fonts.get(60)
                 check = font_check.render("✓", True, WHITE)
                 check_rect = check.get_rect(center=box_rect.center)
                 screen.blit(check, check_rect)
 
         # --- Instructions ---
-        inst_font = pygame.font.Font(None, 28)
+        inst_font = fonts.get(28)
         inst = inst_font.render("Arrow Keys: Navigate | TAB: Switch Player | ENTER: Confirm", True, WHITE)
         inst_rect = inst.get_rect(center=(450, 650))
         screen.blit(inst, inst_rect)
 
         pygame.display.flip()
 
-        # --- Gestion des événements ---
-        for event in pygame.event.get():
+        # --- Gestion des événements (jusqu'à ce qu'une sélection change) ---
+        for event in view.events(lambda: (p1_selected, p2_selected, active_player)):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -890,28 +913,31 @@ def select_colors():
                     # Valide et retourne les clés des couleurs choisies
                     return color_keys[p1_selected], color_keys[p2_selected]
 
-        clock.tick(60)
-
 
 # FONCTION get_player_names()
 # Écran de saisie des noms des deux joueurs.
 # Affiche deux champs de texte avec curseur clignotant.
 # Navigation : TAB ou clic souris pour changer de champ, ENTER pour valider.
 # Retourne un tuple (nom_joueur1, nom_joueur2).
-def get_player_names():
-    """Écran de saisie des noms des deux joueurs."""
+def get_player_names(player2_default=""):
+    """
+    Écran de saisie des noms des deux joueurs.
+
+    Args:
+        player2_default (str): Nom pré-rempli du joueur 2 (ex: "CPU" quand un bot joue).
+    """
     # Fenêtre de 700x450 pixels
     screen_temp = pygame.display.set_mode((700, 450))
     pygame.display.set_caption("Enter Names")
 
-    font = pygame.font.Font(None, 48)      # Police pour le titre
-    small_font = pygame.font.Font(None, 32) # Police pour les champs de saisie
+    font = fonts.get(48)      # Police pour le titre
+    small_font = fonts.get(32) # Police pour les champs de saisie
 
     player1_name = ""
-    player2_name = ""
+    player2_name = player2_default
     active_field = "player1"   # Champ actuellement sélectionné
 
-    clock = pygame.time.Clock()
+    view = MenuView()  # Attente des événements (aucun calcul tant que rien ne change)
 
     while True:
         # --- Arrière-plan dégradé ---
@@ -955,14 +981,14 @@ def get_player_names():
         screen_temp.blit(p2_text, (115, 320))
 
         # --- Instructions ---
-        instruction_font = pygame.font.Font(None, 26)
+        instruction_font = fonts.get(26)
         start_text = instruction_font.render("Press ENTER to Start | TAB to switch fields", True, (189, 195, 199))
         screen_temp.blit(start_text, (130, 390))
 
         pygame.display.update()
 
-        # --- Gestion des événements ---
-        for event in pygame.event.get():
+        # --- Gestion des événements (jusqu'à ce qu'un champ change) ---
+        for event in view.events(lambda: (player1_name, player2_name, active_field)):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -995,80 +1021,33 @@ def get_player_names():
                     elif active_field == "player2" and len(player2_name) < 15:
                         player2_name += event.unicode
 
-        clock.tick(30)  # 30 FPS pour cette interface
 
+def update_bot(game, bot):
+    """
+    Fait choisir au bot la direction du serpent 2 avant le tick.
+    Cellules bloquées : obstacles + corps des deux serpents.
+    """
+    blocked = {cell(obs.position) for obs in game.obstacles}
+    blocked.update(cell(seg) for seg in game.snake1.snake_body)
+    blocked.update(cell(seg) for seg in game.snake2.snake_body)
+    world = BotWorld(number_of_cells, blocked, [game.food1.position, game.food2.position])
+    direction = bot.choose_direction(game.snake2.snake_body[0], game.snake2.direction,
+                                     len(game.snake2.snake_body), world)
+    game.snake2.direction = Vector2(direction)
 
-# DÉROULEMENT PRINCIPAL DU JEU
 
-# Étape 1 : Saisie des noms des deux joueurs
-player1_name, player2_name = get_player_names()
-
-# Étape 2 : Sélection des couleurs des serpents
-p1_color, p2_color = select_colors()
-
-# Étape 3 : Sélection du niveau de difficulté
-level = select_level()
-
-# Étape 4 : Création de la fenêtre de jeu principale
-# La taille est calculée à partir des paramètres de la grille et des marges
-screen = pygame.display.set_mode((
-    2 * OFFSET + cell_size * number_of_cells,
-    2 * OFFSET + cell_size * number_of_cells
-))
-pygame.display.set_caption(f"Snake Game - Local Multiplayer - {LEVELS[level]['name']}")
-
-# Étape 5 : Initialisation de l'instance du jeu avec tous les paramètres
-game = TwoPlayerGame(player1_name, player2_name, p1_color, p2_color, level)
-
-# Horloge pour limiter le nombre d'images par seconde
-clock = pygame.time.Clock()
-running = True  # Flag de la boucle principale
-
-# --- Configuration de l'événement de mouvement ---
-# Crée un type d'événement personnalisé (pygame.USEREVENT + 1)
-SNAKE_MOVE_EVENT = pygame.USEREVENT + 1
-# Programme un timer qui envoie cet événement toutes les X millisecondes
-# La vitesse est définie par le niveau choisi
-pygame.time.set_timer(SNAKE_MOVE_EVENT, LEVELS[level]['speed'])
-
-# BOUCLE PRINCIPALE
-while running:
-    # --- Gestion des événements ---
-    for event in pygame.event.get():
-        # Événement de mouvement : déclenché par le timer
-        if event.type == SNAKE_MOVE_EVENT:
-            game.update()   # Met à jour la position des serpents et les collisions
-
-        # Événements clavier
-        if event.type == pygame.KEYDOWN:
-            # --- Contrôles Joueur 1 (flèches) ---
-            # Chaque direction est modifiée seulement si le serpent ne va pas déjà dans la direction opposée
-            if event.key == pygame.K_UP and game.snake1.direction != Vector2(0, 1):
-                game.snake1.direction = Vector2(0, -1)   # Haut
-            if event.key == pygame.K_DOWN and game.snake1.direction != Vector2(0, -1):
-                game.snake1.direction = Vector2(0, 1)    # Bas
-            if event.key == pygame.K_LEFT and game.snake1.direction != Vector2(1, 0):
-                game.snake1.direction = Vector2(-1, 0)   # Gauche
-            if event.key == pygame.K_RIGHT and game.snake1.direction != Vector2(-1, 0):
-                game.snake1.direction = Vector2(1, 0)    # Droite
-
-            # --- Contrôles Joueur 2 (WASD) ---
-            if event.key == pygame.K_w and game.snake2.direction != Vector2(0, 1):
-                game.snake2.direction = Vector2(0, -1)   # Haut
-            if event.key == pygame.K_s and game.snake2.direction != Vector2(0, -1):
-                game.snake2.direction = Vector2(0, 1)    # Bas
-            if event.key == pygame.K_a and game.snake2.direction != Vector2(1, 0):
-                game.snake2.direction = Vector2(-1, 0)   # Gauche
-            if event.key == pygame.K_d and game.snake2.direction != Vector2(-1, 0):
-                game.snake2.direction = Vector2(1, 0)    # Droite
-
-        # Fermeture de la fenêtre
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-
-    # --- Rendu graphique ---
+# Couches statiques de l'écran de jeu, dessinées une seule fois par partie.
+background = BackgroundLayer()
+
 
+def paint_background(screen, game):
+    """
+    Dessine les couches fixes pendant une partie : dégradé, bordures, obstacles et titre.
+
+    Args:
+        screen (pygame.Surface): Surface de la couche en cache.
+        game (TwoPlayerGame): Partie en cours.
+    """
     # Arrière-plan dégradé (vert)
     for y in range(2 * OFFSET + cell_size * number_of_cells):
         ratio = y / (2 * OFFSET + cell_size * number_of_cells)
@@ -1091,25 +1070,90 @@ while running:
                       cell_size * number_of_cells + 10),
                      5, border_radius=8)
 
-    # Dessin des éléments du jeu (obstacles, nourritures, serpents)
-    game.draw(screen)
+    # Obstacles (immobiles pendant toute la partie)
+    for obstacle in game.obstacles:
+        obstacle.draw(screen)
 
-    # --- Interface utilisateur ---
     # Titre : niveau de difficulté
-    title_shadow = title_font.render(f"{LEVELS[level]['name'].upper()} MODE", True, BLACK)
-    title_surface = title_font.render(f"{LEVELS[level]['name'].upper()} MODE", True, WHITE)
+    title_shadow = title_font.render(f"{LEVELS[game.level]['name'].upper()} MODE", True, BLACK)
+    title_surface = title_font.render(f"{LEVELS[game.level]['name'].upper()} MODE", True, WHITE)
     screen.blit(title_shadow, (OFFSET - 3, 18))
     screen.blit(title_surface, (OFFSET - 5, 15))
 
+
+# Bande du bas (scores des deux joueurs), redessinée à chaque frame (--dirty-rects).
+UI_RECT = pygame.Rect(0, OFFSET + cell_size * number_of_cells,
+                      2 * OFFSET + cell_size * number_of_cells, OFFSET)
+
+
+def frame_signature(game, alpha=1.0):
+    """
+    Tout ce qu'affiche draw_frame() : même signature, rien à redessiner.
+
+    Args:
+        game (TwoPlayerGame): Partie en cours.
+        alpha (float): Avancement entre les deux derniers ticks (les serpents glissent
+            de quelques pixels à chaque frame).
+    """
+    return (game.score1, game.score2, int(alpha * cell_size),
+            game.snake1.alive, cells_key(game.snake1.snake_body),
+            game.snake2.alive, cells_key(game.snake2.snake_body),
+            cells_key((game.food1.position, game.food2.position)))
+
+
+def mark_dirty(dirty, game):
+    """
+    Déclare les zones que draw_frame() dessine par-dessus l'arrière-plan.
+
+    Args:
+        dirty (DirtyRects): Suivi des zones modifiées de la boucle de jeu.
+        game (TwoPlayerGame): Partie en cours.
+    """
+    for snake in (game.snake1, game.snake2):
+        if snake.alive:
+            # Un segment qui glisse couvre sa case précédente et sa case actuelle
+            dirty.add_cells(snake.prev_body, cell_size, OFFSET)
+            dirty.add_cells(snake.snake_body, cell_size, OFFSET)
+    dirty.add_cells((game.food1.position, game.food2.position), cell_size, OFFSET)
+    dirty.add(UI_RECT)
+
+
+def draw_frame(screen, game, profiler=NULL_PROFILER, dirty=None, alpha=1.0):
+    """
+    Dessine une image complète du jeu (sans mettre à jour l'affichage).
+
+    Args:
+        screen (pygame.Surface): Surface de la fenêtre.
+        game (TwoPlayerGame): Partie en cours.
+        profiler (FrameProfiler): Phases 'background', 'draw' et 'ui'.
+        dirty (DirtyRects, optional): Avec --dirty-rects, seules les zones de la frame
+            précédente sont effacées et celles de la frame courante sont enregistrées.
+        alpha (float): Avancement entre les deux derniers ticks (FixedTimestep.alpha).
+    """
+    # Arrière-plan : un seul blit, redessiné seulement si le niveau ou les obstacles changent
+    key = (game.level, cells_key(obstacle.position for obstacle in game.obstacles))
+    if dirty is None:
+        background.blit(screen, key, lambda surface: paint_background(surface, game))
+    else:
+        dirty.restore(screen, background.get(key, screen.get_size(),
+                                             lambda surface: paint_background(surface, game)))
+        mark_dirty(dirty, game)
+    profiler.lap('background')
+
+    # Dessin des éléments mobiles du jeu (nourritures, serpents)
+    game.draw(screen, alpha)
+    profiler.lap('draw')
+
+    # --- Interface utilisateur ---
     # Score du Joueur 1 (affiché à gauche)
     p1_bg_rect = pygame.Rect(OFFSET - 10, OFFSET + cell_size * number_of_cells + 5, 190, 50)
     pygame.draw.rect(screen, UI_BG, p1_bg_rect, border_radius=8)
-    p1_score_text = f"{player1_name}: {game.score1}"
+    p1_score_text = f"{game.player1_name}: {game.score1}"
     p1_score_surface = score_font.render(p1_score_text, True, game.snake1.head_color)
     screen.blit(p1_score_surface, (OFFSET, OFFSET + cell_size * number_of_cells + 15))
 
     # Score du Joueur 2 (affiché à droite)
-    p2_score_text = f"{player2_name}: {game.score2}"
+    p2_score_text = f"{game.player2_name}: {game.score2}"
     p2_score_surface = score_font.render(p2_score_text, True, game.snake2.head_color)
     p2_width = p2_score_surface.get_width()   # Largeur du texte pour positionner le fond
     p2_bg_rect = pygame.Rect(
@@ -1121,8 +1165,148 @@ while running:
     screen.blit(p2_score_surface,
                 (OFFSET + cell_size * number_of_cells - p2_width,
                  OFFSET + cell_size * number_of_cells + 15))
+    profiler.lap('ui')
+
 
-    # Mise à jour de l'affichage
-    pygame.display.update()
-    # Limite le taux de rafraîchissement à 60 images par seconde
-    clock.tick(60)
\ No newline at end of file
+# DÉROULEMENT PRINCIPAL DU JEU
+def main():
+    """
+    Point d'entrée : options, menus de sélection puis boucle principale.
+    """
+    # Options de la ligne de commande
+    parser = argparse.ArgumentParser(description="Snake - multijoueur local (2 joueurs)")
+    parser.add_argument('--bot', action='store_true',
+                        help="Le joueur 2 est contrôlé par l'ordinateur")
+    add_profile_arguments(parser)
+    add_hud_argument(parser)
+    add_dirty_argument(parser)
+    add_display_arguments(parser)
+    add_threaded_argument(parser)
+    add_history_argument(parser)
+    args = parser.parse_args()
+    # L'overlay (F3) reçoit les mesures de chaque phase et les transmet au profileur
+    profiler = PerfOverlay(create_profiler(args, "snake_2players_local"), visible=args.hud)
+    # Suivi des zones modifiées (None sans --dirty-rects : rendu complet)
+    dirty = create_dirty_rects(args)
+
+    # Étape 1 : Saisie des noms des deux joueurs
+    player1_name, player2_name = get_player_names("CPU" if args.bot else "")
+
+    # Étape 2 : Sélection des couleurs des serpents
+    p1_color, p2_color = select_colors()
+
+    # Étape 3 : Sélection du niveau de difficulté
+    level = select_level()
+
+    # Étape 4 : Création de la fenêtre de jeu principale
+    # La taille logique est calculée à partir des paramètres de la grille et des marges ;
+    # avec --pixel-scale ou --scaled, l'image est agrandie en une seule passe
+    display = create_framebuffer(args, (
+        2 * OFFSET + cell_size * number_of_cells,
+        2 * OFFSET + cell_size * number_of_cells
+    ))
+    screen = display.surface
+    pygame.display.set_caption(f"Snake Game - Local Multiplayer - {LEVELS[level]['name']}")
+
+    # Étape 5 : Initialisation de l'instance du jeu avec tous les paramètres
+    game = TwoPlayerGame(player1_name, player2_name, p1_color, p2_color, level)
+    # Historique des parties (None avec --no-history)
+    game.history = create_history(args)
+
+    # Horloge pour limiter le nombre d'images par seconde
+    clock = pygame.time.Clock()
+    running = True  # Flag de la boucle principale
+
+    elapsed = 0   # Durée de la frame précédente (ms)
+
+    # Bot du joueur 2 (None si deux humains jouent)
+    bot = PathfindingBot() if args.bot else None
+
+    # Les phases d'un tick ne sont mesurées que si les ticks tournent dans la boucle principale
+    tick_profiler = NULL_PROFILER if args.threaded else profiler
+
+    def tick():
+        """Un tick de simulation : le bot décide, puis les serpents avancent."""
+        if bot is not None:
+            update_bot(game, bot)   # Le bot décide avant le déplacement
+            tick_profiler.lap('bot')
+        game.update()   # Met à jour la position des serpents et les collisions
+        tick_profiler.lap('update')
+
+    # --- Simulation à pas de temps fixe ---
+    # Les serpents avancent d'une case toutes les X millisecondes (vitesse du niveau),
+    # même si une frame prend du retard : les ticks manqués sont rattrapés.
+    # Avec --threaded, les ticks tournent sur leur propre thread et le dessin utilise
+    # la dernière copie figée de la partie.
+    simulation = create_simulation(args, LEVELS[level]['speed'], tick, game,
+                                   ('snake1', 'snake2', 'food1', 'food2'))
+
+    # BOUCLE PRINCIPALE
+    while running:
+        profiler.begin_frame()
+        # --- Gestion des événements (entre deux ticks de la simulation) ---
+        with simulation.lock:
+            for event in pygame.event.get():
+                # F3 : affiche/masque l'overlay de performances
+                if profiler.handle_event(event):
+                    continue
+                # Fenêtre réaffichée : la prochaine frame sera complète
+                if dirty is not None:
+                    dirty.handle_event(event)
+
+                # Événements clavier
+                if event.type == pygame.KEYDOWN:
+                    # --- Contrôles Joueur 1 (flèches) ---
+                    # Chaque direction est modifiée seulement si le serpent ne va pas déjà dans la direction opposée
+                    if event.key == pygame.K_UP and game.snake1.direction != Vector2(0, 1):
+                        game.snake1.direction = Vector2(0, -1)   # Haut
+                    if event.key == pygame.K_DOWN and game.snake1.direction != Vector2(0, -1):
+                        game.snake1.direction = Vector2(0, 1)    # Bas
+                    if event.key == pygame.K_LEFT and game.snake1.direction != Vector2(1, 0):
+                        game.snake1.direction = Vector2(-1, 0)   # Gauche
+                    if event.key == pygame.K_RIGHT and game.snake1.direction != Vector2(-1, 0):
+                        game.snake1.direction = Vector2(1, 0)    # Droite
+
+                    # --- Contrôles Joueur 2 (WASD), ignorés si le bot joue ---
+                    if bot is None:
+                        if event.key == pygame.K_w and game.snake2.direction != Vector2(0, 1):
+                            game.snake2.direction = Vector2(0, -1)   # Haut
+                        if event.key == pygame.K_s and game.snake2.direction != Vector2(0, -1):
+                            game.snake2.direction = Vector2(0, 1)    # Bas
+                        if event.key == pygame.K_a and game.snake2.direction != Vector2(1, 0):
+                            game.snake2.direction = Vector2(-1, 0)   # Gauche
+                        if event.key == pygame.K_d and game.snake2.direction != Vector2(-1, 0):
+                            game.snake2.direction = Vector2(1, 0)    # Droite
+
+                # Fermeture de la fenêtre
+                if event.type == pygame.QUIT:
+                    simulation.stop()
+                    if game.history is not None:
+                        game.history.close()   # Parties en attente écrites (avec fsync)
+                    pygame.quit()
+                    sys.exit()
+
+        profiler.lap('events')
+
+        # --- Ticks de la simulation ---
+        # frame : partie à dessiner (avec --threaded, dernière copie publiée)
+        frame, alpha = simulation.frame(elapsed)
+
+        # --- Rendu graphique ---
+        if dirty is None:
+            draw_frame(screen, frame, profiler, alpha=alpha)
+            # Agrandissement, overlay et mise à jour de l'affichage
+            display.show(profiler)
+        # Zones modifiées : la frame est sautée si rien n'a bougé d'un pixel
+        elif dirty.changed((profiler.visible, frame_signature(frame, alpha))) or profiler.visible:
+            draw_frame(screen, frame, profiler, dirty, alpha)
+            display.show(profiler, dirty)
+        profiler.lap('display')
+        # Limite le taux de rafraîchissement à 60 images par seconde
+        elapsed = clock.tick(60)
+        profiler.lap('wait')
+        profiler.end_frame()
+
+
+if __name__ == "__main__":
+    main()
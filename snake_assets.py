@@ -0,0 +1,193 @@
+# Ce fichier implémente le gestionnaire d'images partagé par tous les modes de jeu.
+# - Chaque fichier image est chargé UNE seule fois depuis le disque
+# - Les images sont converties au format de l'affichage (convert_alpha)
+#   pour que les blits n'aient plus de conversion de pixels à faire
+# - Les variantes redimensionnées sont mises en cache par taille de cellule
+# - Les images de secours procédurales (briques, cercles de nourriture)
+#   sont dessinées une fois puis réutilisées à chaque frame
+
+import pygame
+
+# Couleurs du motif de briques (identiques dans tous les modes)
+BRICK_RED = (192, 57, 43)
+BRICK_DARK = (169, 50, 38)
+BRICK_LIGHT = (205, 97, 85)
+
+
+class AssetManager:
+    """
+    Cache d'images partagé.
+    Les surfaces renvoyées sont partagées entre toutes les instances :
+    elles ne doivent jamais être modifiées par l'appelant.
+    """
+
+    def __init__(self):
+        # chemin -> (Surface d'origine ou None si introuvable, convertie ?)
+        self._images = {}
+        # (chemin, (largeur, hauteur)) -> Surface redimensionnée
+        self._scaled = {}
+        # clé libre -> Surface procédurale
+        self._generated = {}
+        # Surfaces créées par le jeu (overlay F3) : celles du cache et celles passées à track()
+        self.created = 0
+
+    def track(self, surface, count=1):
+        """
+        Compte une Surface créée hors du cache (couches statiques, sprites, voiles...)
+        Args:
+            surface: Surface créée
+            count: Nombre de Surfaces allouées pour l'obtenir (ex. Surface() puis convert())
+        Returns:
+            surface, pour l'écrire sur la ligne de création
+        """
+        self.created += count
+        return surface
+
+    def _convert(self, surface):
+        """
+        Convertit une surface au format de l'affichage si une fenêtre existe.
+        Avant pygame.display.set_mode(), la conversion est impossible :
+        la surface est alors renvoyée telle quelle et sera convertie plus tard.
+        Returns:
+            tuple: (surface, True si convertie)
+        """
+        if pygame.display.get_surface() is None:
+            return surface, False
+        self.created += 1
+        return surface.convert_alpha(), True
+
+    def image(self, path):
+        """
+        Charge une image depuis le disque (une seule fois).
+        Args:
+            path: Chemin du fichier image
+        Returns:
+            pygame.Surface ou None si le fichier est introuvable/illisible
+        """
+        entry = self._images.get(path)
+        if entry is None:
+            try:
+                surface = pygame.image.load(path)
+                self.created += 1
+            except (pygame.error, FileNotFoundError):
+                surface = None
+            converted = False
+            if surface is not None:
+                surface, converted = self._convert(surface)
+            self._images[path] = (surface, converted)
+            return surface
+
+        surface, converted = entry
+        if surface is not None and not converted:
+            # Chargée avant la création de la fenêtre : on convertit maintenant
+            # et on oublie les variantes redimensionnées non converties
+            surface, converted = self._convert(surface)
+            if converted:
+                self._images[path] = (surface, True)
+                for key in [k for k in self._scaled if k[0] == path]:
+                    del self._scaled[key]
+        return surface
+
+    def scaled(self, path, size):
+        """
+        Renvoie l'image redimensionnée à la taille demandée (mise en cache).
+        Args:
+            path: Chemin du fichier image
+            size: Taille (largeur, hauteur) en pixels, ou un entier pour un carré
+        Returns:
+            pygame.Surface ou None si l'image est introuvable
+        """
+        if isinstance(size, int):
+            size = (size, size)
+        # image() est une simple lecture de dictionnaire une fois l'image convertie,
+        # mais elle purge les variantes obsolètes créées avant l'ouverture de la fenêtre
+        original = self.image(path)
+        if original is None:
+            return None
+        key = (path, size)
+        surface = self._scaled.get(key)
+        if surface is None:
+            surface = pygame.transform.scale(original, size)
+            self.created += 1
+            self._scaled[key] = surface
+        return surface
+
+    def generated(self, key, size, painter):
+        """
+        Renvoie une surface procédurale, dessinée une seule fois.
+        Args:
+            key: Clé unique décrivant le contenu (doit inclure tous les paramètres)
+            size: Taille (largeur, hauteur) de la surface
+            painter: Fonction painter(surface) qui dessine le contenu
+        Returns:
+            pygame.Surface avec canal alpha
+        """
+        full_key = (key, size)
+        entry = self._generated.get(full_key)
+        if entry is not None and entry[1]:
+            return entry[0]
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.created += 1
+        painter(surface)
+        surface, converted = self._convert(surface)
+        self._generated[full_key] = (surface, converted)
+        return surface
+
+    def brick(self, cell_size):
+        """
+        Motif de briques de secours (utilisé quand barier.png est absent).
+        Args:
+            cell_size: Taille d'une cellule en pixels
+        """
+        def paint(surface):
+            rect = pygame.Rect(0, 0, cell_size, cell_size)
+            pygame.draw.rect(surface, BRICK_RED, rect, border_radius=4)
+            brick_height = cell_size // 3
+            brick_width = cell_size // 2
+            pygame.draw.rect(surface, BRICK_DARK, (0, 0, brick_width - 1, brick_height - 1))
+            pygame.draw.rect(surface, BRICK_DARK, (brick_width, 0, brick_width - 1, brick_height - 1))
+            pygame.draw.rect(surface, BRICK_LIGHT, (0, brick_height, cell_size, brick_height - 1))
+            pygame.draw.rect(surface, BRICK_DARK, (0, 2 * brick_height, brick_width - 1, brick_height))
+            pygame.draw.rect(surface, BRICK_DARK, (brick_width, 2 * brick_height, brick_width - 1, brick_height))
+            pygame.draw.rect(surface, BRICK_DARK, rect, 2, border_radius=4)
+
+        return self.generated('brick', (cell_size, cell_size), paint)
+
+    def obstacle(self, cell_size):
+        """
+        Obstacle : image barier.png si disponible, sinon le motif de briques.
+        """
+        return self.scaled('barier.png', cell_size) or self.brick(cell_size)
+
+    def circle(self, color, cell_size, shine=None):
+        """
+        Cercle de nourriture de secours remplissant la cellule.
+        Args:
+            color: Couleur du cercle
+            cell_size: Taille d'une cellule en pixels
+            shine: Couleur optionnelle d'un petit reflet en haut à gauche
+        """
+        def paint(surface):
+            center = (cell_size // 2, cell_size // 2)
+            pygame.draw.circle(surface, color, center, cell_size // 2)
+            if shine is not None:
+                pygame.draw.circle(surface, shine, (center[0] - 3, center[1] - 3), 3)
+
+        return self.generated(('circle', tuple(color), shine and tuple(shine)),
+                              (cell_size, cell_size), paint)
+
+    def food(self, image_path, color, cell_size):
+        """
+        Image de nourriture redimensionnée, ou un cercle coloré si l'image manque.
+        """
+        return self.scaled(image_path, cell_size) or self.circle(color, cell_size)
+
+    def clear(self):
+        """Vide tous les caches (par exemple après un changement de format d'affichage)."""
+        self._images.clear()
+        self._scaled.clear()
+        self._generated.clear()
+
+
+# Instance unique partagée par tous les modes
+assets = AssetManager()
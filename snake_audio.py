@@ -0,0 +1,119 @@
+# Ce fichier implémente la banque de sons partagée par tous les modes de jeu.
+# Avant, chaque Snake chargeait snake_eat.wav et snake_collision.wav (deux fois en mode
+# deux joueurs) et le mixer gardait son tampon par défaut : le son arrivait en retard.
+# Maintenant :
+# - le mixer est préconfiguré avec un petit tampon (pygame.mixer.pre_init) dès l'import
+#   de ce module, c'est-à-dire AVANT le pygame.init() des modes de jeu
+# - chaque son est décodé UNE seule fois, au démarrage (sounds.load())
+# - les sons sont joués sur des canaux réservés créés une fois : plusieurs sons qui se
+#   chevauchent (deux joueurs qui mangent en même temps) ne cherchent ni ne créent de canal ;
+#   si tous sont occupés, le plus ancien est coupé
+# - sans carte son (mixer absent, SDL_AUDIODRIVER=dummy, benchmarks) la banque est muette :
+#   sounds.play() ne fait rien
+# Comme assets et fonts, `sounds` est une instance partagée par tout le programme.
+
+import os
+
+import pygame
+
+# Format du mixer : 44,1 kHz, 16 bits signés, stéréo
+FREQUENCY = 44100
+SIZE = -16
+STEREO = 2
+# Tampon du mixer en échantillons : 256 / 44100 = 6 ms de latence (512 par défaut)
+BUFFER = 256
+# Canaux réservés aux effets sonores (sons simultanés au maximum)
+CHANNELS = 4
+# Nom -> fichier des sons du jeu
+CLIPS = {
+    'eat': "snake_eat.wav",  # Nourriture mangée
+    'hit': "snake_collision.wav",  # Collision (mur, obstacle, queue, autre serpent)
+}
+
+# Doit précéder pygame.init() (sans effet si le mixer est déjà initialisé)
+pygame.mixer.pre_init(FREQUENCY, SIZE, STEREO, BUFFER)
+
+
+class SoundBank:
+    """
+    Sons décodés une fois et joués sur des canaux réservés
+    Utilisation :
+        sounds.load()        # au démarrage, après pygame.init()
+        sounds.play('eat')
+    """
+
+    def __init__(self, clips=CLIPS, channels=CHANNELS):
+        """
+        Args:
+            clips: Dictionnaire nom -> fichier son
+            channels: Nombre de canaux réservés
+        """
+        self.clips = dict(clips)
+        self.reserved = channels
+        self.enabled = True
+        self._sounds = None  # nom -> pygame.mixer.Sound (None : pas encore chargés)
+        self._channels = []  # Canaux réservés, utilisés à tour de rôle
+        self._next = 0  # Prochain canal essayé
+        self.plays = 0  # Sons joués (statistique)
+        self.stolen = 0  # Sons coupés faute de canal libre (statistique)
+
+    @property
+    def muted(self):
+        """True si aucun son ne peut être joué (banque muette)"""
+        return not self._sounds
+
+    def load(self):
+        """
+        Décode tous les sons (une seule fois, les appels suivants ne font rien)
+        Returns:
+            SoundBank: self
+        """
+        if self._sounds is not None:
+            return self
+        self._sounds = {}
+        if (not self.enabled or pygame.mixer.get_init() is None
+                or os.environ.get("SDL_AUDIODRIVER") == "dummy"):
+            return self
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), self.reserved))
+        pygame.mixer.set_reserved(self.reserved)
+        self._channels = [pygame.mixer.Channel(i) for i in range(self.reserved)]
+        for name, path in self.clips.items():
+            try:
+                self._sounds[name] = pygame.mixer.Sound(path)
+            except (pygame.error, FileNotFoundError):
+                print(f"⚠️ Sound file not found: {path}")
+        return self
+
+    def disable(self):
+        """Banque muette (serveurs sans carte son, benchmarks)"""
+        self.enabled = False
+        self._sounds = {}
+        self._channels = []
+
+    def play(self, name):
+        """Joue un son de la banque (rien si la banque est muette ou le son absent)"""
+        if self._sounds is None:
+            self.load()
+        sound = self._sounds.get(name)
+        if sound is None:
+            return
+        self._channel().play(sound)
+        self.plays += 1
+
+    def _channel(self):
+        """Premier canal réservé libre à partir du suivant ; s'ils sont tous occupés, le plus ancien"""
+        count = len(self._channels)
+        for k in range(count):
+            index = (self._next + k) % count
+            if not self._channels[index].get_busy():
+                break
+        else:
+            # Tour complet : le canal suivant est celui du son lancé il y a le plus longtemps
+            index = self._next
+            self.stolen += 1
+        self._next = (index + 1) % count
+        return self._channels[index]
+
+
+# Banque partagée par tous les modes
+sounds = SoundBank()
@@ -0,0 +1,57 @@
+# Ce fichier implémente le cache des couches statiques de l'écran de jeu.
+# Pendant une partie, le dégradé de fond (550 lignes), les bordures du terrain,
+# les obstacles et le titre ne changent jamais : ils sont dessinés UNE fois
+# dans une Surface, puis copiés en un seul blit au début de chaque frame.
+# La Surface n'est redessinée que si sa clé change (thème, taille du plateau,
+# obstacles, titre...).
+
+import pygame
+
+from snake_assets import assets  # Compteur de Surfaces (overlay F3)
+
+
+class BackgroundLayer:
+    """
+    Couche statique mise en cache
+    Chaque mode de jeu en possède une et fournit :
+    - une clé décrivant TOUT ce qui est dessiné (la couche est refaite si elle change)
+    - une fonction painter(surface) qui dessine les couches statiques
+    """
+
+    def __init__(self):
+        self.key = None
+        self.surface = None
+        self.rebuilds = 0  # Nombre de fois où la couche a été redessinée (statistique)
+
+    def get(self, key, size, painter):
+        """
+        Renvoie la couche statique, redessinée seulement si la clé ou la taille a changé
+        Args:
+            key: Valeur comparable décrivant le contenu (tuple de thème, obstacles, titre...)
+            size: Taille (largeur, hauteur) de l'écran
+            painter: Fonction painter(surface) qui dessine les couches statiques
+        """
+        if self.surface is None or key != self.key or self.surface.get_size() != size:
+            surface = assets.track(pygame.Surface(size))
+            # Même format de pixels que la fenêtre : le blit devient une simple copie
+            if pygame.display.get_surface() is not None:
+                surface = assets.track(surface.convert())
+            painter(surface)
+            self.surface = surface
+            self.key = key
+            self.rebuilds += 1
+        return self.surface
+
+    def blit(self, screen, key, painter):
+        """Copie la couche statique sur tout l'écran (un seul blit)"""
+        screen.blit(self.get(key, screen.get_size(), painter), (0, 0))
+
+    def invalidate(self):
+        """Force le prochain appel à redessiner la couche"""
+        self.key = None
+        self.surface = None
+
+
+def cells_key(positions):
+    """Clé comparable pour une liste de cases (Vector2, listes ou tuples) : obstacles, corps..."""
+    return tuple((int(p[0]), int(p[1])) for p in positions)
@@ -0,0 +1,418 @@
+# Ce fichier implémente la suite de benchmarks de tous les modes de jeu.
+# - Fonctionne sans fenêtre (SDL_VIDEODRIVER=dummy) : utilisable en SSH ou en CI
+# - Micro-benchmarks : Snake.update, Food.generate_random_pos, pool de particules,
+#   Game.draw et une image complète (draw_frame) pour chaque mode,
+#   et Game.draw du mode premium à chaque niveau de qualité (snake_quality)
+# - Macro-benchmarks : parties scriptées de 10 000 ticks par mode, le serpent étant piloté
+#   par un bot (snake_bot) avec une graine fixe pour que deux exécutions soient comparables
+# - Les résultats (microsecondes, plus petit = meilleur) sont écrits en JSON et comparés
+#   à l'exécution précédente pour faire apparaître les régressions
+#
+# Utilisation :
+#   python snake_benchmark.py                      # tout, compare à benchmark_results.json
+#   python snake_benchmark.py --micro --modes premium
+#   python snake_benchmark.py --baseline ref.json  # compare à une référence figée
+
+import os
+
+# Pilotes factices AVANT l'import de pygame (les modules de jeu appellent pygame.init())
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse  # Options de la ligne de commande
+import json  # Fichiers de résultats
+import platform  # Informations sur la machine (en-tête des résultats)
+import random  # Graine fixe pour des parties reproductibles
+import statistics  # Médiane / percentiles des macro-benchmarks
+import sys
+import tempfile  # Base de scores jetable (les parties ne touchent pas scores.db)
+import threading  # Verrou de l'état réseau (comme NetworkClient)
+import time  # Chronomètre haute résolution
+from collections import deque  # Instants de réception des états (comme NetworkClient)
+
+import pygame
+from pygame.math import Vector2
+
+import snake_game
+import snake_server
+import snake_2players_local
+import snake_client
+import snake_particles
+import snake_quality
+import hamachi_server
+from snake_bot import PathfindingBot, BotWorld, cell
+from snake_audio import sounds
+
+# Fichier de résultats par défaut (la dernière exécution sert de référence à la suivante)
+RESULTS_FILE = "benchmark_results.json"
+# Écart (en %) au-delà duquel une mesure est signalée comme régression
+DEFAULT_THRESHOLD = 10.0
+MODES = ('solo', 'premium', 'local', 'network')
+WINDOW_SIZE = 2 * snake_game.OFFSET + snake_game.cell_size * snake_game.number_of_cells
+# Records des parties mesurées (threads d'écriture arrêtés avant la suppression de la base)
+player_managers = []
+
+
+# ============================================================================
+# MESURE
+# ============================================================================
+
+def measure(func, number, repeat=5, setup=None):
+    """
+    Temps d'un appel de func en microsecondes (meilleur de repeat séries de number appels)
+    Le minimum est la mesure la moins perturbée par le reste du système.
+    Args:
+        func: Fonction sans argument à mesurer
+        number: Nombre d'appels par série
+        repeat: Nombre de séries
+        setup: Fonction appelée (hors chronomètre) avant chaque série
+    """
+    best = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        elapsed = (time.perf_counter_ns() - start) / number / 1000.0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def percentile(values, fraction):
+    """Percentile simple (valeurs triées, sans interpolation)"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+# ============================================================================
+# CRÉATION DES PARTIES (sans menus)
+# ============================================================================
+
+def make_game(mode, scores_dir):
+    """
+    Crée une partie du mode demandé, comme après les menus de sélection
+    Returns:
+        tuple: (partie, fonction draw_frame(screen, partie) du module)
+    """
+    if mode == 'solo':
+        # Les game over écrivent les scores : base temporaire
+        game = snake_game.Game("bench", "Bench", os.path.join(scores_dir, "scores.db"))
+        player_managers.append(game.player_manager)
+        return game, snake_game.draw_frame
+    if mode == 'premium':
+        return snake_server.Game("Bench", 3, 'neon'), snake_server.draw_frame
+    if mode == 'local':
+        game = snake_2players_local.TwoPlayerGame("P1", "P2", 'green', 'blue', 3)
+        return game, snake_2players_local.draw_frame
+    raise ValueError(mode)
+
+
+def long_snake(snake, length):
+    """Allonge un serpent à length segments (serpentin sur la grille)"""
+    size = snake_game.number_of_cells
+    snake.snake_body = [Vector2(i % size, (i // size) % size) for i in range(length)]
+    snake.snake_body.reverse()
+
+
+class OfflineNetwork:
+    """
+    Remplace NetworkClient pour le benchmark du client :
+    l'état est fourni directement par un serveur local (HamachiSnakeServer.tick()),
+    sérialisé puis désérialisé en JSON comme s'il venait du réseau
+    """
+
+    def __init__(self, client_id):
+        self.host = "offline"
+        self.port = 0
+        self.client_id = client_id
+        self.connected = True
+        self.game_state = {'players': {}, 'food1': None, 'food2': None, 'obstacles': []}
+        self.lock = threading.Lock()
+        self.state_times = deque(maxlen=64)
+        self.sent = 0
+
+    def send(self, data):
+        self.sent += 1
+
+    def feed(self, server):
+        """Reçoit l'état courant du serveur (aller-retour JSON inclus)"""
+        message = json.dumps({'type': 'state', 'game_state': server.prepare_game_state()})
+        data = json.loads(message)
+        with self.lock:
+            self.game_state = data['game_state']
+        self.state_times.append(time.perf_counter())
+
+
+# ============================================================================
+# MICRO-BENCHMARKS
+# ============================================================================
+
+def micro_benchmarks(modes, screen, scores_dir):
+    """
+    Returns:
+        dict: {nom de la mesure: microsecondes par appel}
+    """
+    results = {}
+    for mode in modes:
+        if mode == 'network':
+            results.update(micro_network())
+            continue
+        random.seed(1)
+        game, draw_frame = make_game(mode, scores_dir)
+        prefix = f"micro/{mode}"
+        snake = game.snake1 if mode == 'local' else game.snake
+        food = game.food1
+
+        def update_snake():
+            snake.update()
+
+        results[f"{prefix}/Snake.update"] = measure(update_snake, 2000)
+        long_snake(snake, 200)
+        results[f"{prefix}/Snake.update[200]"] = measure(update_snake, 2000)
+
+        if mode == 'local':
+            results[f"{prefix}/Food.generate_random_pos"] = measure(food.generate_random_pos, 2000)
+        else:
+            body = snake.snake_body
+            results[f"{prefix}/Food.generate_random_pos"] = measure(
+                lambda: food.generate_random_pos(body), 2000)
+
+        # Dessin avec un serpent de 200 segments (pire cas réaliste)
+        results[f"{prefix}/Game.draw[200]"] = measure(lambda: game.draw(screen), 50)
+        results[f"{prefix}/draw_frame[200]"] = measure(lambda: draw_frame(screen, game), 30)
+
+        if mode == 'premium':
+            for tier in snake_quality.QUALITY_TIERS:
+                game.quality = tier
+                results[f"{prefix}/Game.draw[200,{tier['name']}]"] = measure(lambda: game.draw(screen), 50)
+            game.quality = snake_quality.QUALITY_TIERS[0]
+            results.update(micro_particles())
+    return results
+
+
+def micro_particles():
+    """
+    Pool de particules : 150 particules (10 gerbes) et 6000 particules (400 gerbes),
+    mise à jour sur toute leur durée de vie (30 frames) et dessin groupé
+    """
+    results = {}
+    screen = pygame.display.get_surface()
+    for bursts in (10, 400):
+        pool = snake_particles.create_particle_pool(seed=2)
+        count = bursts * snake_particles.BURST
+
+        def setup():
+            while len(pool):
+                pool.update()
+            for i in range(bursts):
+                pool.emit(100 + i % 300, 200, snake_server.RED if i % 2 else snake_server.ORANGE)
+
+        def update_all():
+            pool.update()
+
+        results[f"micro/premium/ParticlePool.update[{count}]"] = measure(update_all, 30, repeat=20, setup=setup)
+        setup()
+        results[f"micro/premium/ParticlePool.draw[{count}]"] = measure(lambda: pool.draw(screen), 30)
+    return results
+
+
+def micro_network():
+    """Client réseau : réception d'un état (JSON) et rendu d'une image"""
+    random.seed(1)
+    server = hamachi_server.HamachiSnakeServer(min_players=4)
+    server.fill_bot_slots()
+    for _ in range(50):
+        server.tick()
+    network = OfflineNetwork(next(iter(server.clients)))
+    client = snake_client.MultiplayerGame(network, "Bench")
+    network.feed(server)
+    return {
+        "micro/network/server.tick[4 bots]": measure(server.tick, 500),
+        "micro/network/state_roundtrip": measure(lambda: network.feed(server), 2000),
+        "micro/network/client.draw": measure(client.draw, 30),
+    }
+
+
+# ============================================================================
+# MACRO-BENCHMARKS (parties scriptées)
+# ============================================================================
+
+def steer(bot, snake, obstacles, others, foods):
+    """Le bot choisit la direction du serpent pour ce tick"""
+    blocked = {cell(position) for position in obstacles}
+    for body in others:
+        blocked.update(cell(segment) for segment in body)
+    world = BotWorld(snake_game.number_of_cells, blocked, foods)
+    direction = bot.choose_direction(snake.snake_body[0], snake.direction,
+                                     len(snake.snake_body), world)
+    snake.direction = Vector2(direction)
+
+
+def macro_session(mode, ticks, screen, scores_dir):
+    """
+    Joue une partie scriptée de ticks ticks : bot -> update -> image complète
+    Après un game over, la partie repart immédiatement (comme un joueur qui appuie sur une touche)
+    Returns:
+        dict: Mesures de la session
+    """
+    random.seed(3)
+    if mode == 'network':
+        return macro_network(ticks, screen)
+    game, draw_frame = make_game(mode, scores_dir)
+    snakes = [game.snake1, game.snake2] if mode == 'local' else [game.snake]
+    bots = [PathfindingBot() for _ in snakes]
+    obstacles = [obstacle.position for obstacle in game.obstacles]
+    update_times, draw_times = [], []
+    for _ in range(ticks):
+        start = time.perf_counter_ns()
+        foods = [game.food1.position, game.food2.position]
+        for bot, snake in zip(bots, snakes):
+            steer(bot, snake, obstacles, [s.snake_body for s in snakes], foods)
+        game.update()
+        if hasattr(game, 'animate'):
+            game.animate(1 / 60)
+        if getattr(game, 'state', "RUNNING") == "STOPPED":
+            game.state = "RUNNING"
+        middle = time.perf_counter_ns()
+        draw_frame(screen, game)
+        pygame.display.update()
+        end = time.perf_counter_ns()
+        update_times.append((middle - start) / 1000.0)
+        draw_times.append((end - middle) / 1000.0)
+    return summarize(f"macro/{mode}", update_times, draw_times)
+
+
+def macro_network(ticks, screen):
+    """Serveur (4 bots) + client hors ligne : tick serveur, réception, rendu client"""
+    server = hamachi_server.HamachiSnakeServer(min_players=4)
+    server.fill_bot_slots()
+    network = OfflineNetwork(next(iter(server.clients)))
+    client = snake_client.MultiplayerGame(network, "Bench")
+    update_times, draw_times = [], []
+    for _ in range(ticks):
+        start = time.perf_counter_ns()
+        server.tick()
+        network.feed(server)
+        middle = time.perf_counter_ns()
+        client.draw()
+        end = time.perf_counter_ns()
+        update_times.append((middle - start) / 1000.0)
+        draw_times.append((end - middle) / 1000.0)
+    return summarize("macro/network", update_times, draw_times)
+
+
+def summarize(prefix, update_times, draw_times):
+    """Moyennes et percentiles d'une session (microsecondes)"""
+    frames = [u + d for u, d in zip(update_times, draw_times)]
+    return {
+        f"{prefix}/update_mean": statistics.fmean(update_times),
+        f"{prefix}/draw_mean": statistics.fmean(draw_times),
+        f"{prefix}/frame_p50": percentile(frames, 0.50),
+        f"{prefix}/frame_p99": percentile(frames, 0.99),
+    }
+
+
+# ============================================================================
+# RÉSULTATS ET COMPARAISON
+# ============================================================================
+
+def load_results(path):
+    """Charge un fichier de résultats (None s'il n'existe pas)"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def compare(current, previous, threshold):
+    """
+    Affiche chaque mesure avec son écart par rapport à la référence
+    Returns:
+        list: Noms des mesures en régression (plus lentes de plus de threshold %)
+    """
+    regressions = []
+    reference = previous['results'] if previous else {}
+    width = max(len(name) for name in current)
+    print(f"\n{'mesure':<{width}} {'µs':>12} {'réf. µs':>12} {'écart':>9}")
+    for name, value in current.items():
+        old = reference.get(name)
+        if old is None or old == 0:
+            print(f"{name:<{width}} {value:>12.1f} {'-':>12} {'':>9}")
+            continue
+        change = (value - old) / old * 100.0
+        flag = ""
+        if change > threshold:
+            flag = "  << RÉGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  (amélioration)"
+        print(f"{name:<{width}} {value:>12.1f} {old:>12.1f} {change:>+8.1f}%{flag}")
+    if previous:
+        print(f"\nRéférence : {previous['meta'].get('date', '?')}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks sans fenêtre de tous les modes de Snake")
+    parser.add_argument('--micro', action='store_true', help="Seulement les micro-benchmarks")
+    parser.add_argument('--macro', action='store_true', help="Seulement les parties scriptées")
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--ticks', type=int, default=10000, help="Ticks par partie scriptée (10000)")
+    parser.add_argument('--output', default=RESULTS_FILE,
+                        help=f"Fichier de résultats, comparé puis remplacé ({RESULTS_FILE})")
+    parser.add_argument('--baseline',
+                        help="Référence figée à comparer (au lieu de la dernière exécution)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Écart en %% signalé comme régression (10 par défaut)")
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="Code de sortie 1 si une régression est détectée")
+    args = parser.parse_args()
+    run_micro = args.micro or not args.macro
+    run_macro = args.macro or not args.micro
+
+    pygame.init()
+    sounds.disable()  # Banque muette : les parties mesurées ne jouent aucun son
+    screen = pygame.display.set_mode((WINDOW_SIZE, WINDOW_SIZE))
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="snake_bench_") as scores_dir:
+        try:
+            if run_micro:
+                print("Micro-benchmarks...")
+                results.update(micro_benchmarks(args.modes, screen, scores_dir))
+            if run_macro:
+                for mode in args.modes:
+                    print(f"Partie scriptée '{mode}' ({args.ticks} ticks)...")
+                    results.update(macro_session(mode, args.ticks, screen, scores_dir))
+        finally:
+            while player_managers:
+                player_managers.pop().close()
+
+    previous = load_results(args.baseline or args.output)
+    regressions = compare(results, previous, args.threshold)
+
+    # Une exécution partielle (--micro, --modes ...) ne fait pas disparaître les autres mesures
+    last = load_results(args.output)
+    merged = dict(last['results']) if last else {}
+    merged.update(results)
+    with open(args.output, 'w') as f:
+        json.dump({
+            'meta': {
+                'date': time.strftime("%Y-%m-%d %H:%M:%S"),
+                'python': platform.python_version(),
+                'pygame': pygame.version.ver,
+                'machine': platform.machine(),
+                'ticks': args.ticks,
+            },
+            'results': merged,
+        }, f, indent=4)
+    print(f"Résultats écrits dans {args.output}")
+
+    pygame.quit()
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
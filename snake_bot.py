@@ -0,0 +1,247 @@
+# Ce fichier implémente les joueurs contrôlés par l'ordinateur (bots).
+# - Recherche de chemin A* vers la nourriture sur la grille torique (wraparound)
+# - Vérification par remplissage (flood fill) pour ne pas s'enfermer
+# - Chemin mis en cache : on ne recalcule que si le chemin est bloqué ou si la nourriture a bougé
+# - Budget de temps CPU par tick partagé entre tous les bots (BotScheduler)
+# Le module n'utilise pas pygame : il sert aussi bien au serveur réseau qu'aux modes locaux.
+
+import heapq  # File de priorité pour A*
+import time  # Chronomètre du budget par tick
+
+# Les 4 directions possibles : haut, bas, gauche, droite
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+
+def cell(position):
+    """
+    Convertit une position (Vector2, liste ou tuple) en tuple d'entiers (x, y)
+    """
+    return (int(position[0]), int(position[1]))
+
+
+class BotWorld:
+    """
+    Vue de la grille construite UNE fois par tick et partagée par tous les bots
+    """
+
+    def __init__(self, grid_size, blocked, foods):
+        """
+        Args:
+            grid_size: Nombre de cellules par côté (la grille est carrée et torique)
+            blocked: Ensemble de cellules (x, y) interdites (obstacles + corps des serpents)
+            foods: Liste des cellules (x, y) contenant de la nourriture
+        """
+        self.grid_size = grid_size
+        self.blocked = blocked
+        self.foods = [cell(f) for f in foods if f is not None]
+
+    def step(self, position, direction):
+        """Cellule voisine dans une direction, avec wraparound"""
+        return ((position[0] + direction[0]) % self.grid_size,
+                (position[1] + direction[1]) % self.grid_size)
+
+    def distance(self, a, b):
+        """Distance de Manhattan sur le tore (heuristique admissible pour A*)"""
+        dx = abs(a[0] - b[0])
+        dy = abs(a[1] - b[1])
+        return min(dx, self.grid_size - dx) + min(dy, self.grid_size - dy)
+
+    def free_space(self, start, limit):
+        """
+        Compte les cellules libres atteignables depuis start (flood fill)
+        S'arrête dès que limit cellules ont été trouvées : seul "assez de place ?" nous intéresse
+        """
+        if start in self.blocked:
+            return 0
+        seen = {start}
+        stack = [start]
+        while stack and len(seen) < limit:
+            current = stack.pop()
+            for direction in DIRECTIONS:
+                nxt = self.step(current, direction)
+                if nxt not in seen and nxt not in self.blocked:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return len(seen)
+
+
+class PathfindingBot:
+    """
+    Bot qui suit un chemin A* vers la nourriture la plus proche
+    Le chemin est conservé d'un tick à l'autre et n'est recalculé que si nécessaire
+    """
+
+    def __init__(self, max_nodes=400):
+        """
+        Args:
+            max_nodes: Nombre maximal de cellules explorées par recherche A*
+        """
+        self.max_nodes = max_nodes
+        self.path = []  # Cellules restantes jusqu'à la cible (sans la tête)
+        self.target = None  # Cellule de nourriture visée
+        self.replans = 0  # Nombre de recherches effectuées (statistique)
+
+    def needs_replan(self, head, world):
+        """
+        Le chemin en cache est-il encore utilisable ?
+        Invalide si : vide, nourriture déplacée/mangée, prochaine case bloquée ou non adjacente
+        """
+        if not self.path or self.target not in world.foods:
+            return True
+        nxt = self.path[0]
+        if nxt in world.blocked:
+            return True
+        return world.distance(head, nxt) != 1
+
+    def find_path(self, head, world):
+        """
+        A* multi-cibles : cherche le chemin le plus court vers n'importe quelle nourriture
+        Returns:
+            list: Cellules du chemin (sans la tête), vide si aucune nourriture atteignable
+        """
+        if not world.foods:
+            return []
+        goals = set(world.foods)
+
+        def heuristic(position):
+            return min(world.distance(position, goal) for goal in goals)
+
+        came_from = {head: None}
+        cost = {head: 0}
+        # (f, g, compteur, cellule) - le compteur départage sans comparer les tuples de cellules
+        counter = 0
+        frontier = [(heuristic(head), 0, counter, head)]
+        explored = 0
+
+        while frontier and explored < self.max_nodes:
+            _, g, _, current = heapq.heappop(frontier)
+            if g > cost[current]:
+                continue  # Entrée obsolète
+            if current in goals:
+                path = []
+                while current != head:
+                    path.append(current)
+                    current = came_from[current]
+                path.reverse()
+                return path
+            explored += 1
+            for direction in DIRECTIONS:
+                nxt = world.step(current, direction)
+                if nxt in world.blocked:
+                    continue
+                new_cost = g + 1
+                if new_cost < cost.get(nxt, new_cost + 1):
+                    cost[nxt] = new_cost
+                    came_from[nxt] = current
+                    counter += 1
+                    heapq.heappush(frontier, (new_cost + heuristic(nxt), new_cost, counter, nxt))
+        return []
+
+    def plan(self, head, length, world):
+        """
+        Recalcule le chemin et vérifie qu'il ne mène pas à un piège
+        Args:
+            head: Cellule de la tête
+            length: Longueur du serpent (place minimale nécessaire après le premier pas)
+            world: BotWorld du tick courant
+        """
+        self.replans += 1
+        path = self.find_path(head, world)
+        if path and world.free_space(path[0], length + 1) > length:
+            self.path = path
+            self.target = path[-1]
+        else:
+            self.path = []
+            self.target = None
+
+    def safe_move(self, head, direction, length, world, flood=True):
+        """
+        Choisit le pas qui laisse le plus de place (sans chemin vers la nourriture)
+        Avec flood=False (budget épuisé) : premier pas libre, en gardant si possible la direction
+        """
+        candidates = [direction] + [d for d in DIRECTIONS if d != direction]
+        best, best_space = None, -1
+        for d in candidates:
+            if d == (-direction[0], -direction[1]):
+                continue  # Demi-tour interdit
+            nxt = world.step(head, d)
+            if nxt in world.blocked:
+                continue
+            if not flood:
+                return d
+            space = world.free_space(nxt, length + 1)
+            if space > best_space:
+                best, best_space = d, space
+                if space > length:
+                    break  # Assez de place, inutile de chercher mieux
+        return best if best is not None else direction
+
+    def choose_direction(self, head, direction, length, world, can_plan=True):
+        """
+        Décide de la direction pour ce tick
+        Args:
+            head: Cellule de la tête
+            direction: Direction actuelle (dx, dy)
+            length: Longueur du serpent
+            world: BotWorld du tick courant
+            can_plan: False si le budget du tick est épuisé (pas de A* ni de flood fill)
+        Returns:
+            tuple: Nouvelle direction (dx, dy)
+        """
+        head = cell(head)
+        direction = cell(direction)
+        if self.needs_replan(head, world):
+            if not can_plan:
+                self.path = []
+                return self.safe_move(head, direction, length, world, flood=False)
+            self.plan(head, length, world)
+        if self.path:
+            nxt = self.path.pop(0)
+            for d in DIRECTIONS:
+                if world.step(head, d) == nxt:
+                    return d
+        return self.safe_move(head, direction, length, world, flood=can_plan)
+
+
+class BotScheduler:
+    """
+    Répartit un budget CPU par tick entre tous les bots
+    Les bots qui dépassent le budget jouent un coup "sûr" instantané et replanifient au tick suivant
+    L'ordre de passage tourne à chaque tick pour qu'aucun bot ne soit toujours le dernier servi
+    """
+
+    def __init__(self, budget_ms=20.0):
+        """
+        Args:
+            budget_ms: Temps maximal consacré aux bots à chaque tick (millisecondes)
+        """
+        self.budget = budget_ms / 1000.0
+        self.offset = 0  # Rotation de l'ordre de passage
+        self.last_elapsed_ms = 0.0  # Temps réellement utilisé au dernier tick
+        self.last_starved = 0  # Bots servis sans planification au dernier tick
+
+    def run(self, bots, world):
+        """
+        Args:
+            bots: Liste de tuples (bot, tête, direction, longueur)
+            world: BotWorld partagé du tick
+        Returns:
+            list: Directions choisies, dans le même ordre que bots
+        """
+        count = len(bots)
+        results = [None] * count
+        start = time.perf_counter()
+        deadline = start + self.budget
+        starved = 0
+        for k in range(count):
+            index = (self.offset + k) % count
+            bot, head, direction, length = bots[index]
+            can_plan = time.perf_counter() < deadline
+            if not can_plan:
+                starved += 1
+            results[index] = bot.choose_direction(head, direction, length, world, can_plan)
+        if count:
+            self.offset = (self.offset + 1) % count
+        self.last_elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self.last_starved = starved
+        return results
@@ -8,6 +8,17 @@ import json  # JSON - décodage des messages du serveur
 import pygame  # Pygame - interface graphique et affichage
 from pygame.math import Vector2  # Vecteurs 2D pour positions/directions
 import random  # Aléatoire - non utilisé mais conservé
+import time  # Horodatage des états reçus (overlay de performances)
+from collections import deque  # Historique des instants de réception
+from snake_assets import assets  # Cache d'images partagé (surfaces procédurales dessinées une fois)
+import argparse  # Options de la ligne de commande (--profile)
+from snake_profiler import add_profile_arguments, create_profiler  # Profil par phase
+from snake_hud import PerfOverlay, add_hud_argument  # Overlay de performances (F3)
+from snake_background import BackgroundLayer, cells_key  # Couches statiques en cache
+from snake_text import fonts  # Polices partagées et cache des textes rendus
+from snake_menu import MenuView  # Menus redessinés seulement quand ils changent
+from snake_framebuffer import Framebuffer, add_display_arguments  # Fenêtre agrandie en une passe
+from snake_audio import sounds  # Sons décodés une fois, mixer à faible latence
 
 # PALETTE DE COULEURS MODERNE
 BG_LIGHT = (46, 204, 113)
@@ -55,6 +66,7 @@ class NetworkClient:
         }
         self.connected = False
         self.lock = threading.Lock()  # Verrou pour accès thread-safe
+        self.state_times = deque(maxlen=64)  # Instants de réception des derniers états
 
     def connect(self):
         """
@@ -137,6 +149,7 @@ class NetworkClient:
             # Mise à jour thread-safe de l'état du jeu
             with self.lock:
                 self.game_state = data['game_state']
+            self.state_times.append(time.perf_counter())
 
 
 class MultiplayerGame:
@@ -149,27 +162,35 @@ class MultiplayerGame:
     - Le rendu des serpents, nourriture, obstacles
     """
 
-    def __init__(self, network_client, player_name):
+    def __init__(self, network_client, player_name, profiler=None, pixel_scale=1, scaled=False):
         """
         Constructeur : initialise le jeu
         Paramètres :
             network_client : instance de NetworkClient déjà connecté
             player_name : nom choisi par le joueur
+            profiler : PerfOverlay (overlay F3 + profileur --profile), créé masqué si None
+            pixel_scale : pixels de la fenêtre par pixel du jeu (option --pixel-scale)
+            scaled : agrandissement par SDL, pygame.SCALED (option --scaled)
         """
         self.network = network_client
         self.player_name = player_name
+        self.profiler = profiler if profiler is not None else PerfOverlay()
 
         # === INITIALISATION PYGAME ===
         pygame.init()
+        fonts.reload()  # Polices chargées par get_connection_info() avant son pygame.quit()
         self.cell_size = 20
         self.number_of_cells = 20
         self.OFFSET = 75
 
         # === CRÉATION DE LA FENÊTRE ===
-        self.screen = pygame.display.set_mode(
+        # Le jeu est dessiné à sa taille logique dans self.screen, puis agrandi dans la fenêtre
+        self.display = Framebuffer(
             (2 * self.OFFSET + self.cell_size * self.number_of_cells,
-             2 * self.OFFSET + self.cell_size * self.number_of_cells)
+             2 * self.OFFSET + self.cell_size * self.number_of_cells),
+            pixel_scale, scaled
         )
+        self.screen = self.display.surface
         pygame.display.set_caption("🐍 Snake Game - Multiplayer")
 
         # === DIRECTION DU SERPENT ===
@@ -186,17 +207,17 @@ class MultiplayerGame:
         })
 
         # === POLICES D'AFFICHAGE ===
-        self.title_font = pygame.font.Font(None, 70)
-        self.score_font = pygame.font.Font(None, 45)
-        self.small_font = pygame.font.Font(None, 28)
-        self.info_font = pygame.font.Font(None, 32)
+        self.title_font = fonts.get(70)
+        self.score_font = fonts.get(45)
+        self.small_font = fonts.get(28)
+        self.info_font = fonts.get(32)
+
+        # === ARRIÈRE-PLAN EN CACHE ===
+        # Dégradé, bordures, obstacles et titre : redessinés seulement si les obstacles changent
+        self.background = BackgroundLayer()
 
         # === CHARGEMENT DES SONS ===
-        try:
-            self.eat_sound = pygame.mixer.Sound("snake_eat.wav")
-        except:
-            self.eat_sound = None
-            print("⚠️ Eat sound not found")
+        sounds.load()  # Banque partagée (rien à faire si elle est déjà chargée)
 
         self.last_score = 0
 
@@ -233,89 +254,107 @@ class MultiplayerGame:
                 'direction': new_direction
             })
 
-    def draw(self):
+    def paint_obstacle(self, surface):
         """
-        MÉTHODE : Rendu graphique complet
-        Dessine :
+        MÉTHODE : Dessine la tuile d'obstacle (appelée une seule fois par le cache d'images)
+        """
+        obs_rect = surface.get_rect()
+        pygame.draw.rect(surface, BRICK_RED, obs_rect, border_radius=4)
+        pygame.draw.rect(surface, BRICK_DARK, obs_rect, 2, border_radius=4)
+
+    def paint_background(self, surface, obstacles):
+        """
+        MÉTHODE : Dessine les couches statiques dans la Surface en cache
         1. Arrière-plan dégradé
         2. Bordures du terrain
-        3. Nourriture
-        4. Obstacles
-        5. Tous les joueurs (serpents)
-        6. Interface utilisateur (score, connexion)
+        3. Obstacles
+        4. Titre "MULTIPLAYER"
         """
-        # === RÉCUPÉRATION THREAD-SAFE DE L'ÉTAT ===
-        with self.network.lock:
-            game_state = self.network.game_state.copy()
-
         # === 1. ARRIÈRE-PLAN DÉGRADÉ ===
         for y in range(2 * self.OFFSET + self.cell_size * self.number_of_cells):
             ratio = y / (2 * self.OFFSET + self.cell_size * self.number_of_cells)
             r = int(46 + (39 - 46) * ratio)
             g = int(204 + (174 - 204) * ratio)
             b = int(113 + (96 - 113) * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y),
+            pygame.draw.line(surface, (r, g, b), (0, y),
                              (2 * self.OFFSET + self.cell_size * self.number_of_cells, y))
 
         # === 2. BORDURE DU TERRAIN ===
         # Bordure externe (noire)
-        pygame.draw.rect(self.screen, TEXT_DARK,
+        pygame.draw.rect(surface, TEXT_DARK,
                          (self.OFFSET - 7, self.OFFSET - 7,
                           self.cell_size * self.number_of_cells + 14,
                           self.cell_size * self.number_of_cells + 14),
                          border_radius=10)
         # Bordure interne (verte foncée)
-        pygame.draw.rect(self.screen, BG_DARK,
+        pygame.draw.rect(surface, BG_DARK,
                          (self.OFFSET - 5, self.OFFSET - 5,
                           self.cell_size * self.number_of_cells + 10,
                           self.cell_size * self.number_of_cells + 10),
                          5, border_radius=8)
 
-        # === 3. NOURRITURE ===
+        # === 3. OBSTACLES ===
+        obstacle_surface = assets.generated('client_obstacle', (self.cell_size, self.cell_size),
+                                            self.paint_obstacle)
+        for obstacle in obstacles:
+            surface.blit(obstacle_surface,
+                         (self.OFFSET + obstacle[0] * self.cell_size,
+                          self.OFFSET + obstacle[1] * self.cell_size))
+
+        # === 4. TITRE ===
+        title_shadow = self.title_font.render("MULTIPLAYER", True, TEXT_DARK)
+        title_surface = self.title_font.render("MULTIPLAYER", True, WHITE)
+        surface.blit(title_shadow, (self.OFFSET - 3, 18))
+        surface.blit(title_surface, (self.OFFSET - 5, 15))
+
+    def draw(self):
+        """
+        MÉTHODE : Rendu graphique complet
+        Dessine :
+        1. Arrière-plan en cache (dégradé, bordures, obstacles, titre)
+        2. Nourriture
+        3. Tous les joueurs (serpents)
+        4. Interface utilisateur (score, connexion)
+        """
+        # === RÉCUPÉRATION THREAD-SAFE DE L'ÉTAT ===
+        with self.network.lock:
+            game_state = self.network.game_state.copy()
+        self.profiler.lap('state')
+
+        # === 1. ARRIÈRE-PLAN (un seul blit) ===
+        obstacles = cells_key(game_state.get('obstacles', []))
+        self.background.blit(self.screen, obstacles,
+                             lambda surface: self.paint_background(surface, obstacles))
+        self.profiler.lap('background')
+
+        # === 2. NOURRITURE ===
+        # Cercles pré-dessinés une seule fois (avec reflet blanc) par le gestionnaire d'images
+        apple_surface = assets.circle(RED, self.cell_size, shine=WHITE)
+        mushroom_surface = assets.circle(ORANGE, self.cell_size, shine=WHITE)
+
         # Pomme (food1) - rouge
         if game_state.get('food1'):
-            food_rect = pygame.Rect(
-                self.OFFSET + game_state['food1'][0] * self.cell_size,
-                self.OFFSET + game_state['food1'][1] * self.cell_size,
-                self.cell_size, self.cell_size
-            )
-            pygame.draw.circle(self.screen, RED, food_rect.center, self.cell_size // 2)
-            # Reflet blanc
-            pygame.draw.circle(self.screen, WHITE,
-                               (food_rect.centerx - 3, food_rect.centery - 3), 3)
+            self.screen.blit(apple_surface,
+                             (self.OFFSET + game_state['food1'][0] * self.cell_size,
+                              self.OFFSET + game_state['food1'][1] * self.cell_size))
 
         # Champignon (food2) - orange
         if game_state.get('food2'):
-            food_rect = pygame.Rect(
-                self.OFFSET + game_state['food2'][0] * self.cell_size,
-                self.OFFSET + game_state['food2'][1] * self.cell_size,
-                self.cell_size, self.cell_size
-            )
-            pygame.draw.circle(self.screen, ORANGE, food_rect.center, self.cell_size // 2)
-            pygame.draw.circle(self.screen, WHITE,
-                               (food_rect.centerx - 3, food_rect.centery - 3), 3)
-
-        # === 4. OBSTACLES ===
-        for obstacle in game_state.get('obstacles', []):
-            obs_rect = pygame.Rect(
-                self.OFFSET + obstacle[0] * self.cell_size,
-                self.OFFSET + obstacle[1] * self.cell_size,
-                self.cell_size, self.cell_size
-            )
-            pygame.draw.rect(self.screen, BRICK_RED, obs_rect, border_radius=4)
-            pygame.draw.rect(self.screen, BRICK_DARK, obs_rect, 2, border_radius=4)
-
-        # === 5. TOUS LES JOUEURS ===
+            self.screen.blit(mushroom_surface,
+                             (self.OFFSET + game_state['food2'][0] * self.cell_size,
+                              self.OFFSET + game_state['food2'][1] * self.cell_size))
+
+        # === 3. TOUS LES JOUEURS ===
         players = game_state.get('players', {})
 
         for player_id, player_data in players.items():
             is_me = (str(player_id) == str(self.network.client_id))
 
             # === VÉRIFICATION SI NOURRITURE MANGÉE ===
-            if is_me and self.eat_sound:
+            if is_me:
                 current_score = player_data.get('score', 0)
                 if current_score > self.last_score:
-                    self.eat_sound.play()
+                    sounds.play('eat')
                 self.last_score = current_score
 
             # === DESSIN DU CORPS DU SERPENT ===
@@ -363,14 +402,9 @@ class MultiplayerGame:
 
                 self.screen.blit(name_surface, (name_x, name_y))
                 self.screen.blit(score_surface, (name_x + name_surface.get_width() + 5, name_y))
+        self.profiler.lap('draw')
 
-        # === 6. INTERFACE UTILISATEUR ===
-        # Titre "MULTIPLAYER"
-        title_shadow = self.title_font.render("MULTIPLAYER", True, TEXT_DARK)
-        title_surface = self.title_font.render("MULTIPLAYER", True, WHITE)
-        self.screen.blit(title_shadow, (self.OFFSET - 3, 18))
-        self.screen.blit(title_surface, (self.OFFSET - 5, 15))
-
+        # === 4. INTERFACE UTILISATEUR ===
         # Score du joueur
         my_score = 0
         if str(self.network.client_id) in players:
@@ -395,8 +429,12 @@ class MultiplayerGame:
         status_text = self.small_font.render(f"Connected to: {self.network.host}", True, status_color)
         self.screen.blit(status_text,
                          (self.OFFSET + 400, self.OFFSET + self.cell_size * self.number_of_cells + 25))
+        self.profiler.lap('ui')
 
-        pygame.display.update()
+        # Agrandissement, overlay de performances (F3 : fréquence et âge des états reçus)
+        # à la résolution de la fenêtre, puis mise à jour de l'affichage
+        self.display.show(self.profiler, network=self.network)
+        self.profiler.lap('display')
 
     def run(self):
         """
@@ -409,15 +447,22 @@ class MultiplayerGame:
         running = True
 
         while running and self.network.connected:
+            self.profiler.begin_frame()
             for event in pygame.event.get():
+                if self.profiler.handle_event(event):
+                    continue
+
                 if event.type == pygame.QUIT:
                     running = False
 
                 if event.type == pygame.KEYDOWN:
                     self.handle_input()
+            self.profiler.lap('events')
 
             self.draw()
             clock.tick(60)  # 60 FPS
+            self.profiler.lap('wait')
+            self.profiler.end_frame()
 
         pygame.quit()
 
@@ -435,8 +480,8 @@ def get_connection_info():
     screen = pygame.display.set_mode((700, 500))
     pygame.display.set_caption("🌐 Multiplayer Connection")
 
-    font = pygame.font.Font(None, 48)
-    small_font = pygame.font.Font(None, 32)
+    font = fonts.get(48)
+    small_font = fonts.get(32)
 
     # Valeurs par défaut
     server_ip = "25.40.67.39"  # IP Hamachi
@@ -444,7 +489,8 @@ def get_connection_info():
     player_name = ""
     active_field = "name"  # Champ actif par défaut
 
-    clock = pygame.time.Clock()
+    # Attente des événements : l'écran n'est redessiné que si un champ change
+    view = MenuView()
 
     while True:
         # === ARRIÈRE-PLAN DÉGRADÉ ===
@@ -494,14 +540,15 @@ def get_connection_info():
         screen.blit(name_text, (115, 392))
 
         # === INSTRUCTIONS ===
-        inst_font = pygame.font.Font(None, 24)
+        inst_font = fonts.get(24)
         inst_text = inst_font.render("Press ENTER to Connect | TAB to switch", True, (189, 195, 199))
         screen.blit(inst_text, (160, 450))
 
         pygame.display.update()
 
         # === GESTION DES ÉVÉNEMENTS ===
-        for event in pygame.event.get():
+        # Bloque jusqu'à ce que le port, le nom ou le champ actif change
+        for event in view.events(lambda: (server_port, player_name, active_field)):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 import sys
@@ -536,8 +583,6 @@ def get_connection_info():
                     elif active_field == "name" and len(player_name) < 20:
                         player_name += event.unicode
 
-        clock.tick(30)
-
 
 def main():
     """
@@ -548,6 +593,14 @@ def main():
     3. Établit la connexion
     4. Lance le jeu
     """
+    parser = argparse.ArgumentParser(description="Snake - client multijoueur")
+    add_profile_arguments(parser)
+    add_hud_argument(parser)
+    add_display_arguments(parser)
+    args = parser.parse_args()
+    # L'overlay (F3) reçoit les mesures de chaque phase et les transmet au profileur
+    profiler = PerfOverlay(create_profiler(args, "snake_client"), visible=args.hud)
+
     print("🐍 SNAKE GAME - MULTIPLAYER CLIENT")
     print("\nInstructions:")
     print("1. Server must run 'Multiplayer Host (Server)' first")
@@ -561,7 +614,7 @@ def main():
     network = NetworkClient(server_host, server_port)
     if network.connect():
         # Lancement du jeu
-        game = MultiplayerGame(network, player_name)
+        game = MultiplayerGame(network, player_name, profiler, args.pixel_scale, args.scaled)
         game.run()
     else:
         print("❌ Could not connect to server")
@@ -0,0 +1,134 @@
+# Ce fichier implémente le mode de rendu par "rectangles sales" (option --dirty-rects).
+# Sans ce mode, chaque frame recopie tout l'arrière-plan puis met à jour toute la fenêtre
+# (pygame.display.update()), alors qu'un tick normal ne change que quelques cases :
+# la tête et la queue du serpent, la nourriture et le texte du score.
+# Avec ce mode :
+# - chaque élément mobile déclare la zone où il est dessiné (add / add_cells)
+# - au début de la frame suivante, seules ces zones sont effacées, en les recopiant
+#   depuis l'arrière-plan en cache (snake_background)
+# - pygame.display.update(rects) ne transmet que les zones de la frame précédente
+#   (à effacer) et de la frame courante (nouveau contenu)
+# - si la scène n'a pas changé (même signature), la frame n'est pas redessinée du tout
+
+import pygame
+
+
+class DirtyRects:
+    """
+    Suivi des zones modifiées d'une frame à l'autre
+    Utilisation dans une boucle (voir les draw_frame des modes de jeu) :
+        if dirty.changed(signature):
+            dirty.restore(screen, fond)      # efface les zones de la frame précédente
+            ... dessin des éléments mobiles + dirty.add(zone) ...
+            dirty.update()                   # display.update(zones précédentes + courantes)
+    """
+
+    def __init__(self):
+        self.previous = []  # Zones dessinées à la frame précédente
+        self.current = []  # Zones dessinées à la frame courante
+        self.full = True  # Prochaine frame : recopie et mise à jour de tout l'écran
+        self.signature = None
+        self._background = None
+        self._bounds = None  # Rectangle de l'écran (les zones y sont découpées)
+
+    def invalidate(self):
+        """Force une frame complète (fenêtre réexposée, overlay masqué, ...)"""
+        self.full = True
+
+    def handle_event(self, event):
+        """La fenêtre a été recouverte puis réaffichée : tout redessiner"""
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.invalidate()
+
+    def changed(self, signature):
+        """
+        Indique si la frame doit être redessinée
+        Args:
+            signature: Valeur comparable décrivant tout ce qui est dessiné
+                       (None : la scène est animée, toujours redessiner)
+        Returns:
+            bool: False si rien n'a changé depuis la dernière frame dessinée
+        """
+        if signature is not None and not self.full and signature == self.signature:
+            return False
+        self.signature = signature
+        return True
+
+    def restore(self, screen, background):
+        """
+        Efface la frame précédente en recopiant l'arrière-plan sous ses zones
+        Args:
+            screen: Surface de la fenêtre
+            background: Arrière-plan en cache (même taille que l'écran)
+        """
+        if background is not self._background:
+            # Nouvel arrière-plan (thème, niveau, obstacles...) : tout l'écran change
+            self._background = background
+            self.full = True
+        self._bounds = screen.get_rect()
+        if self.full:
+            screen.blit(background, (0, 0))
+        else:
+            for rect in self.previous:
+                screen.blit(background, rect, rect)
+
+    def add(self, rect):
+        """Déclare une zone dessinée pendant cette frame (None est ignoré)"""
+        if rect is None:
+            return
+        rect = pygame.Rect(rect)
+        if self._bounds is not None:
+            rect = rect.clip(self._bounds)
+        if rect.width and rect.height:
+            self.current.append(rect)
+
+    def add_cells(self, positions, cell_size, offset, margin=0):
+        """
+        Déclare les cases de la grille occupées par un élément (serpent, nourriture...)
+        Args:
+            positions: Positions (x, y) en cases
+            cell_size: Taille d'une case en pixels
+            offset: Marge entre le bord de la fenêtre et le terrain
+            margin: Débordement du dessin autour de la case (lueur, pulsation), en pixels
+        """
+        size = cell_size + 2 * margin
+        for position in positions:
+            self.add((offset + int(position[0]) * cell_size - margin,
+                      offset + int(position[1]) * cell_size - margin,
+                      size, size))
+
+    def update(self, scale=1):
+        """
+        Affiche la frame : mise à jour des zones précédentes et courantes seulement
+        Args:
+            scale: Pixels de la fenêtre par pixel de l'écran dessiné (snake_framebuffer)
+        Returns:
+            int: Nombre de zones transmises (0 : écran complet ou rien à faire)
+        """
+        if self.full:
+            pygame.display.update()
+            count = 0
+        else:
+            rects = self.previous + self.current
+            if rects:
+                pygame.display.update([pygame.Rect(r.x * scale, r.y * scale, r.w * scale, r.h * scale)
+                                       for r in rects] if scale != 1 else rects)
+            count = len(rects)
+        self.previous = self.current
+        self.current = []
+        self.full = False
+        return count
+
+
+def create_dirty_rects(args):
+    """
+    Returns:
+        DirtyRects avec --dirty-rects, sinon None (rendu complet habituel)
+    """
+    return DirtyRects() if args.dirty_rects else None
+
+
+def add_dirty_argument(parser):
+    """Ajoute l'option --dirty-rects à un argparse.ArgumentParser"""
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="Ne redessine et n'affiche que les zones modifiées à chaque frame")
@@ -0,0 +1,268 @@
+# Ce fichier implémente un champ de distances partagé par tous les bots du serveur.
+# - UN seul BFS multi-sources (depuis toutes les nourritures) par tick, pour tous les bots
+# - Mise à jour incrémentale : seules les cellules touchées par un changement
+#   (nourriture déplacée, cellule occupée ou libérée) sont recalculées
+# - Carte de danger construite à partir des têtes des autres serpents
+# - Chaque bot choisit son coup avec 4 lectures de tableau (O(1))
+# Le module n'utilise pas pygame.
+
+import heapq  # File de priorité pour les mises à jour incrémentales
+
+from snake_bot import DIRECTIONS, cell
+
+# Distance des cellules qui ne peuvent atteindre aucune nourriture
+UNREACHABLE = 1 << 30
+# Au-delà de (nombre de cellules / REBUILD_RATIO) cellules changées ou invalidées,
+# la mise à jour incrémentale est abandonnée au profit d'un recalcul complet
+REBUILD_RATIO = 16
+
+
+class FlowField:
+    """
+    Distance (en nombre de pas) de chaque cellule à la nourriture la plus proche
+    sur une grille torique. Les cellules sont numérotées index = y * taille + x.
+    """
+
+    def __init__(self, grid_size):
+        """
+        Args:
+            grid_size: Nombre de cellules par côté
+        """
+        self.grid_size = grid_size
+        count = grid_size * grid_size
+        self.dist = [UNREACHABLE] * count
+        self.blocked = bytearray(count)  # 1 = cellule occupée (obstacle ou serpent)
+        self.blocked_cells = set()  # Indices bloqués (pour calculer les différences)
+        self.sources = set()  # Indices des nourritures
+        # Voisins précalculés (haut, bas, gauche, droite) de chaque cellule
+        self.neighbors = []
+        for index in range(count):
+            x, y = index % grid_size, index // grid_size
+            self.neighbors.append(tuple(((y + dy) % grid_size) * grid_size + (x + dx) % grid_size
+                                        for dx, dy in DIRECTIONS))
+        self.touched = 0  # Cellules recalculées lors de la dernière mise à jour (statistique)
+
+    def index(self, position):
+        """Convertit une position (x, y) en indice de cellule"""
+        x, y = cell(position)
+        return (y % self.grid_size) * self.grid_size + x % self.grid_size
+
+    def rebuild(self):
+        """
+        Recalcul complet : BFS multi-sources depuis toutes les nourritures
+        Utilisé au démarrage et pour vérifier la version incrémentale
+        """
+        dist = self.dist
+        for i in range(len(dist)):
+            dist[i] = UNREACHABLE
+        frontier = []
+        for source in self.sources:
+            if not self.blocked[source]:
+                dist[source] = 0
+                frontier.append(source)
+        blocked, neighbors = self.blocked, self.neighbors
+        level = 0
+        while frontier:
+            level += 1
+            nxt = []
+            for current in frontier:
+                for n in neighbors[current]:
+                    if not blocked[n] and dist[n] > level:
+                        dist[n] = level
+                        nxt.append(n)
+            frontier = nxt
+        self.touched = len(dist)
+
+    def update(self, blocked_cells, food_cells):
+        """
+        Met à jour le champ pour un nouvel état de la grille
+        Args:
+            blocked_cells: Ensemble des positions (x, y) occupées
+            food_cells: Positions (x, y) des nourritures
+        """
+        new_blocked = {self.index(c) for c in blocked_cells}
+        new_sources = {self.index(c) for c in food_cells if c is not None}
+
+        blocking = new_blocked - self.blocked_cells
+        freeing = self.blocked_cells - new_blocked
+        removed = self.sources - new_sources
+        added = new_sources - self.sources
+
+        self.touched = 0
+        # Nourriture mangée (toute sa zone d'influence est à refaire) ou trop de cellules
+        # changées : le BFS complet, sans file de priorité, coûte alors moins cher
+        full = bool(removed) or len(blocking) + len(freeing) > len(self.dist) // REBUILD_RATIO
+
+        # 1) Changements qui ne peuvent qu'AUGMENTER des distances
+        seeds = {}
+        for index in blocking:
+            seeds[index] = self.dist[index]
+            self.blocked[index] = 1
+        self.sources = new_sources
+        self.blocked_cells = new_blocked
+        if full or (seeds and not self._raise(seeds)):
+            for index in freeing:
+                self.blocked[index] = 0
+            self.rebuild()
+            return
+
+        # 2) Changements qui ne peuvent que DIMINUER des distances
+        frontier = []
+        for index in freeing:
+            self.blocked[index] = 0
+            if index in self.sources:
+                d = 0
+            else:
+                best = min((self.dist[n] for n in self.neighbors[index] if not self.blocked[n]),
+                           default=UNREACHABLE)
+                d = best + 1 if best < UNREACHABLE else UNREACHABLE
+            self.dist[index] = d
+            if d < UNREACHABLE:
+                frontier.append((d, index))
+        for index in added:
+            if not self.blocked[index]:
+                self.dist[index] = 0
+                frontier.append((0, index))
+        if frontier:
+            self._lower(frontier)
+
+    def _raise(self, seeds):
+        """
+        Invalide les cellules dont le plus court chemin passait par une cellule perdue
+        puis les recalcule depuis la frontière restée valide.
+        Les cellules sont traitées par distance croissante : quand on vérifie si une cellule
+        a encore un "support" (voisin à distance d-1), tous les supports possibles ont déjà
+        été invalidés s'ils devaient l'être.
+        Args:
+            seeds: {indice: ancienne distance} des cellules nouvellement bloquées
+        Returns:
+            bool: False si trop de cellules sont invalidées (le champ doit être reconstruit)
+        """
+        dist, blocked, neighbors, sources = self.dist, self.blocked, self.neighbors, self.sources
+        limit = len(dist) // REBUILD_RATIO
+        heap = []
+        invalid = []
+        for index, old in seeds.items():
+            if old >= UNREACHABLE:
+                continue
+            dist[index] = UNREACHABLE
+            invalid.append(index)
+            heapq.heappush(heap, (old, index))
+
+        while heap:
+            old, current = heapq.heappop(heap)
+            for n in neighbors[current]:
+                d = dist[n]
+                if blocked[n] or d != old + 1 or n in sources:
+                    continue
+                # La cellule n dépendait peut-être de current : a-t-elle un autre support ?
+                supported = False
+                for w in neighbors[n]:
+                    if not blocked[w] and dist[w] == d - 1:
+                        supported = True
+                        break
+                if not supported:
+                    dist[n] = UNREACHABLE
+                    invalid.append(n)
+                    heapq.heappush(heap, (d, n))
+            if len(invalid) > limit:
+                return False
+
+        # Réensemencement depuis les voisins valides
+        frontier = []
+        for index in invalid:
+            if blocked[index]:
+                continue
+            if index in sources:
+                dist[index] = 0
+                frontier.append((0, index))
+                continue
+            best = UNREACHABLE
+            for n in neighbors[index]:
+                if not blocked[n] and dist[n] < best:
+                    best = dist[n]
+            if best < UNREACHABLE:
+                dist[index] = best + 1
+                frontier.append((best + 1, index))
+        self.touched += len(invalid)
+        if frontier:
+            self._lower(frontier)
+        return True
+
+    def _lower(self, frontier):
+        """
+        Propage des distances plus courtes (Dijkstra à poids unitaires depuis la frontière)
+        Args:
+            frontier: Liste de (distance, indice) déjà écrites dans self.dist
+        """
+        dist, blocked, neighbors = self.dist, self.blocked, self.neighbors
+        heapq.heapify(frontier)
+        while frontier:
+            d, current = heapq.heappop(frontier)
+            if d > dist[current]:
+                continue  # Entrée obsolète
+            self.touched += 1
+            d += 1
+            for n in neighbors[current]:
+                if not blocked[n] and dist[n] > d:
+                    dist[n] = d
+                    heapq.heappush(frontier, (d, n))
+
+
+class DangerMap:
+    """
+    Nombre de têtes de serpents pouvant entrer dans chaque cellule au prochain tick
+    """
+
+    def __init__(self, field):
+        """
+        Args:
+            field: FlowField (fournit la taille et les voisins précalculés)
+        """
+        self.field = field
+        self.count = [0] * len(field.dist)
+        self.marked = []  # Cellules non nulles, pour remettre à zéro sans tout parcourir
+
+    def build(self, heads):
+        """
+        Args:
+            heads: Positions (x, y) de toutes les têtes de serpents
+        """
+        count = self.count
+        for index in self.marked:
+            count[index] = 0
+        self.marked = []
+        for head in heads:
+            for n in self.field.neighbors[self.field.index(head)]:
+                if count[n] == 0:
+                    self.marked.append(n)
+                count[n] += 1
+
+
+class FlowFieldBot:
+    """
+    Bot sans recherche de chemin : descend le champ de distances partagé
+    """
+
+    def choose_direction(self, head, direction, field, danger):
+        """
+        Args:
+            head: Position (x, y) de la tête
+            direction: Direction actuelle (dx, dy)
+            field: FlowField du tick
+            danger: DangerMap du tick (inclut la tête de ce bot)
+        Returns:
+            tuple: Nouvelle direction (dx, dy)
+        """
+        direction = cell(direction)
+        reverse = (-direction[0], -direction[1])
+        neighbors = field.neighbors[field.index(head)]
+        best, best_key = direction, None
+        for d, n in zip(DIRECTIONS, neighbors):
+            if d == reverse or field.blocked[n]:
+                continue
+            # danger.count[n] compte aussi notre propre tête : on la retire
+            key = (danger.count[n] > 1, field.dist[n])
+            if best_key is None or key < best_key:
+                best, best_key = d, key
+        return best
@@ -0,0 +1,112 @@
+# Ce fichier implémente l'affichage des modes de jeu dans une fenêtre agrandie.
+# Tout le jeu est dessiné à sa résolution logique (550x550 : cases de 20 pixels) dans un
+# framebuffer, quelle que soit la taille de la fenêtre :
+# - option --pixel-scale N : fenêtre N fois plus grande, le framebuffer y est copié en
+#   un seul pygame.transform.scale() (ou seulement ses zones modifiées avec --dirty-rects)
+# - option --scaled : la fenêtre utilise pygame.SCALED, l'agrandissement est fait par
+#   SDL (carte graphique), y compris en plein écran
+# Le coût du dessin ne dépend donc plus de la taille de la fenêtre. L'overlay de
+# performances (F3) est dessiné après l'agrandissement, à la résolution de la fenêtre,
+# pour que son texte reste net (sauf avec --scaled, où tout est agrandi par SDL).
+
+import pygame
+
+
+class Framebuffer:
+    """
+    Surface de dessin du jeu et fenêtre d'affichage
+    Utilisation dans une boucle de jeu :
+        display = Framebuffer((550, 550), pixel_scale=2)
+        draw_frame(display.surface, game, ...)
+        display.show(profiler, dirty)       # agrandissement, overlay, display.update()
+    Avec une échelle de 1, surface et fenêtre sont la même Surface (aucune copie).
+    """
+
+    def __init__(self, size, pixel_scale=1, scaled=False):
+        """
+        Args:
+            size: Taille logique (largeur, hauteur) utilisée par tout le code de dessin
+            pixel_scale: Pixels de la fenêtre par pixel logique (entier >= 1)
+            scaled: Agrandissement par SDL (pygame.SCALED) au lieu de transform.scale
+        """
+        self.size = tuple(size)
+        if scaled:
+            self.scale = 1
+            self.window = pygame.display.set_mode(self.size, pygame.SCALED)
+        else:
+            self.scale = max(1, int(pixel_scale))
+            self.window = pygame.display.set_mode((self.size[0] * self.scale, self.size[1] * self.scale))
+        if self.scale == 1:
+            self.surface = self.window
+        else:
+            # Même format de pixels que la fenêtre : l'agrandissement est une simple copie
+            self.surface = pygame.Surface(self.size).convert()
+
+    def to_window(self, rect):
+        """Rectangle logique -> rectangle de la fenêtre"""
+        s = self.scale
+        return pygame.Rect(rect[0] * s, rect[1] * s, rect[2] * s, rect[3] * s)
+
+    def to_logical(self, rect):
+        """Rectangle de la fenêtre -> plus petit rectangle logique qui le contient (None conservé)"""
+        if rect is None or self.scale == 1:
+            return rect
+        s = self.scale
+        rect = pygame.Rect(rect)
+        left, top = rect.left // s, rect.top // s
+        right, bottom = -(-rect.right // s), -(-rect.bottom // s)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def present(self, rects=None):
+        """
+        Copie le framebuffer dans la fenêtre en l'agrandissant
+        Args:
+            rects: Zones logiques à copier (None : tout le framebuffer en un seul appel)
+        """
+        if self.surface is self.window:
+            return
+        if rects is None:
+            pygame.transform.scale(self.surface, self.window.get_size(), self.window)
+            return
+        for rect in rects:
+            target = self.to_window(rect)
+            pygame.transform.scale(self.surface.subsurface(rect), target.size,
+                                   self.window.subsurface(target))
+
+    def show(self, profiler, dirty=None, **hud):
+        """
+        Affiche la frame dessinée dans self.surface
+        Args:
+            profiler: PerfOverlay, dessiné à la résolution de la fenêtre
+            dirty: DirtyRects (--dirty-rects) : seules les zones modifiées sont copiées et affichées
+            hud: Informations supplémentaires de l'overlay (particles=..., network=...)
+        """
+        if dirty is None:
+            self.present()
+            profiler.draw(self.window, **hud)
+            pygame.display.update()
+            return
+        # Zones de la frame précédente (effacées) et de la frame courante (dessinées)
+        self.present(None if dirty.full else dirty.previous + dirty.current)
+        profiler.draw(self.window, **hud)
+        dirty.add(self.to_logical(profiler.rect))
+        # La zone de l'overlay sera recopiée depuis l'arrière-plan à la frame suivante
+        dirty.update(self.scale)
+
+
+def create_framebuffer(args, size):
+    """
+    Crée la fenêtre du jeu selon les options --pixel-scale et --scaled
+    Args:
+        args: Options lues par argparse (voir add_display_arguments)
+        size: Taille logique de l'écran de jeu
+    """
+    return Framebuffer(size, args.pixel_scale, args.scaled)
+
+
+def add_display_arguments(parser):
+    """Ajoute les options --pixel-scale et --scaled à un argparse.ArgumentParser"""
+    parser.add_argument('--pixel-scale', type=int, default=1, metavar='N',
+                        help="Fenêtre N fois plus grande, le jeu étant dessiné à sa taille normale")
+    parser.add_argument('--scaled', action='store_true',
+                        help="Agrandissement par SDL (pygame.SCALED), adapté au plein écran")
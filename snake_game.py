@@ -2,8 +2,20 @@ import sys
 import random
 import pygame
 from pygame.math import Vector2
-import json
-import os
+import argparse
+from snake_assets import assets
+from snake_profiler import NULL_PROFILER, add_profile_arguments, create_profiler
+from snake_hud import PerfOverlay, add_hud_argument
+from snake_background import BackgroundLayer, cells_key
+from snake_dirty import add_dirty_argument, create_dirty_rects
+from snake_text import fonts
+from snake_loop import FixedTimestep, interpolate
+from snake_menu import MenuView
+from snake_framebuffer import add_display_arguments, create_framebuffer
+from snake_audio import sounds
+from snake_scores import SCORES_DB, SOLO, SOLO_LEVEL
+from snake_history import add_history_argument, create_history
+from snake_leaderboard import Scoreboard
 
 pygame.init()
 
@@ -23,13 +35,14 @@ BRICK_LIGHT = (205, 97, 85)
 TEXT_DARK = (44, 62, 80)
 UI_BG = (52, 73, 94)
 
-title_font = pygame.font.Font(None, 70)
-score_font = pygame.font.Font(None, 45)
-info_font = pygame.font.Font(None, 32)
+title_font = fonts.get(70)
+score_font = fonts.get(45)
+info_font = fonts.get(32)
 
 cell_size = 20
 number_of_cells = 20
 OFFSET = 75
+STEP_MS = 200  # The snake moves one cell every 200 ms
 
 FOOD_TYPES = {
     'apple': {'image': 'snake_food.png', 'points': 10},
@@ -37,33 +50,36 @@ FOOD_TYPES = {
 }
 
 class PlayerManager:
-    def __init__(self):
-        self.scores_file = 'scores.json'
+    def __init__(self, scores_file=SCORES_DB):
+        self.scores_file = scores_file
         self.load_scores()
     
     def load_scores(self):
-        if os.path.exists(self.scores_file):
-            with open(self.scores_file, 'r') as f:
-                self.scores = json.load(f)
-        else:
-            self.scores = {}
-    
+        # SQLite store (the old scores.json is imported the first time) and the
+        # in-memory leaderboard rebuilt from it
+        self.scoreboard = Scoreboard(self.scores_file)
+
+    @property
+    def scores(self):
+        # Solo records in the old scores.json shape: {"<id>_<name>": {'id', 'name', 'score'}}
+        records = self.scoreboard.leaderboard.scores.get((SOLO, SOLO_LEVEL), {})
+        return {f"{player_id}_{name}": {'id': player_id, 'name': name, 'score': score}
+                for (player_id, name), score in records.items()}
+
     def save_score(self, player_id, player_name, score):
-        player_key = f"{player_id}_{player_name}"
-        if player_key not in self.scores or score > self.scores[player_key]['score']:
-            self.scores[player_key] = {
-                'id': player_id,
-                'name': player_name,
-                'score': score
-            }
-            with open(self.scores_file, 'w') as f:
-                json.dump(self.scores, f, indent=4)
+        # Ranking updated in place; a new record is written by the background writer
+        self.scoreboard.submit(player_id, player_name, score)
     
     def get_player_high_score(self, player_id, player_name):
-        player_key = f"{player_id}_{player_name}"
-        if player_key in self.scores:
-            return self.scores[player_key]['score']
-        return None
+        return self.scoreboard.best(player_id, player_name)
+
+    def get_player_standing(self, player_id, player_name):
+        # (rank, ranked players, percentile) or None
+        return self.scoreboard.standing(player_id, player_name)
+
+    def close(self):
+        # Waits for the pending records to be written
+        self.scoreboard.close()
 
 
 class Food:
@@ -75,15 +91,9 @@ class Food:
         self.load_image()
     
     def load_image(self):
-        try:
-            image_path = FOOD_TYPES[self.food_type]['image']
-            self.surface = pygame.image.load(image_path)
-            self.surface = pygame.transform.scale(self.surface, (cell_size, cell_size))
-        except:
-            # Create a colored circle as fallback
-            self.surface = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
-            color = RED if self.food_type == 'apple' else ORANGE
-            pygame.draw.circle(self.surface, color, (cell_size//2, cell_size//2), cell_size//2)
+        # Shared, display-converted image (or a cached colored circle as fallback)
+        color = RED if self.food_type == 'apple' else ORANGE
+        self.surface = assets.food(FOOD_TYPES[self.food_type]['image'], color, cell_size)
 
     def draw(self, screen):
         food_rec = pygame.Rect(OFFSET + self.position.x * cell_size, 
@@ -111,44 +121,27 @@ class Food:
 class Obstacle:
     def __init__(self, position):
         self.position = position
+        # Brick pattern is rendered once and shared by every obstacle
+        self.surface = assets.brick(cell_size)
     
     def draw(self, screen):
         x = OFFSET + self.position.x * cell_size
         y = OFFSET + self.position.y * cell_size
-        
-        obstacle_rect = pygame.Rect(x, y, cell_size, cell_size)
-        pygame.draw.rect(screen, BRICK_RED, obstacle_rect, border_radius=4)
-        
-        # Add brick pattern
-        brick_height = cell_size // 3
-        brick_width = cell_size // 2
-        
-        pygame.draw.rect(screen, BRICK_DARK, (x, y, brick_width - 1, brick_height - 1))
-        pygame.draw.rect(screen, BRICK_DARK, (x + brick_width, y, brick_width - 1, brick_height - 1))
-        pygame.draw.rect(screen, BRICK_LIGHT, (x, y + brick_height, cell_size, brick_height - 1))
-        pygame.draw.rect(screen, BRICK_DARK, (x, y + 2 * brick_height, brick_width - 1, brick_height))
-        pygame.draw.rect(screen, BRICK_DARK, (x + brick_width, y + 2 * brick_height, brick_width - 1, brick_height))
-        
-        pygame.draw.rect(screen, BRICK_DARK, obstacle_rect, 2, border_radius=4)
+        screen.blit(self.surface, (x, y))
 
 
 class Snake:
     def __init__(self):
         self.snake_body = [Vector2(6, 9), Vector2(5, 9), Vector2(4, 9)]
+        self.prev_body = list(self.snake_body)  # Body at the previous tick (interpolation)
         self.direction = Vector2(1, 0)
         self.add_segment = False
-        try:
-            self.eat_sound = pygame.mixer.Sound("snake_eat.wav")
-            self.wall_hit_sound = pygame.mixer.Sound("snake_collision.wav")
-        except:
-            self.eat_sound = None
-            self.wall_hit_sound = None
-            print("⚠️ Sound files not found")
     
-    def draw(self, screen):
-        for i, seg in enumerate(self.snake_body):
-            seg_rect = pygame.Rect(OFFSET + seg.x * cell_size,
-                                   OFFSET + seg.y * cell_size, 
+    def draw(self, screen, alpha=1.0):
+        # alpha < 1: segments slide from their previous cell towards the current one
+        for i, (x, y) in enumerate(interpolate(self.prev_body, self.snake_body, alpha)):
+            seg_rect = pygame.Rect(round(OFFSET + x * cell_size),
+                                   round(OFFSET + y * cell_size), 
                                    cell_size, cell_size)
             # Head is lighter
             color = SNAKE_HEAD if i == 0 else SNAKE_COLOR
@@ -160,6 +153,7 @@ class Snake:
                 pygame.draw.rect(screen, WHITE, shine_rect, border_radius=3)
 
     def update(self):
+        self.prev_body = list(self.snake_body)
         new_head = self.snake_body[0] + self.direction
         new_head.x = new_head.x % number_of_cells
         new_head.y = new_head.y % number_of_cells
@@ -172,6 +166,7 @@ class Snake:
     
     def reset(self):
         self.snake_body = [Vector2(6, 9), Vector2(5, 9), Vector2(4, 9)]
+        self.prev_body = list(self.snake_body)
         self.direction = Vector2(1, 0)
     
     def check_collision_with_obstacles(self, obstacles):
@@ -182,14 +177,18 @@ class Snake:
 
 
 class Game:
-    def __init__(self, player_id, player_name):
+    def __init__(self, player_id, player_name, scores_file=SCORES_DB):
         self.player_id = player_id
         self.player_name = player_name
-        self.player_manager = PlayerManager()
+        self.player_manager = PlayerManager(scores_file)
+        sounds.load()  # Decoded once, shared by every game
         
         self.snake = Snake()
         self.state = "RUNNING"
         self.score = 0
+        self.standing = None  # Leaderboard position after the last game over
+        self.ticks = 0  # Ticks played in the current game
+        self.history = None  # Game history log (HistoryLog), set by main()
         self.obstacles = self.generate_obstacles()
         self.obstacles_positions = [obs.position for obs in self.obstacles]
         
@@ -214,61 +213,65 @@ class Game:
         
         return obstacles
 
-    def draw(self, screen):
-        self.snake.draw(screen)
+    def draw(self, screen, alpha=1.0):
+        # Obstacles are part of the cached background (see paint_background)
+        self.snake.draw(screen, alpha)
         self.food1.draw(screen)
         self.food2.draw(screen)
-        for obstacle in self.obstacles:
-            obstacle.draw(screen)
 
     def update(self):
         if self.state == "RUNNING":
+            self.ticks += 1
             self.snake.update()
             self.check_collision_with_food()
             self.check_collision_with_tail()
             if self.snake.check_collision_with_obstacles(self.obstacles):
-                self.game_over()
+                self.game_over('obstacle')
     
     def check_collision_with_food(self):
         if self.snake.snake_body[0] == self.food1.position:
             self.food1.position = self.food1.generate_random_pos(self.snake.snake_body)
             self.snake.add_segment = True
             self.score += self.food1.get_points()
-            if self.snake.eat_sound:
-                self.snake.eat_sound.play()
+            sounds.play('eat')
         
         if self.snake.snake_body[0] == self.food2.position:
             self.food2.position = self.food2.generate_random_pos(self.snake.snake_body)
             self.snake.add_segment = True
             self.score += self.food2.get_points()
-            if self.snake.eat_sound:
-                self.snake.eat_sound.play()
+            sounds.play('eat')
 
-    def game_over(self):
+    def game_over(self, cause):
         self.player_manager.save_score(self.player_id, self.player_name, self.score)
+        self.standing = self.player_manager.get_player_standing(self.player_id, self.player_name)
+        if self.history is not None:
+            self.history.append(mode=SOLO, level=SOLO_LEVEL, theme=None,
+                                player_id=str(self.player_id), name=self.player_name,
+                                score=self.score, length=len(self.snake.snake_body),
+                                ticks=self.ticks, duration_ms=self.ticks * STEP_MS, cause=cause)
+        self.ticks = 0
         
         self.snake.reset()
         self.food1.position = self.food1.generate_random_pos(self.snake.snake_body)
         self.food2.position = self.food2.generate_random_pos(self.snake.snake_body)
         self.state = "STOPPED"
         self.score = 0
-        if self.snake.wall_hit_sound:
-            self.snake.wall_hit_sound.play()
+        sounds.play('hit')
 
     def check_collision_with_tail(self):
         headless_body = self.snake.snake_body[1:]        
         if self.snake.snake_body[0] in headless_body:
-            self.game_over()
+            self.game_over('tail')
     
     def draw_game_over(self, screen):
         # Semi-transparent overlay
-        overlay = pygame.Surface((cell_size * number_of_cells, cell_size * number_of_cells))
+        overlay = assets.track(pygame.Surface((cell_size * number_of_cells, cell_size * number_of_cells)))
         overlay.set_alpha(200)
         overlay.fill(BLACK)
         screen.blit(overlay, (OFFSET, OFFSET))
         
         # Game Over text with shadow
-        font = pygame.font.Font(None, 80)
+        font = fonts.get(80)
         shadow_text = font.render('GAME OVER', True, BLACK)
         shadow_rect = shadow_text.get_rect(center=(OFFSET + number_of_cells * cell_size // 2 + 2, 
                                                      OFFSET + number_of_cells * cell_size // 2 - 78))
@@ -280,7 +283,7 @@ class Game:
         screen.blit(text, text_rect)
         
         # Player name
-        name_font = pygame.font.Font(None, 40)
+        name_font = fonts.get(40)
         name_text = name_font.render(f'Player: {self.player_name}', True, WHITE)
         name_rect = name_text.get_rect(center=(OFFSET + number_of_cells * cell_size // 2, 
                                                OFFSET + number_of_cells * cell_size // 2 - 20))
@@ -289,17 +292,25 @@ class Game:
         # High score
         player_high_score = self.player_manager.get_player_high_score(self.player_id, self.player_name)
         if player_high_score:
-            hs_font = pygame.font.Font(None, 38)
+            hs_font = fonts.get(38)
             hs_text = hs_font.render(f'Your Best: {player_high_score} pts', True, GOLD)
             hs_rect = hs_text.get_rect(center=(OFFSET + number_of_cells * cell_size // 2, 
                                               OFFSET + number_of_cells * cell_size // 2 + 30))
             screen.blit(hs_text, hs_rect)
         
+        # Leaderboard position
+        if self.standing:
+            rank, players, percentile = self.standing
+            rank_text = info_font.render(f'Rank {rank}/{players} - percentile {percentile:.0f}', True, WHITE)
+            rank_rect = rank_text.get_rect(center=(OFFSET + number_of_cells * cell_size // 2, 
+                                                   OFFSET + number_of_cells * cell_size // 2 + 62))
+            screen.blit(rank_text, rank_rect)
+        
         # Restart instruction
-        restart_font = pygame.font.Font(None, 34)
+        restart_font = fonts.get(34)
         restart_text = restart_font.render('Press Any Key to Continue', True, WHITE)
         restart_rect = restart_text.get_rect(center=(OFFSET + number_of_cells * cell_size // 2, 
-                                                     OFFSET + number_of_cells * cell_size // 2 + 80))
+                                                     OFFSET + number_of_cells * cell_size // 2 + 100))
         screen.blit(restart_text, restart_rect)
 
 
@@ -308,14 +319,15 @@ def get_player_info():
     screen_temp = pygame.display.set_mode((700, 500))
     pygame.display.set_caption("🐍 Snake Game - Player Info")
     
-    font = pygame.font.Font(None, 48)
-    small_font = pygame.font.Font(None, 32)
+    font = fonts.get(48)
+    small_font = fonts.get(32)
     
     player_id = ""
     player_name = ""
     active_field = "id"
     
-    clock = pygame.time.Clock()
+    # Blocks on input events; the screen is only redrawn when a field changes
+    view = MenuView()
     
     while True:
         # Gradient background
@@ -356,13 +368,13 @@ def get_player_info():
         screen_temp.blit(name_text, (115, 325))
         
         # Instructions
-        instruction_font = pygame.font.Font(None, 26)
+        instruction_font = fonts.get(26)
         start_text = instruction_font.render("Press ENTER to Start | TAB to switch fields", True, (189, 195, 199))
         screen_temp.blit(start_text, (130, 410))
         
         pygame.display.update()
         
-        for event in pygame.event.get():
+        for event in view.events(lambda: (player_id, player_name, active_field)):
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -391,77 +403,90 @@ def get_player_info():
                         player_id += event.unicode
                     elif active_field == "name" and len(player_name) < 20:
                         player_name += event.unicode
-        
-        clock.tick(30)
-
-
-# Get player info
-player_id, player_name = get_player_info()
 
-# Create main game window
-screen = pygame.display.set_mode((2*OFFSET + cell_size * number_of_cells, 
-                                  2*OFFSET + cell_size * number_of_cells))
-pygame.display.set_caption("🐍 Snake Game - Single Player")
 
-game = Game(player_id, player_name)
-clock = pygame.time.Clock()
-running = True
+# Static layers (gradient, border, obstacles, title), rendered once per board
+background = BackgroundLayer()
 
-SNAKE_MOVE_EVENT = pygame.USEREVENT + 1
-pygame.time.set_timer(SNAKE_MOVE_EVENT, 200)
 
-while running:
-    for event in pygame.event.get():
-        if event.type == SNAKE_MOVE_EVENT:
-            game.update()
-
-        if event.type == pygame.KEYDOWN:
-            if game.state == "STOPPED":
-                game.state = "RUNNING"
-
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_UP and game.snake.direction != Vector2(0, 1):
-                game.snake.direction = Vector2(0, -1)
-            if event.key == pygame.K_DOWN and game.snake.direction != Vector2(0, -1):
-                game.snake.direction = Vector2(0, 1)
-            if event.key == pygame.K_LEFT and game.snake.direction != Vector2(1, 0):
-                game.snake.direction = Vector2(-1, 0)
-            if event.key == pygame.K_RIGHT and game.snake.direction != Vector2(-1, 0):
-                game.snake.direction = Vector2(1, 0)
-
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-
-    # Draw gradient background
+def paint_background(surface, game):
+    """Draw everything that does not change during a match"""
+    # Gradient background
     for y in range(2*OFFSET + cell_size * number_of_cells):
         ratio = y / (2*OFFSET + cell_size * number_of_cells)
         r = int(46 + (39 - 46) * ratio)
         g = int(204 + (174 - 204) * ratio)
         b = int(113 + (96 - 113) * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, y), (2*OFFSET + cell_size * number_of_cells, y))
+        pygame.draw.line(surface, (r, g, b), (0, y), (2*OFFSET + cell_size * number_of_cells, y))
     
     # Game border with shadow
-    pygame.draw.rect(screen, BLACK, (OFFSET-7, OFFSET-7, 
-                                      cell_size*number_of_cells+14, 
-                                      cell_size*number_of_cells+14), 
+    pygame.draw.rect(surface, BLACK, (OFFSET-7, OFFSET-7, 
+                                       cell_size*number_of_cells+14, 
+                                       cell_size*number_of_cells+14), 
                      border_radius=10)
-    pygame.draw.rect(screen, BG_DARK, (OFFSET-5, OFFSET-5, 
-                                        cell_size*number_of_cells+10,
-                                        cell_size*number_of_cells+10), 
+    pygame.draw.rect(surface, BG_DARK, (OFFSET-5, OFFSET-5, 
+                                         cell_size*number_of_cells+10,
+                                         cell_size*number_of_cells+10), 
                      5, border_radius=8)
-    
-    game.draw(screen)
 
-    if game.state == "STOPPED":
-        game.draw_game_over(screen)
+    for obstacle in game.obstacles:
+        obstacle.draw(surface)
 
-    # UI with shadows
+    # Title with shadow
     title_shadow = title_font.render("SNAKE GAME", True, BLACK)
     title_surface = title_font.render("SNAKE GAME", True, WHITE)
-    screen.blit(title_shadow, (OFFSET-3, 18))
-    screen.blit(title_surface, (OFFSET-5, 15))
+    surface.blit(title_shadow, (OFFSET-3, 18))
+    surface.blit(title_surface, (OFFSET-5, 15))
+
+
+# Areas redrawn every frame on top of the background (--dirty-rects)
+BOARD_RECT = pygame.Rect(OFFSET, OFFSET, cell_size * number_of_cells, cell_size * number_of_cells)
+UI_RECT = pygame.Rect(0, OFFSET + cell_size * number_of_cells,
+                      2*OFFSET + cell_size * number_of_cells, OFFSET)
+
+
+def frame_signature(game, alpha=1.0):
+    """Everything draw_frame shows; the same signature means nothing to redraw"""
+    # While running, the snake slides a few pixels every frame
+    sub_cell = int(alpha * cell_size) if game.state == "RUNNING" else None
+    return (game.state, game.score, cells_key(game.snake.snake_body), sub_cell,
+            cells_key((game.food1.position, game.food2.position)))
+
+
+def mark_dirty(dirty, game):
+    """Record the areas draw_frame paints over the background"""
+    # A sliding segment covers parts of its previous and current cells
+    dirty.add_cells(game.snake.prev_body, cell_size, OFFSET)
+    dirty.add_cells(game.snake.snake_body, cell_size, OFFSET)
+    dirty.add_cells((game.food1.position, game.food2.position), cell_size, OFFSET)
+    if game.state == "STOPPED":
+        dirty.add(BOARD_RECT)
+    dirty.add(UI_RECT)
+
+
+def draw_frame(screen, game, profiler=NULL_PROFILER, dirty=None, alpha=1.0):
+    """Draw one full frame (without updating the display)
+
+    With a DirtyRects tracker, only the areas drawn in the previous frame
+    are restored from the cached background, and the areas drawn now are
+    recorded for the next display update. alpha is the progress between
+    the last two simulation ticks (1.0 draws the snake on its cells).
+    """
+    key = cells_key(game.obstacles_positions)
+    if dirty is None:
+        background.blit(screen, key, lambda surface: paint_background(surface, game))
+    else:
+        dirty.restore(screen, background.get(key, screen.get_size(),
+                                             lambda surface: paint_background(surface, game)))
+        mark_dirty(dirty, game)
+    profiler.lap('background')
     
+    game.draw(screen, alpha)
+
+    if game.state == "STOPPED":
+        game.draw_game_over(screen)
+    profiler.lap('draw')
+
     # Score display
     score_bg_rect = pygame.Rect(OFFSET-10, OFFSET + cell_size*number_of_cells+5, 200, 50)
     pygame.draw.rect(screen, UI_BG, score_bg_rect, border_radius=8)
@@ -469,8 +494,90 @@ while running:
     screen.blit(score_surface, (OFFSET, OFFSET + cell_size*number_of_cells+15))
     
     # Player name display
-    name_surface = info_font.render(f"Player: {player_name}", True, WHITE)
+    name_surface = info_font.render(f"Player: {game.player_name}", True, WHITE)
     screen.blit(name_surface, (OFFSET + 250, OFFSET + cell_size*number_of_cells+20))
+    profiler.lap('ui')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake - single player")
+    add_profile_arguments(parser)
+    add_hud_argument(parser)
+    add_dirty_argument(parser)
+    add_display_arguments(parser)
+    add_history_argument(parser)
+    args = parser.parse_args()
+    # The overlay (F3) takes the frame laps and forwards them to the profiler
+    profiler = PerfOverlay(create_profiler(args, "snake_game"), visible=args.hud)
+    dirty = create_dirty_rects(args)
+
+    # Get player info
+    player_id, player_name = get_player_info()
+
+    # Create main game window (the game is always drawn at 550x550, then scaled to the window)
+    display = create_framebuffer(args, (2*OFFSET + cell_size * number_of_cells,
+                                        2*OFFSET + cell_size * number_of_cells))
+    screen = display.surface
+    pygame.display.set_caption("🐍 Snake Game - Single Player")
+
+    game = Game(player_id, player_name)
+    game.history = create_history(args)
+    clock = pygame.time.Clock()
+    running = True
+
+    # The snake moves every STEP_MS, whatever the frame rate
+    timestep = FixedTimestep(STEP_MS)
+    elapsed = 0
 
-    pygame.display.update()
-    clock.tick(60)
+    while running:
+        profiler.begin_frame()
+        for event in pygame.event.get():
+            if profiler.handle_event(event):
+                continue
+            if dirty is not None:
+                dirty.handle_event(event)
+
+            if event.type == pygame.KEYDOWN:
+                if game.state == "STOPPED":
+                    game.state = "RUNNING"
+
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_UP and game.snake.direction != Vector2(0, 1):
+                    game.snake.direction = Vector2(0, -1)
+                if event.key == pygame.K_DOWN and game.snake.direction != Vector2(0, -1):
+                    game.snake.direction = Vector2(0, 1)
+                if event.key == pygame.K_LEFT and game.snake.direction != Vector2(1, 0):
+                    game.snake.direction = Vector2(-1, 0)
+                if event.key == pygame.K_RIGHT and game.snake.direction != Vector2(-1, 0):
+                    game.snake.direction = Vector2(1, 0)
+
+            if event.type == pygame.QUIT:
+                game.player_manager.close()
+                if game.history is not None:
+                    game.history.close()
+                pygame.quit()
+                sys.exit()
+
+        profiler.lap('events')
+
+        # Fixed-timestep simulation: late frames catch up on the missed steps
+        for _ in range(timestep.advance(elapsed)):
+            game.update()
+        profiler.lap('update')
+        alpha = timestep.alpha
+
+        if dirty is None:
+            draw_frame(screen, game, profiler, alpha=alpha)
+            display.show(profiler)
+        # Dirty rects: frames where nothing moved (game over screen) are skipped
+        elif dirty.changed((profiler.visible, frame_signature(game, alpha))) or profiler.visible:
+            draw_frame(screen, game, profiler, dirty, alpha)
+            display.show(profiler, dirty)
+        profiler.lap('display')
+        elapsed = clock.tick(60)
+        profiler.lap('wait')
+        profiler.end_frame()
+
+
+if __name__ == "__main__":
+    main()
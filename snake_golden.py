@@ -0,0 +1,351 @@
+# Ce fichier implémente le contrôle de non-régression visuelle des rendus (images de référence).
+# - Des scènes fixes (graine aléatoire, horloge des animations et particules figées) sont
+#   dessinées sans fenêtre (SDL_VIDEODRIVER=dummy) pour chaque mode : tous les thèmes
+#   premium, serpents longs, particules, niveaux de qualité, écran de game over,
+#   déplacement interpolé, client réseau avec 4 bots (aussi après le pygame.quit() de
+#   la fenêtre de connexion)
+# - Chaque image est comparée à sa référence du dossier golden/ : un pixel est différent
+#   si l'une de ses composantes s'écarte de plus de TOLERANCE ; la scène échoue au-delà
+#   de MAX_DIFF_PIXELS pixels différents (petites variations d'anticipation des polices
+#   d'une version de SDL à l'autre)
+# - Les scènes des modes locaux sont aussi rendues par zones modifiées (--dirty-rects),
+#   frame après frame : le résultat doit être identique à la même référence
+# - En cas d'échec, une image de diagnostic est écrite dans golden_diff/ :
+#   référence | rendu | pixels différents en rouge
+#
+# Utilisation :
+#   python snake_golden.py              # compare, code de sortie 1 en cas d'échec
+#   python snake_golden.py --update     # réécrit les références (après un changement voulu)
+#   python snake_golden.py --only premium
+
+import os
+
+# Pilotes factices AVANT l'import de pygame (les modules de jeu appellent pygame.init())
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse  # Options de la ligne de commande
+import random  # Graine fixe de chaque scène
+import sys
+import tempfile  # Base de scores jetable (les scènes ne touchent pas scores.db)
+
+import pygame
+from pygame.math import Vector2
+
+import snake_game
+import snake_server
+import snake_2players_local
+import snake_client
+import hamachi_server
+from snake_benchmark import OfflineNetwork, long_snake
+from snake_dirty import DirtyRects
+from snake_quality import QUALITY_TIERS, TIER_NAMES
+from snake_leaderboard import Scoreboard
+from snake_text import fonts
+
+# Dossiers des références et des images de diagnostic
+GOLDEN_DIR = "golden"
+DIFF_DIR = "golden_diff"
+# Écart maximal d'une composante (0-255) pour que deux pixels soient considérés égaux
+TOLERANCE = 8
+# Nombre maximal de pixels différents par scène
+MAX_DIFF_PIXELS = 64
+# Taille de l'écran de jeu (identique dans tous les modes)
+SIZE = 2 * snake_game.OFFSET + snake_game.cell_size * snake_game.number_of_cells
+# Horloge des animations de la version premium (pulsation de la nourriture)
+NOW_MS = 1234
+# Dossier temporaire des bases de scores de la scène en cours (créé et supprimé par render)
+scores_dir = None
+# Records ouverts par la scène en cours (threads d'écriture arrêtés avant la suppression du dossier)
+scoreboards = []
+
+
+# ============================================================================
+# SCÈNES
+# ============================================================================
+
+def play(screen, game, draw, dirty, frames, alpha=1.0, update=True):
+    """
+    Joue frames frames puis dessine l'image finale
+    Avec dirty, chaque frame est dessinée par zones modifiées (comme avec --dirty-rects) ;
+    sans, seule l'image finale est dessinée (rendu complet)
+    """
+    for frame in range(frames):
+        if update:
+            game.update()
+        if hasattr(game, 'animate'):
+            game.animate(1 / 60)
+        if dirty is not None:
+            draw(screen, game, dirty=dirty, alpha=(frame + 1) / frames)
+            dirty.update()
+    draw(screen, game, dirty=dirty, alpha=alpha)
+
+
+def solo_game(player_name="Golden"):
+    random.seed(1)
+    game = snake_game.Game("golden", player_name, os.path.join(scores_dir, "scores.db"))
+    scoreboards.append(game.player_manager)
+    return game
+
+
+def stretch(snake, length):
+    """Serpent de length segments immobile (corps précédent = corps courant)"""
+    long_snake(snake, length)
+    snake.prev_body = list(snake.snake_body)
+
+
+def premium_game(theme_key, quality='high'):
+    random.seed(1)
+    game = snake_server.Game("Golden", 3, theme_key)
+    game.particles = snake_server.create_particle_pool(seed=1)
+    game.quality = QUALITY_TIERS[TIER_NAMES.index(quality)]
+    return game
+
+
+def premium_draw(screen, game, dirty=None, alpha=1.0):
+    snake_server.draw_frame(screen, game, dirty=dirty, alpha=alpha, now_ms=NOW_MS)
+
+
+def sparks(game):
+    """Gerbes de particules sur la tête et les deux nourritures"""
+    for position, color in ((game.snake.snake_body[0], snake_server.RED),
+                            (game.food1.position, snake_server.RED),
+                            (game.food2.position, snake_server.ORANGE)):
+        game.particles.emit(snake_server.OFFSET + position.x * snake_server.cell_size + 10,
+                            snake_server.OFFSET + position.y * snake_server.cell_size + 10,
+                            color, game.quality['particles'])
+
+
+def local_game(p1_color='teal', p2_color='red'):
+    random.seed(1)
+    return snake_2players_local.TwoPlayerGame("Golden 1", "Golden 2", p1_color, p2_color, 3)
+
+
+def scene_solo_start(screen, dirty):
+    game = solo_game()
+    play(screen, game, snake_game.draw_frame, dirty, 4)
+
+
+def scene_solo_interpolated(screen, dirty):
+    game = solo_game()
+    play(screen, game, snake_game.draw_frame, dirty, 3, alpha=0.5)
+
+
+def scene_solo_long(screen, dirty):
+    game = solo_game()
+    stretch(game.snake, 150)
+    game.score = 1230
+    play(screen, game, snake_game.draw_frame, dirty, 2, update=False)
+
+
+def scene_solo_game_over(screen, dirty):
+    game = solo_game()
+    game.player_manager.save_score("a", "Ana", 80)
+    game.player_manager.save_score("b", "Bob", 30)
+    game.score = 45
+    play(screen, game, snake_game.draw_frame, dirty, 2)
+    game.game_over('tail')
+    play(screen, game, snake_game.draw_frame, dirty, 1, update=False)
+
+
+def premium_theme_scene(theme_key):
+    def scene(screen, dirty):
+        game = premium_game(theme_key)
+        stretch(game.snake, 60)
+        game.score = 375
+        sparks(game)
+        play(screen, game, premium_draw, dirty, 6, update=False)
+    return scene
+
+
+def premium_quality_scene(quality):
+    def scene(screen, dirty):
+        game = premium_game('galaxy', quality)
+        play(screen, game, premium_draw, dirty, 3)
+        sparks(game)
+        play(screen, game, premium_draw, dirty, 4, alpha=0.5)
+    return scene
+
+
+def scene_premium_long(screen, dirty):
+    game = premium_game('neon')
+    stretch(game.snake, 200)
+    play(screen, game, premium_draw, dirty, 2, update=False)
+
+
+def scene_premium_game_over(screen, dirty):
+    game = premium_game('sunset')
+    game.scoreboard = Scoreboard(os.path.join(scores_dir, "scores.db"), 'premium', 3)
+    scoreboards.append(game.scoreboard)
+    game.scoreboard.submit("", "Ana", 300)
+    game.score = 120
+    play(screen, game, premium_draw, dirty, 2)
+    game.game_over('tail')
+    play(screen, game, premium_draw, dirty, 1, update=False)
+
+
+def scene_local_start(screen, dirty):
+    game = local_game()
+    play(screen, game, snake_2players_local.draw_frame, dirty, 4)
+
+
+def scene_local_long(screen, dirty):
+    game = local_game('purple', 'blue')
+    stretch(game.snake1, 100)
+    game.snake2.snake_body = [Vector2(x, 15) for x in range(18, 2, -1)]
+    game.snake2.prev_body = list(game.snake2.snake_body)
+    game.score1, game.score2 = 250, 160
+    play(screen, game, snake_2players_local.draw_frame, dirty, 2, update=False)
+
+
+def scene_network(screen, dirty):
+    """Client réseau : état d'un serveur local à 4 bots, sérialisé en JSON"""
+    random.seed(1)
+    server = hamachi_server.HamachiSnakeServer(min_players=4)
+    server.fill_bot_slots()
+    for _ in range(40):
+        server.tick()
+    network = OfflineNetwork(next(iter(server.clients)))
+    client = snake_client.MultiplayerGame(network, "Golden")
+    network.feed(server)
+    client.draw()
+    # Le client dessine dans sa propre fenêtre (de même taille), que render() copie
+
+
+def scene_network_reconnect(screen, dirty):
+    """
+    Client réseau lancé comme par main() : la fenêtre de connexion charge ses polices puis
+    appelle pygame.quit() avant que le jeu ne relance pygame.init()
+    """
+    for size in (48, 32, 24):
+        fonts.get(size).render("Connect", True, (255, 255, 255))
+    pygame.quit()
+    scene_network(screen, dirty)
+
+
+# Nom -> (fonction de la scène, rendu par zones modifiées possible)
+SCENES = {
+    'solo_start': (scene_solo_start, True),
+    'solo_interpolated': (scene_solo_interpolated, True),
+    'solo_long': (scene_solo_long, True),
+    'solo_game_over': (scene_solo_game_over, True),
+    **{f'premium_{theme}': (premium_theme_scene(theme), True) for theme in snake_server.COLOR_THEMES},
+    **{f'premium_quality_{tier}': (premium_quality_scene(tier), True) for tier in TIER_NAMES},
+    'premium_long': (scene_premium_long, True),
+    'premium_game_over': (scene_premium_game_over, True),
+    'local_start': (scene_local_start, True),
+    'local_long': (scene_local_long, True),
+    'network': (scene_network, False),
+    'network_reconnect': (scene_network_reconnect, False),
+}
+
+
+# ============================================================================
+# COMPARAISON
+# ============================================================================
+
+def render(name, dirty=False):
+    """
+    Dessine une scène
+    Returns:
+        pygame.Surface: Copie de l'image (SIZE x SIZE)
+    """
+    global scores_dir
+    scene, _ = SCENES[name]
+    screen = pygame.display.set_mode((SIZE, SIZE))
+    screen.fill((0, 0, 0))
+    with tempfile.TemporaryDirectory(prefix="snake_golden_") as scores_dir:
+        try:
+            scene(screen, DirtyRects() if dirty else None)
+        finally:
+            while scoreboards:
+                scoreboards.pop().close()
+    scores_dir = None
+    return pygame.display.get_surface().copy()
+
+
+def difference_mask(expected, actual, tolerance=TOLERANCE):
+    """
+    Pixels dont une composante s'écarte de plus de tolerance
+    Returns:
+        pygame.mask.Mask
+    """
+    # |a - b| par composante : (a - b) et (b - a) saturés à 0, puis le maximum des deux
+    absolute = expected.copy()
+    absolute.blit(actual, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    reverse = actual.copy()
+    reverse.blit(expected, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    absolute.blit(reverse, (0, 0), special_flags=pygame.BLEND_RGB_MAX)
+    same = pygame.mask.from_threshold(absolute, (0, 0, 0), (tolerance + 1,) * 3 + (255,))
+    same.invert()
+    return same
+
+
+def write_diff(path, expected, actual, mask):
+    """Image de diagnostic : référence | rendu | pixels différents en rouge sur le rendu assombri"""
+    width, height = expected.get_size()
+    sheet = pygame.Surface((3 * width, height))
+    sheet.blit(expected, (0, 0))
+    sheet.blit(actual, (width, 0))
+    sheet.blit(actual, (2 * width, 0))
+    sheet.fill((96, 96, 96), pygame.Rect(2 * width, 0, width, height), special_flags=pygame.BLEND_RGB_MULT)
+    sheet.blit(mask.to_surface(setcolor=(255, 0, 0), unsetcolor=None), (2 * width, 0))
+    pygame.image.save(sheet, path)
+
+
+def check(name, dirty, update, tolerance, max_diff):
+    """
+    Compare (ou réécrit avec update) l'image d'une scène
+    Returns:
+        tuple: (réussite, message)
+    """
+    label = f"{name} [dirty]" if dirty else name
+    path = os.path.join(GOLDEN_DIR, f"{name}.png")
+    actual = render(name, dirty)
+    if update:
+        pygame.image.save(actual, path)
+        return True, f"{label}: updated"
+    if not os.path.exists(path):
+        return False, f"{label}: missing reference {path} (run with --update)"
+    expected = pygame.image.load(path).convert()
+    if expected.get_size() != actual.get_size():
+        return False, f"{label}: size {actual.get_size()} != {expected.get_size()}"
+    mask = difference_mask(expected, actual, tolerance)
+    count = mask.count()
+    if count <= max_diff:
+        return True, f"{label}: ok ({count} px)"
+    os.makedirs(DIFF_DIR, exist_ok=True)
+    diff_path = os.path.join(DIFF_DIR, f"{name}{'_dirty' if dirty else ''}.png")
+    write_diff(diff_path, expected, actual, mask)
+    return False, f"{label}: {count} px differ -> {diff_path}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake - contrôle des rendus par images de référence")
+    parser.add_argument('--update', action='store_true',
+                        help="Réécrit les images de référence au lieu de comparer")
+    parser.add_argument('--only', metavar='TEXTE', help="Seulement les scènes dont le nom contient TEXTE")
+    parser.add_argument('--tolerance', type=int, default=TOLERANCE,
+                        help="Écart maximal d'une composante de couleur (0-255)")
+    parser.add_argument('--max-diff', type=int, default=MAX_DIFF_PIXELS,
+                        help="Nombre maximal de pixels différents par scène")
+    args = parser.parse_args()
+
+    pygame.init()
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    names = [name for name in SCENES if args.only is None or args.only in name]
+    failures = 0
+    for name in names:
+        # Rendu complet, puis rendu par zones modifiées (comparé à la même référence)
+        for dirty in (False, True):
+            if dirty and (args.update or not SCENES[name][1]):
+                continue
+            ok, message = check(name, dirty, args.update, args.tolerance, args.max_diff)
+            failures += not ok
+            print(("  " if ok else "! ") + message)
+    print(f"{len(names)} scenes, {failures} failures")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+# Ce fichier implémente l'historique de toutes les parties terminées (tous les modes).
+# Avant, seule la base des records (snake_scores) gardait une trace des parties : le meilleur
+# score de chaque joueur, sans le niveau, le thème, la durée, la longueur ni la cause de mort.
+# Maintenant, chaque partie terminée est ajoutée à un journal (append-only) :
+# - une ligne JSON compacte par partie (tableau de valeurs dans l'ordre de FIELDS)
+# - les parties sont gardées en mémoire puis écrites par lots (FLUSH_RECORDS parties ou
+#   FLUSH_SECONDS secondes) en un seul write ; fsync au plus toutes les FSYNC_SECONDS
+# - les écritures, fsync, rotations et compressions se font sur un thread dédié : la
+#   boucle de jeu ne fait que déposer la ligne, sans jamais attendre le disque
+# - quand le fichier courant dépasse SEGMENT_BYTES, il devient un segment numéroté
+#   compressé (gzip) : history-000001.jsonl.gz, history-000002.jsonl.gz...
+# - les statistiques (moyennes par joueur, causes de mort par niveau) lisent le journal
+#   ligne par ligne, segment après segment : rien n'est chargé en entier
+# Une ligne incomplète (arrêt brutal pendant une écriture) est ignorée à la lecture.
+#
+# Utilisation :
+#   python snake_history.py                # statistiques du dossier history/
+#   python snake_history.py --mode premium
+
+import argparse  # Options de la ligne de commande
+import atexit  # Parties en attente écrites à la sortie du programme
+import gzip  # Compression des segments
+import json
+import os
+import shutil  # Copie du fichier courant vers le segment compressé
+import threading  # Thread d'écriture (et parties terminées sur plusieurs threads)
+import time
+from collections import Counter
+
+# Dossier du journal
+HISTORY_DIR = "history"
+# Fichier courant (les nouvelles parties y sont ajoutées)
+CURRENT_FILE = "history.jsonl"
+# Taille du fichier courant avant rotation en segment compressé (octets)
+SEGMENT_BYTES = 1 << 20
+# Parties gardées en mémoire avant écriture
+FLUSH_RECORDS = 32
+# Délai maximal avant l'écriture d'une partie terminée (secondes)
+FLUSH_SECONDS = 2.0
+# Délai minimal entre deux fsync (secondes) ; toujours un fsync à la fermeture
+FSYNC_SECONDS = 30.0
+
+# Colonnes d'une ligne (de nouvelles colonnes ne peuvent être ajoutées qu'à la fin)
+FIELDS = ('time', 'mode', 'level', 'theme', 'player_id', 'name',
+          'score', 'length', 'ticks', 'duration_ms', 'cause')
+
+
+def segment_name(number):
+    return f"history-{number:06d}.jsonl"
+
+
+def segment_number(filename):
+    """Numéro d'un segment (history-000012.jsonl[.gz]), None pour les autres fichiers"""
+    if not filename.startswith("history-"):
+        return None
+    digits = filename[len("history-"):].split('.', 1)[0]
+    return int(digits) if digits.isdigit() else None
+
+
+class HistoryLog:
+    """
+    Journal des parties terminées
+    append() ne fait que garder la ligne en mémoire (sans accès disque) ; un thread dédié
+    écrit les lignes par lots, fait les fsync, la rotation et la compression des segments.
+    Utilisation :
+        history = HistoryLog()
+        history.append(mode='solo', level=0, player_id="12", name="malek", score=45,
+                       length=7, ticks=120, duration_ms=24000, cause='tail')
+        history.close()    # à la fermeture : écrit tout, avec fsync
+    """
+
+    def __init__(self, directory=HISTORY_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.current = os.path.join(directory, CURRENT_FILE)
+        self._pending = []        # Lignes pas encore écrites
+        self._oldest = None       # Instant de la plus ancienne ligne en attente
+        self._last_fsync = time.monotonic()
+        self._condition = threading.Condition()
+        self._closed = False
+        # Un seul lot écrit à la fois (thread d'écriture, flush et records), dans l'ordre
+        self._write_lock = threading.Lock()
+        self.written = 0          # Parties écrites (statistique)
+        self._writer = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._writer.start()
+        # Fenêtre fermée autrement que par la croix : les parties en attente sont écrites
+        atexit.register(self.close)
+
+    def append(self, **record):
+        """Ajoute une partie (colonnes de FIELDS ; 'time' vaut maintenant par défaut)"""
+        record.setdefault('time', round(time.time(), 3))
+        line = json.dumps([record.get(field) for field in FIELDS], separators=(',', ':'))
+        with self._condition:
+            self._pending.append(line + '\n')
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+                self._condition.notify()  # Le thread attend la fin du délai de ce lot
+            if len(self._pending) >= FLUSH_RECORDS:
+                self._condition.notify()
+
+    def _due(self):
+        """Lot à écrire : FLUSH_RECORDS parties, FLUSH_SECONDS écoulées ou fermeture"""
+        return (self._closed or len(self._pending) >= FLUSH_RECORDS or
+                (self._oldest is not None and
+                 time.monotonic() - self._oldest >= FLUSH_SECONDS))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._due():
+                    timeout = (None if self._oldest is None else
+                               self._oldest + FLUSH_SECONDS - time.monotonic())
+                    self._condition.wait(timeout)
+                closed = self._closed
+            self.flush(sync=closed)
+            if closed:
+                break
+
+    def flush(self, sync=False):
+        """Écrit tout de suite les parties en attente (attend la fin de l'écriture)"""
+        with self._write_lock:
+            with self._condition:
+                lines, self._pending, self._oldest = self._pending, [], None
+            try:
+                self._flush(lines, sync)
+            except OSError as error:
+                print(f"History not saved yet: {error}")
+                with self._condition:
+                    # Remises en tête de la file pour le lot suivant
+                    self._pending[:0] = lines
+                    if self._oldest is None and self._pending:
+                        self._oldest = time.monotonic()
+
+    def close(self, timeout=5.0):
+        """Écrit les parties en attente, force leur écriture sur disque et arrête le thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._writer.is_alive() and threading.current_thread() is not self._writer:
+            self._writer.join(timeout)
+        # Parties ajoutées après l'arrêt du thread
+        self.flush(sync=True)
+
+    def _flush(self, lines, sync=False):
+        if not lines:
+            return
+        # Fichier ouvert à chaque lot : après une rotation par un autre processus, le lot
+        # suivant va bien dans le nouveau fichier courant
+        with open(self.current, 'a', encoding='utf-8') as f:
+            f.write(''.join(lines))
+            f.flush()
+            now = time.monotonic()
+            if sync or now - self._last_fsync >= FSYNC_SECONDS:
+                os.fsync(f.fileno())
+                self._last_fsync = now
+            size = f.tell()
+        self.written += len(lines)
+        if size >= SEGMENT_BYTES:
+            self._rotate()
+
+    def _rotate(self):
+        """Le fichier courant devient le segment suivant, puis il est compressé"""
+        number = max(self._segment_numbers(), default=0) + 1
+        while True:
+            target = os.path.join(self.directory, segment_name(number))
+            try:
+                # link échoue si le segment existe (autre processus plus rapide) : pas d'écrasement
+                os.link(self.current, target)
+                break
+            except FileExistsError:
+                number += 1
+            except FileNotFoundError:
+                return  # Déjà renommé par un autre processus
+        os.unlink(self.current)
+        self._compact()
+
+    def _compact(self):
+        """Compresse les segments fermés (y compris ceux laissés par un arrêt brutal)"""
+        for filename in sorted(os.listdir(self.directory)):
+            if segment_number(filename) is None or not filename.endswith('.jsonl'):
+                continue
+            path = os.path.join(self.directory, filename)
+            partial = path + '.gz.tmp'
+            with open(path, 'rb') as source, gzip.open(partial, 'wb') as target:
+                shutil.copyfileobj(source, target)
+                target.flush()
+            with open(partial, 'rb') as f:
+                os.fsync(f.fileno())
+            os.replace(partial, path + '.gz')
+            os.unlink(path)
+
+    def _segment_numbers(self):
+        return [number for number in map(segment_number, os.listdir(self.directory))
+                if number is not None]
+
+    def segments(self):
+        """Fichiers du journal, du plus ancien au plus récent (fichier courant en dernier)"""
+        names = [name for name in os.listdir(self.directory)
+                 if segment_number(name) is not None and not name.endswith('.tmp')]
+        names.sort(key=lambda name: (segment_number(name), name.endswith('.gz')))
+        paths = []
+        for name in names:
+            # Segment compressé et non compressé (compression interrompue) : un seul des deux
+            if name.endswith('.gz') and name[:-3] in names:
+                continue
+            paths.append(os.path.join(self.directory, name))
+        if os.path.exists(self.current):
+            paths.append(self.current)
+        return paths
+
+    def records(self):
+        """
+        Parcourt toutes les parties, de la plus ancienne à la plus récente (une ligne à la fois)
+        Les parties encore en attente d'écriture sont incluses.
+        Yields:
+            dict: Colonnes de FIELDS
+        """
+        self.flush()
+        for path in self.segments():
+            opener = gzip.open if path.endswith('.gz') else open
+            with opener(path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        values = json.loads(line)
+                    except ValueError:
+                        continue  # Ligne incomplète (arrêt pendant une écriture)
+                    yield dict(zip(FIELDS, values))
+
+
+def player_averages(records):
+    """
+    Moyennes par joueur (une seule passe, mémoire proportionnelle au nombre de joueurs)
+    Returns:
+        dict: (identifiant, nom) -> {'games', 'score', 'length', 'duration_ms'} (moyennes)
+    """
+    totals = {}
+    for record in records:
+        total = totals.setdefault((record['player_id'], record['name']), [0, 0, 0, 0])
+        total[0] += 1
+        total[1] += record['score'] or 0
+        total[2] += record['length'] or 0
+        total[3] += record['duration_ms'] or 0
+    return {player: {'games': games, 'score': score / games, 'length': length / games,
+                     'duration_ms': duration / games}
+            for player, (games, score, length, duration) in totals.items()}
+
+
+def death_causes(records):
+    """
+    Causes de fin de partie par mode et niveau
+    Returns:
+        dict: (mode, niveau) -> Counter {cause: nombre de parties}
+    """
+    causes = {}
+    for record in records:
+        causes.setdefault((record['mode'], record['level']), Counter())[record['cause']] += 1
+    return causes
+
+
+def create_history(args):
+    """
+    Returns:
+        HistoryLog du dossier history/, ou None avec --no-history (aucun journal)
+    """
+    if args.no_history:
+        return None
+    return HistoryLog(HISTORY_DIR)
+
+
+def add_history_argument(parser):
+    """Ajoute l'option --no-history à un argparse.ArgumentParser"""
+    parser.add_argument('--no-history', action='store_true',
+                        help="N'ajoute pas les parties terminées à l'historique (history/)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake - statistiques de l'historique des parties")
+    parser.add_argument('--dir', default=HISTORY_DIR, help="Dossier du journal")
+    parser.add_argument('--mode', help="Seulement ce mode (solo, premium, local, network)")
+    args = parser.parse_args()
+    history = HistoryLog(args.dir)
+
+    def selected():
+        return (record for record in history.records()
+                if args.mode is None or record['mode'] == args.mode)
+
+    print("Moyennes par joueur :")
+    averages = player_averages(selected())
+    for (player_id, name), stats in sorted(averages.items(), key=lambda item: -item[1]['score']):
+        print(f"  {name} ({player_id or '-'}) : {stats['games']} parties, score {stats['score']:.1f}, "
+              f"longueur {stats['length']:.1f}, durée {stats['duration_ms'] / 1000:.1f} s")
+    print("Causes de fin de partie :")
+    for (mode, level), counter in sorted(death_causes(selected()).items(), key=str):
+        causes = ', '.join(f"{cause} {count}" for cause, count in counter.most_common())
+        print(f"  {mode} niveau {level} : {causes}")
+
+
+if __name__ == "__main__":
+    main()
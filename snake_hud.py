@@ -0,0 +1,278 @@
+# Ce fichier implémente l'overlay de performances affiché en jeu (touche F3).
+# - Temps de frame (actuel, moyenne, p99) et petit graphique déroulant
+# - Temps de mise à jour (update) et de dessin (draw) séparés
+# - Nombre de particules vivantes et niveau de qualité des effets (mode premium)
+# - Nombre de Surfaces créées par le jeu pendant la frame précédente (textes et images)
+# - Client réseau : fréquence de réception des états et âge du dernier état
+# L'overlay reçoit les mêmes "laps" que le profileur (snake_profiler) et les lui transmet :
+# les boucles de jeu n'ont qu'un seul objet à appeler.
+# Pour ne pas fausser ses propres mesures :
+# - les textes ne sont re-rendus que si leur contenu change, 4 fois par seconde au plus, avec
+#   un petit cache propre (une entrée par ligne) : les temps de frame, toujours différents,
+#   ne passent pas par le cache de textes partagé (snake_text), où ils évinceraient les
+#   textes des menus et des scores et fausseraient son compteur d'échecs
+# - le compteur de Surfaces ne fait que lire les compteurs du cache de textes et du gestionnaire
+#   d'images, et ne compte pas les allocations de l'overlay lui-même
+
+import time  # Horloge monotone (mêmes unités que le profileur)
+from collections import deque  # Historique glissant des temps de frame
+
+import pygame
+
+from snake_assets import assets
+from snake_profiler import NULL_PROFILER
+from snake_text import fonts
+
+# Phases (noms des laps) comptées comme "update" ou comme "draw"
+UPDATE_PHASES = ('update', 'bot')
+DRAW_PHASES = ('state', 'background', 'draw', 'ui', 'display')
+# Nombre de frames conservées pour le graphique et les statistiques
+HISTORY = 120
+# Intervalle minimal entre deux rafraîchissements des textes (secondes)
+TEXT_REFRESH = 0.25
+# Couleurs de l'overlay
+PANEL_COLOR = (0, 0, 0, 170)
+TEXT_COLOR = (236, 240, 241)
+GRAPH_COLOR = (46, 204, 113)
+BUDGET_COLOR = (231, 76, 60)
+# Hauteur d'une ligne de texte et du graphique (pixels)
+LINE_HEIGHT = 18
+GRAPH_HEIGHT = 40
+# Budget d'une frame à 60 FPS (ligne rouge du graphique)
+FRAME_BUDGET_MS = 1000.0 / 60
+
+
+class SurfaceCounter:
+    """
+    Compte les Surfaces créées par le jeu
+    Rien n'est remplacé dans pygame : chaque point de création du jeu tient son compteur
+    - textes rendus : échecs (misses) du cache de textes partagé (snake_text.fonts)
+    - autres Surfaces : assets.created (images, variantes, couches statiques, sprites,
+      voiles de game over, voir AssetManager.track)
+    Les Surfaces que pygame crée ailleurs (copy(), subsurface()...) ne sont pas comptées.
+    """
+
+    def __init__(self):
+        self.paused = False  # True pendant le dessin de l'overlay
+        self._total = self._created()  # Compteurs au dernier take()
+        self._paused_total = 0  # Compteurs au début de la pause
+        self._ignored = 0  # Surfaces créées par l'overlay lui-même
+
+    @staticmethod
+    def _created():
+        return fonts.misses + assets.created
+
+    def pause(self):
+        """Ignore les allocations jusqu'à resume() (dessin de l'overlay)"""
+        self.paused = True
+        self._paused_total = self._created()
+
+    def resume(self):
+        self.paused = False
+        self._ignored += self._created() - self._paused_total
+
+    def take(self):
+        """Renvoie le nombre d'allocations depuis le dernier appel et remet à zéro"""
+        total = self._created()
+        count = total - self._total - self._ignored
+        self._total = total
+        self._ignored = 0
+        return count
+
+
+class PerfOverlay:
+    """
+    Overlay de performances, utilisable à la place du profileur dans les boucles :
+        profiler = PerfOverlay(create_profiler(args, ...))
+        profiler.begin_frame() / profiler.lap(...) / profiler.end_frame()
+        profiler.handle_event(event)        # F3 : afficher / masquer
+        profiler.draw(screen, particles=N)  # juste avant pygame.display.update()
+    """
+
+    def __init__(self, profiler=NULL_PROFILER, visible=False, position=None):
+        """
+        Args:
+            profiler: Profileur auquel les laps sont transmis (NULL_PROFILER par défaut)
+            visible: Overlay affiché dès le départ (option --hud)
+            position: Coin haut-gauche du panneau (par défaut : coin haut-droit de l'écran)
+        """
+        self.profiler = profiler
+        self.enabled = True
+        self.visible = False
+        self.position = position
+        self.counter = SurfaceCounter()
+        self.frame_ms = deque(maxlen=HISTORY)
+        self.update_ms = deque(maxlen=HISTORY)
+        self.draw_ms = deque(maxlen=HISTORY)
+        self.allocations = 0  # Surfaces allouées pendant la frame précédente
+        self._frame_start = None
+        self._last = None
+        self._update_ns = 0
+        self._draw_ns = 0
+        # Rendu : textes (cache propre, une entrée par ligne) et panneau préalloué
+        self.lines = []
+        self._texts = {}  # Numéro de ligne -> (texte, Surface)
+        self._next_text = 0.0
+        self.panel = None
+        self.rect = None  # Zone occupée par le panneau à la dernière frame (rendu --dirty-rects)
+        self.set_visible(visible)
+
+    # ------------------------------------------------------------------
+    # Interface du profileur
+    # ------------------------------------------------------------------
+
+    def begin_frame(self):
+        now = time.perf_counter_ns()
+        if self._frame_start is not None:
+            self.frame_ms.append((now - self._frame_start) / 1e6)
+        self._frame_start = now
+        self._last = now
+        self._update_ns = 0
+        self._draw_ns = 0
+        self.allocations = self.counter.take()
+        self.profiler.begin_frame()
+
+    def lap(self, phase):
+        now = time.perf_counter_ns()
+        if self._last is not None:
+            if phase in UPDATE_PHASES:
+                self._update_ns += now - self._last
+            elif phase in DRAW_PHASES:
+                self._draw_ns += now - self._last
+        self._last = now
+        self.profiler.lap(phase)
+
+    def end_frame(self):
+        self.update_ms.append(self._update_ns / 1e6)
+        self.draw_ms.append(self._draw_ns / 1e6)
+        self.profiler.end_frame()
+
+    def finish(self):
+        self.profiler.finish()
+
+    # ------------------------------------------------------------------
+    # Affichage
+    # ------------------------------------------------------------------
+
+    def set_visible(self, visible):
+        """Affiche/masque l'overlay"""
+        self.visible = visible
+        if visible:
+            self.counter.take()  # Repart de zéro (allocations faites pendant que l'overlay était masqué)
+            self._next_text = 0.0
+
+    def handle_event(self, event):
+        """
+        F3 : bascule l'overlay
+        Returns:
+            bool: True si l'événement a été consommé
+        """
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.set_visible(not self.visible)
+            return True
+        return False
+
+    def text(self, index, content):
+        """Surface de la ligne index, re-rendue seulement si son contenu a changé"""
+        cached = self._texts.get(index)
+        if cached is None or cached[0] != content:
+            # Police du registre, mais rendu direct : hors du cache de textes partagé
+            cached = (content, fonts.get(20).font.render(content, True, TEXT_COLOR))
+            self._texts[index] = cached
+        return cached[1]
+
+    def build_lines(self, particles, network, quality=None):
+        """Textes de l'overlay (recalculés au plus TEXT_REFRESH fois par seconde)"""
+        frames = list(self.frame_ms)
+        if frames:
+            ordered = sorted(frames)
+            current = frames[-1]
+            average = sum(frames) / len(frames)
+            p99 = ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+        else:
+            current = average = p99 = 0.0
+        update = sum(self.update_ms) / len(self.update_ms) if self.update_ms else 0.0
+        draw = sum(self.draw_ms) / len(self.draw_ms) if self.draw_ms else 0.0
+        fps = 1000.0 / average if average else 0.0
+        lines = [
+            f"frame {current:5.1f}  moy {average:5.1f}  p99 {p99:5.1f} ms",
+            f"{fps:4.0f} FPS  update {update:4.1f}  draw {draw:4.1f} ms",
+            f"surfaces/frame {self.allocations}",
+        ]
+        if particles is not None:
+            lines.append(f"particules {particles}")
+        if quality is not None:
+            lines.append(f"qualite {quality.name} ({'auto' if quality.auto else 'fixe'})")
+        if network is not None:
+            rate, age = snapshot_stats(network)
+            lines.append(f"etats {rate:4.1f}/s  age {age:5.0f} ms")
+        return lines
+
+    def draw(self, screen, particles=None, network=None, quality=None):
+        """
+        Dessine l'overlay (si visible) et enregistre le lap 'hud'
+        Args:
+            screen: Surface de la fenêtre
+            particles: Nombre de particules vivantes (None si le mode n'en a pas)
+            network: NetworkClient (fréquence et âge des états reçus)
+            quality: QualityController (niveau des effets du mode premium)
+        """
+        self.rect = None
+        if self.visible:
+            self.counter.pause()
+            now = time.perf_counter()
+            if now >= self._next_text:
+                self.lines = [self.text(index, line) for index, line
+                              in enumerate(self.build_lines(particles, network, quality))]
+                self._next_text = now + TEXT_REFRESH
+            self.draw_panel(screen)
+            self.counter.resume()
+        self.lap('hud')
+
+    def draw_panel(self, screen):
+        """Panneau semi-transparent, textes et graphique des temps de frame"""
+        # Assez large pour une barre de 2 pixels par frame de l'historique
+        width = max([2 * HISTORY + 12] + [line.get_width() + 12 for line in self.lines])
+        graph_height = GRAPH_HEIGHT
+        height = 8 + LINE_HEIGHT * len(self.lines) + graph_height + 6
+        if self.panel is None or self.panel.get_size() != (width, height):
+            self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+            self.panel.fill(PANEL_COLOR)
+        x, y = self.position or (screen.get_width() - width - 4, 4)
+        self.rect = screen.blit(self.panel, (x, y))
+        for i, line in enumerate(self.lines):
+            screen.blit(line, (x + 6, y + 5 + LINE_HEIGHT * i))
+
+        # Graphique : une barre verticale par frame, échelle 0..2x le budget de 60 FPS
+        top = y + 8 + LINE_HEIGHT * len(self.lines)
+        bottom = top + graph_height
+        scale = graph_height / (2 * FRAME_BUDGET_MS)
+        left = x + width - 4 - len(self.frame_ms) * 2 + 2
+        for i, value in enumerate(self.frame_ms):
+            bar = min(graph_height, value * scale)
+            column = left + 2 * i
+            pygame.draw.line(screen, GRAPH_COLOR, (column, bottom), (column, bottom - bar))
+        budget_y = bottom - FRAME_BUDGET_MS * scale
+        pygame.draw.line(screen, BUDGET_COLOR, (x + 4, budget_y), (x + width - 4, budget_y))
+
+
+def snapshot_stats(network):
+    """
+    Fréquence de réception des états (par seconde) et âge du dernier état (ms)
+    Args:
+        network: NetworkClient (attribut state_times : instants de réception)
+    """
+    times = list(network.state_times)
+    if not times:
+        return 0.0, 0.0
+    now = time.perf_counter()
+    age = (now - times[-1]) * 1000.0
+    recent = [t for t in times if now - t <= 2.0]
+    rate = (len(recent) - 1) / (recent[-1] - recent[0]) if len(recent) > 1 and recent[-1] > recent[0] else 0.0
+    return rate, age
+
+
+def add_hud_argument(parser):
+    """Ajoute l'option --hud (overlay visible dès le lancement, F3 pour basculer)"""
+    parser.add_argument('--hud', action='store_true',
+                        help="Affiche l'overlay de performances au lancement (F3 pour basculer)")
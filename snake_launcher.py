@@ -3,6 +3,8 @@ import sys
 import pygame
 import subprocess
 import os
+from snake_text import fonts
+from snake_menu import MenuView
 
 # Initialize Pygame
 pygame.init()
@@ -59,14 +61,15 @@ class MainMenu:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Snake Game - Main Menu")
 
-        self.clock = pygame.time.Clock()
+        # Blocks on input events; the menu is only redrawn when a button hover changes
+        self.view = MenuView()
         self.running = True
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 80)
-        self.subtitle_font = pygame.font.Font(None, 36)
-        self.button_font = pygame.font.Font(None, 42)
-        self.small_font = pygame.font.Font(None, 28)
+        self.title_font = fonts.get(80)
+        self.subtitle_font = fonts.get(36)
+        self.button_font = fonts.get(42)
+        self.small_font = fonts.get(28)
 
         # Create buttons - AJOUT DU BOUTON SINGLE PLAYER
         button_width = 450
@@ -208,15 +211,6 @@ class MainMenu:
     def run(self):
         """Main menu loop"""
         while self.running:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.quit_game()
-
-                # Let buttons handle events
-                for button in self.buttons:
-                    button.handle_event(event)
-
             # Draw everything
             self.draw_gradient_background()
             self.draw_snake_decoration()
@@ -244,7 +238,19 @@ class MainMenu:
             self.draw_instructions()
 
             pygame.display.flip()
-            self.clock.tick(60)
+
+            # Handle events until something on screen changes (idle: no CPU used)
+            for event in self.view.events(self.signature):
+                if event.type == pygame.QUIT:
+                    self.quit_game()
+
+                # Let buttons handle events
+                for button in self.buttons:
+                    button.handle_event(event)
+
+    def signature(self):
+        """Everything that changes on screen: hovered buttons (and leaving the menu)"""
+        return self.running, tuple(button.is_hovered for button in self.buttons)
 
 
 def main():
@@ -0,0 +1,315 @@
+# Ce fichier implémente le classement en mémoire des meilleurs scores (index des rangs).
+# Avant, chaque question sur le classement (top 10, rang d'un joueur) devenait une requête
+# SQL qui trie ou compte toute la table à chaque appel (à chaque frame de l'écran de fin).
+# Maintenant :
+# - un classement par mode et par niveau ('solo' niveau 0, 'premium' niveaux 1 à 3)
+# - chaque classement est un arbre d'ordre (treap : arbre binaire de recherche équilibré
+#   par des priorités aléatoires) trié par score décroissant ; chaque nœud connaît la taille
+#   de son sous-arbre, donc le k-ième joueur et le rang d'un score se trouvent en O(log n)
+# - top N, rang, percentile et voisins d'un joueur : O(log n) (+ N pour les listes)
+# - un nouveau record met à jour l'arbre sur place (retrait de l'ancien score, insertion du
+#   nouveau) : aucune reconstruction
+# - au démarrage, les classements sont reconstruits une fois depuis la base (snake_scores)
+
+import random  # Priorités des nœuds (générateur séparé : ne touche pas à la graine du jeu)
+
+from snake_scores import SCORES_DB, SOLO, SOLO_LEVEL, ScoreStore, ScoreWriter
+
+
+class _Node:
+    __slots__ = ('key', 'priority', 'left', 'right', 'size')
+
+    def __init__(self, key, priority):
+        self.key = key
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.size = 1  # Nombre de nœuds du sous-arbre (lui compris)
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _resize(node):
+    node.size = 1 + _size(node.left) + _size(node.right)
+    return node
+
+
+def _split(node, key, inclusive=False):
+    """
+    Coupe l'arbre en deux
+    Returns:
+        tuple: (clés < key, clés >= key), ou (clés <= key, clés > key) si inclusive
+    """
+    if node is None:
+        return None, None
+    if node.key < key or (inclusive and node.key == key):
+        node.right, right = _split(node.right, key, inclusive)
+        return _resize(node), right
+    left, node.left = _split(node.left, key, inclusive)
+    return left, _resize(node)
+
+
+def _merge(left, right):
+    """Réunit deux arbres (toutes les clés de left avant celles de right)"""
+    if left is None or right is None:
+        return left or right
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return _resize(left)
+    right.left = _merge(left, right.left)
+    return _resize(right)
+
+
+class OrderStatisticTree:
+    """
+    Ensemble trié de clés (toutes différentes) avec accès par position
+    Utilisation :
+        tree = OrderStatisticTree()
+        tree.insert((-195, "malek"))
+        tree.count_less((-195,))   # nombre de clés avant celle-ci
+        tree.select(0)             # plus petite clé
+    """
+
+    def __init__(self, rng=None):
+        self.root = None
+        self.rng = rng or random.Random()
+
+    def __len__(self):
+        return _size(self.root)
+
+    def insert(self, key):
+        left, right = _split(self.root, key)
+        self.root = _merge(_merge(left, _Node(key, self.rng.random())), right)
+
+    def remove(self, key):
+        left, right = _split(self.root, key)
+        _, right = _split(right, key, inclusive=True)
+        self.root = _merge(left, right)
+
+    def count_less(self, key):
+        """Nombre de clés strictement inférieures à key"""
+        count, node = 0, self.root
+        while node is not None:
+            if node.key < key:
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def select(self, index):
+        """Clé à la position index (0 : la plus petite)"""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if index < left:
+                node = node.left
+            elif index == left:
+                return node.key
+            else:
+                index -= left + 1
+                node = node.right
+
+    def slice(self, start, stop):
+        """Clés des positions start..stop-1, dans l'ordre (parcours arrêté à stop)"""
+        start, stop = max(start, 0), min(stop, len(self))
+        keys, stack, node, index = [], [], self.root, start
+        # Descente jusqu'à la position start en gardant les ancêtres à visiter ensuite
+        while node is not None:
+            left = _size(node.left)
+            if index < left:
+                stack.append(node)
+                node = node.left
+            elif index == left:
+                stack.append(node)
+                break
+            else:
+                index -= left + 1
+                node = node.right
+        while stack and len(keys) < stop - start:
+            node = stack.pop()
+            keys.append(node.key)
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+        return keys
+
+
+class Leaderboard:
+    """
+    Classements de tous les modes et niveaux, tenus à jour à chaque record
+    Un joueur est identifié par (identifiant, nom), comme dans la base des scores.
+    Utilisation :
+        board = Leaderboard()
+        board.submit('solo', 0, ("12", "malek"), 195)
+        board.rank('solo', 0, ("12", "malek"))      # 1
+        board.top('solo', 0, 10)                     # [(1, ("12", "malek"), 195)]
+    """
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed: Graine des priorités des arbres (None : aléatoire)
+        """
+        self.rng = random.Random(seed)
+        self.trees = {}   # (mode, niveau) -> OrderStatisticTree de clés (-score, joueur)
+        self.scores = {}  # (mode, niveau) -> {joueur: meilleur score}
+
+    def _board(self, mode, level):
+        board = (mode, level)
+        if board not in self.trees:
+            self.trees[board] = OrderStatisticTree(self.rng)
+            self.scores[board] = {}
+        return self.trees[board], self.scores[board]
+
+    def submit(self, mode, level, player, score):
+        """
+        Enregistre un score s'il bat le record du joueur
+        Returns:
+            bool: True si c'est un nouveau record
+        """
+        tree, scores = self._board(mode, level)
+        best = scores.get(player)
+        if best is not None and best >= score:
+            return False
+        if best is not None:
+            tree.remove((-best, player))
+        tree.insert((-score, player))
+        scores[player] = score
+        return True
+
+    def best(self, mode, level, player):
+        """Record du joueur, ou None s'il n'a jamais joué"""
+        return self.scores.get((mode, level), {}).get(player)
+
+    def size(self, mode, level):
+        """Nombre de joueurs classés"""
+        return len(self.trees.get((mode, level), ()))
+
+    def rank(self, mode, level, player):
+        """
+        Rang du joueur (1 : meilleur score ; les ex aequo ont le même rang)
+        Returns:
+            int, ou None s'il n'a jamais joué
+        """
+        best = self.best(mode, level, player)
+        if best is None:
+            return None
+        # (-best,) est placé avant toutes les clés (-best, joueur) : compte les scores plus hauts
+        return self.trees[(mode, level)].count_less((-best,)) + 1
+
+    def percentile(self, mode, level, player):
+        """
+        Pourcentage des joueurs classés qui ont un score plus bas
+        Returns:
+            float (0 à 100), ou None s'il n'a jamais joué
+        """
+        best = self.best(mode, level, player)
+        if best is None:
+            return None
+        tree = self.trees[(mode, level)]
+        # (-best + 1,) : première clé d'un score plus bas que best
+        below = len(tree) - tree.count_less((-best + 1,))
+        return 100.0 * below / len(tree)
+
+    def _entries(self, tree, keys):
+        """Clés (-score, joueur) -> (rang, joueur, score)"""
+        return [(tree.count_less((key[0],)) + 1, key[1], -key[0]) for key in keys]
+
+    def top(self, mode, level, count=10):
+        """
+        Meilleurs records, du plus haut au plus bas
+        Returns:
+            list: Tuples (rang, joueur, score)
+        """
+        tree = self.trees.get((mode, level))
+        if tree is None:
+            return []
+        return self._entries(tree, tree.slice(0, count))
+
+    def around(self, mode, level, player, radius=2):
+        """
+        Le joueur et ses voisins du classement (radius au-dessus, radius en dessous)
+        Returns:
+            list: Tuples (rang, joueur, score), vide s'il n'a jamais joué
+        """
+        best = self.best(mode, level, player)
+        if best is None:
+            return []
+        tree = self.trees[(mode, level)]
+        index = tree.count_less((-best, player))
+        return self._entries(tree, tree.slice(index - radius, index + radius + 1))
+
+
+def load_leaderboard(store):
+    """
+    Reconstruit les classements depuis la base (au démarrage)
+    Args:
+        store: ScoreStore
+    """
+    leaderboard = Leaderboard()
+    for mode, level, player_id, name, score in store.rows():
+        leaderboard.submit(mode, level, (player_id, name), score)
+    return leaderboard
+
+
+class Scoreboard:
+    """
+    Records d'un mode et d'un niveau : base SQLite (persistance) + classement en mémoire
+    Le classement est mis à jour aussitôt ; la base l'est par le thread de ScoreWriter.
+    Utilisation :
+        scoreboard = Scoreboard(SCORES_DB, 'premium', 3)
+        scoreboard.submit("", "malek", 195)
+        scoreboard.standing("", "malek")    # (1, 1, 0.0) : rang, joueurs, percentile
+    """
+
+    def __init__(self, path=SCORES_DB, mode=SOLO, level=SOLO_LEVEL):
+        self.mode = mode
+        self.level = level
+        store = ScoreStore(path)
+        self.leaderboard = load_leaderboard(store)
+        store.close()
+        # Écritures suivantes en arrière-plan (le game over n'attend jamais le disque)
+        self.writer = ScoreWriter(path)
+
+    def submit(self, player_id, name, score):
+        """
+        Enregistre un score s'il bat le record du joueur (classement, puis base en arrière-plan)
+        Returns:
+            bool: True si c'est un nouveau record
+        """
+        player = (str(player_id), name)
+        if not self.leaderboard.submit(self.mode, self.level, player, score):
+            return False
+        self.writer.submit(player_id, name, score, self.mode, self.level)
+        return True
+
+    def best(self, player_id, name):
+        return self.leaderboard.best(self.mode, self.level, (str(player_id), name))
+
+    def standing(self, player_id, name):
+        """
+        Returns:
+            tuple: (rang, nombre de joueurs classés, percentile), ou None s'il n'a jamais joué
+        """
+        player = (str(player_id), name)
+        rank = self.leaderboard.rank(self.mode, self.level, player)
+        if rank is None:
+            return None
+        return (rank, self.leaderboard.size(self.mode, self.level),
+                self.leaderboard.percentile(self.mode, self.level, player))
+
+    def top(self, count=10):
+        return self.leaderboard.top(self.mode, self.level, count)
+
+    def around(self, player_id, name, radius=2):
+        return self.leaderboard.around(self.mode, self.level, (str(player_id), name), radius)
+
+    def close(self):
+        """Écrit les records en attente (à la fermeture du jeu)"""
+        self.writer.close()
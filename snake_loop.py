@@ -0,0 +1,90 @@
+# Ce fichier implémente la boucle à pas de temps fixe des modes locaux
+# (snake_game.py, snake_server.py, snake_2players_local.py).
+# Avant, pygame.time.set_timer() envoyait un événement de déplacement toutes les X ms :
+# les événements pouvaient arriver en retard ou groupés, et le serpent sautait
+# d'une case à l'autre.
+# Maintenant :
+# - la simulation avance par ticks de durée fixe (vitesse du niveau), comptés par un
+#   accumulateur de millisecondes entières : le N-ième tick a lieu dès que N * pas ms
+#   se sont écoulées, même si une frame a pris du retard (les ticks manqués sont rattrapés)
+# - l'affichage suit clock.tick() et dessine les serpents entre leur position du tick
+#   précédent et celle du tick courant (interpolation, alpha de 0 à 1)
+
+# Nombre maximal de ticks rattrapés en une frame (au-delà, le retard est abandonné)
+MAX_CATCH_UP = 10
+
+
+class FixedTimestep:
+    """
+    Accumulateur de temps pour une simulation à pas fixe
+    Utilisation dans une boucle de jeu :
+        for _ in range(timestep.advance(elapsed_ms)):
+            game.update()
+        draw_frame(..., alpha=timestep.alpha)
+        elapsed_ms = clock.tick(60)
+    """
+
+    def __init__(self, step_ms, max_steps=MAX_CATCH_UP):
+        """
+        Args:
+            step_ms: Durée d'un tick en millisecondes (vitesse du niveau)
+            max_steps: Nombre maximal de ticks simulés en une seule frame
+        """
+        self.step_ms = step_ms
+        self.max_steps = max_steps
+        self.accumulator = 0  # Temps écoulé pas encore simulé (ms)
+        self.ticks = 0  # Nombre de ticks simulés depuis le début
+        self.dropped_ms = 0  # Temps abandonné après une très longue frame (ms)
+
+    def advance(self, elapsed_ms):
+        """
+        Ajoute le temps écoulé depuis la frame précédente
+        Args:
+            elapsed_ms: Durée de la frame précédente en millisecondes (valeur de clock.tick())
+        Returns:
+            int: Nombre de ticks à simuler pendant cette frame
+        """
+        self.accumulator += elapsed_ms
+        steps = self.accumulator // self.step_ms
+        self.accumulator -= steps * self.step_ms
+        if steps > self.max_steps:
+            # Frame beaucoup trop longue (fenêtre déplacée, machine en pause...) :
+            # mieux vaut abandonner ce retard que faire avancer le serpent de 20 cases d'un coup
+            self.dropped_ms += (steps - self.max_steps) * self.step_ms
+            steps = self.max_steps
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """Avancement entre le dernier tick et le suivant (0 : tick précédent, 1 : tick courant)"""
+        return self.accumulator / self.step_ms
+
+    def reset(self):
+        """Repart d'un tick tout juste simulé (reprise après une pause)"""
+        self.accumulator = 0
+
+
+def interpolate(previous, current, alpha):
+    """
+    Positions d'un serpent entre deux ticks
+    Args:
+        previous: Corps au tick précédent (positions en cases)
+        current: Corps au tick courant
+        alpha: Avancement entre les deux ticks (0 à 1)
+    Returns:
+        list: Positions (x, y) en cases, non entières pendant le déplacement
+    """
+    positions = []
+    for i, (x, y) in enumerate(current):
+        if i < len(previous):
+            dx = x - previous[i][0]
+            dy = y - previous[i][1]
+            # Déplacement d'une case au plus : glissement ; passage d'un bord à l'autre
+            # (modulo) ou réinitialisation : la case est affichée directement
+            if abs(dx) <= 1 and abs(dy) <= 1:
+                positions.append((x - dx * (1 - alpha), y - dy * (1 - alpha)))
+                continue
+        # Segment ajouté en mangeant : il reste sur la case de l'ancienne queue
+        positions.append((x, y))
+    return positions
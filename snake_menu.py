@@ -0,0 +1,72 @@
+# Ce fichier implémente la boucle des menus pilotée par les événements
+# (lanceur, saisie des noms, choix du thème, du niveau, des couleurs, connexion).
+# Avant, chaque menu redessinait tout l'écran (dégradé ligne par ligne, cartes, textes)
+# 30 à 60 fois par seconde pendant que le joueur lisait.
+# Maintenant :
+# - la boucle bloque sur pygame.event.wait() : aucun calcul tant que rien ne se passe
+# - l'écran n'est redessiné que si ce qu'il affiche a changé (même principe que la
+#   signature de frame du rendu --dirty-rects) ou si la fenêtre a été réaffichée
+# - un curseur clignotant réveille la boucle seulement à chaque changement d'état (2 fois par seconde)
+
+import pygame
+
+# Demi-période du clignotement du curseur (millisecondes visibles, puis cachées)
+BLINK_MS = 500
+
+
+class MenuView:
+    """
+    Attente des événements d'un écran de menu
+    Utilisation (le dessin reste en tête de boucle) :
+        view = MenuView()
+        while True:
+            ... dessin ...
+            pygame.display.flip()
+            for event in view.events(lambda: (selected, text)):
+                ... traitement de l'événement ...
+    """
+
+    def __init__(self, blink=False):
+        """
+        Args:
+            blink: L'écran a un curseur clignotant (réveil à chaque changement d'état)
+        """
+        self.blink = blink
+        self.exposed = False  # Fenêtre réaffichée : redessiner même sans changement
+        self.redraws = 0  # Nombre d'écrans dessinés (statistique)
+
+    def cursor_visible(self):
+        """État du curseur clignotant : visible BLINK_MS ms, puis caché BLINK_MS ms"""
+        return pygame.time.get_ticks() % (2 * BLINK_MS) < BLINK_MS
+
+    def wait(self):
+        """
+        Bloque jusqu'au prochain événement (ou jusqu'au prochain clignotement du curseur)
+        Returns:
+            list: Événements reçus (vide si seul le curseur doit changer)
+        """
+        if self.blink:
+            event = pygame.event.wait(BLINK_MS - pygame.time.get_ticks() % BLINK_MS)
+        else:
+            event = pygame.event.wait()
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        for event in events:
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.exposed = True
+        return events
+
+    def events(self, signature):
+        """
+        Événements à traiter jusqu'à ce que l'écran doive être redessiné
+        Args:
+            signature: Fonction sans argument décrivant tout ce que l'écran affiche
+                       (sélection, textes saisis, survol, état du curseur...)
+        """
+        self.redraws += 1
+        self.exposed = False
+        shown = signature()
+        while True:
+            yield from self.wait()
+            if self.exposed or signature() != shown:
+                return
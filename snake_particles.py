@@ -0,0 +1,244 @@
+# Ce fichier implémente le moteur de particules de la version premium (snake_server.py).
+# - Un seul réservoir (pool) pour toutes les particules de la partie, au lieu d'une liste
+#   de dictionnaires par effet
+# - Structure de tableaux (SoA) : position, vitesse, vie et couleur sont des tableaux NumPy
+#   préalloués ; l'intégration (mouvement + gravité) est vectorisée
+# - Les particules mortes sont retirées par échange avec la fin (swap-remove) : aucun décalage
+#   ni reconstruction de liste
+# - Capacité maximale fixe : au-delà, les nouvelles particules sont ignorées
+# - Dessin groupé : un sprite opaque à couleur transparente (colorkey) par (couleur, rayon),
+#   tous les blits en un seul screen.blits() ; deux fois plus rapide qu'un sprite SRCALPHA
+# - Générateur aléatoire propre au pool (graine optionnelle, résultats reproductibles)
+# NumPy est optionnel : sans lui, ListParticlePool fait la même chose avec des listes Python.
+
+import math  # Angles des particules (version sans NumPy)
+import random  # Générateur de la version sans NumPy
+
+import pygame
+
+from snake_assets import assets  # Compteur de Surfaces (overlay F3)
+
+try:
+    import numpy as np
+except ImportError:  # Le jeu fonctionne sans NumPy (moteur en listes Python)
+    np = None
+
+# Nombre maximal de particules vivantes
+CAPACITY = 8192
+# Accélération vers le bas (pixels par frame, par frame à 60 FPS)
+GRAVITY = 0.2
+# Durée de vie d'une particule (frames à 60 FPS, soit 0.5 seconde)
+LIFE = 30
+# Particules créées par effet et vitesse initiale (pixels par frame à 60 FPS)
+BURST = 15
+SPEED = (2.0, 6.0)
+# Rayon d'une particule neuve (il diminue avec la vie restante)
+MAX_RADIUS = 4
+# Couleur transparente des sprites (jamais utilisée par une particule)
+COLORKEY = (255, 0, 255)
+
+
+class BaseParticlePool:
+    """
+    Partie commune aux deux moteurs : palette de couleurs, sprites et dessin
+    Les sous-classes fournissent emit(), update(), visible() et __len__()
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.dropped = 0  # Particules ignorées car le pool était plein
+        self.palette = []  # Couleurs utilisées (les particules stockent un index)
+        self._sprites = []  # _sprites[couleur][rayon] -> Surface
+
+    def color_index(self, color):
+        """Index de la couleur dans la palette (ajoutée si nouvelle)"""
+        color = tuple(color[:3])
+        if color not in self.palette:
+            self.palette.append(color)
+            self._sprites.append([None] + [self._sprite(color, radius)
+                                           for radius in range(1, MAX_RADIUS + 1)])
+        return self.palette.index(color)
+
+    def _sprite(self, color, radius):
+        """Disque de couleur, dessiné une fois (même forme que pygame.draw.circle)"""
+        size = 2 * radius + 1
+        surface = assets.track(pygame.Surface((size, size)))
+        surface.fill(COLORKEY)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        surface.set_colorkey(COLORKEY)
+        if pygame.display.get_surface() is not None:
+            surface = assets.track(surface.convert())
+        return surface
+
+    def draw(self, screen):
+        """Dessine toutes les particules visibles en un seul appel à screen.blits()"""
+        sprites = self._sprites
+        screen.blits([(sprites[c][r], (x - r, y - r)) for x, y, r, c in self.visible()], doreturn=False)
+
+    def bounds(self):
+        """
+        Rectangle englobant toutes les particules (rendu --dirty-rects)
+        Returns:
+            pygame.Rect, ou None s'il n'y a aucune particule visible
+        """
+        particles = list(self.visible())
+        if not particles:
+            return None
+        left = min(x for x, _, _, _ in particles) - MAX_RADIUS
+        top = min(y for _, y, _, _ in particles) - MAX_RADIUS
+        right = max(x for x, _, _, _ in particles) + MAX_RADIUS + 1
+        bottom = max(y for _, y, _, _ in particles) + MAX_RADIUS + 1
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+
+class ParticlePool(BaseParticlePool):
+    """Moteur NumPy : tableaux préalloués de capacity particules"""
+
+    def __init__(self, capacity=CAPACITY, seed=None):
+        """
+        Args:
+            capacity: Nombre maximal de particules vivantes
+            seed: Graine du générateur aléatoire (None : imprévisible)
+        """
+        super().__init__(capacity)
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.int32)
+        self._arrays = (self.x, self.y, self.vx, self.vy, self.life, self.color)
+        self._scratch = np.zeros(capacity, dtype=np.float32)  # Tampon de calcul (pas d'allocation)
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, color, count=BURST):
+        """
+        Crée une gerbe de particules en (x, y), dans toutes les directions
+        Returns:
+            int: Nombre de particules réellement créées (capacité maximale)
+        """
+        n = min(count, self.capacity - self.count)
+        self.dropped += count - n
+        if n <= 0:
+            return 0
+        s = slice(self.count, self.count + n)
+        angle = self.rng.uniform(0.0, 2 * math.pi, n)
+        speed = self.rng.uniform(SPEED[0], SPEED[1], n)
+        self.x[s] = x
+        self.y[s] = y
+        self.vx[s] = speed * np.cos(angle)
+        self.vy[s] = speed * np.sin(angle)
+        self.life[s] = LIFE
+        self.color[s] = self.color_index(color)
+        self.count += n
+        return n
+
+    def update(self, dt=1 / 60):
+        """
+        Avance la simulation de dt secondes (vitesses exprimées par frame à 60 FPS)
+        puis retire les particules mortes par échange avec la fin du tableau
+        """
+        n = self.count
+        if n == 0:
+            return
+        k = dt * 60
+        scratch = self._scratch[:n]
+        np.multiply(self.vx[:n], k, out=scratch)
+        self.x[:n] += scratch
+        np.multiply(self.vy[:n], k, out=scratch)
+        self.y[:n] += scratch
+        self.life[:n] -= k
+        self.vy[:n] += GRAVITY * k
+
+        alive = self.life[:n] > 0
+        remaining = int(np.count_nonzero(alive))
+        if remaining < n:
+            # Trous parmi les `remaining` premières places <- vivantes situées après
+            holes = np.flatnonzero(~alive[:remaining])
+            movers = np.flatnonzero(alive[remaining:]) + remaining
+            for array in self._arrays:
+                array[holes] = array[movers]
+            self.count = remaining
+
+    def visible(self):
+        """Itérable de (x, y, rayon, couleur) des particules de rayon > 0"""
+        n = self.count
+        radius = (self.life[:n] * (MAX_RADIUS / LIFE)).astype(np.int32)
+        shown = radius > 0
+        return zip(self.x[:n][shown].astype(np.int32).tolist(),
+                   self.y[:n][shown].astype(np.int32).tolist(),
+                   radius[shown].tolist(),
+                   self.color[:n][shown].tolist())
+
+    def bounds(self):
+        n = self.count
+        if n == 0:
+            return None
+        left = int(self.x[:n].min()) - MAX_RADIUS
+        top = int(self.y[:n].min()) - MAX_RADIUS
+        right = int(self.x[:n].max()) + MAX_RADIUS + 1
+        bottom = int(self.y[:n].max()) + MAX_RADIUS + 1
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+
+class ListParticlePool(BaseParticlePool):
+    """Moteur sans NumPy : mêmes méthodes, colonnes en listes Python"""
+
+    def __init__(self, capacity=CAPACITY, seed=None):
+        super().__init__(capacity)
+        self.rng = random.Random(seed)
+        self.x, self.y, self.vx, self.vy, self.life, self.color = [], [], [], [], [], []
+        self._columns = (self.x, self.y, self.vx, self.vy, self.life, self.color)
+
+    def __len__(self):
+        return len(self.life)
+
+    def emit(self, x, y, color, count=BURST):
+        n = min(count, self.capacity - len(self.life))
+        self.dropped += count - n
+        index = self.color_index(color)
+        for _ in range(max(n, 0)):
+            angle = self.rng.uniform(0.0, 2 * math.pi)
+            speed = self.rng.uniform(SPEED[0], SPEED[1])
+            self.x.append(x)
+            self.y.append(y)
+            self.vx.append(speed * math.cos(angle))
+            self.vy.append(speed * math.sin(angle))
+            self.life.append(LIFE)
+            self.color.append(index)
+        return max(n, 0)
+
+    def update(self, dt=1 / 60):
+        k = dt * 60
+        x, y, vx, vy, life = self.x, self.y, self.vx, self.vy, self.life
+        i = 0
+        while i < len(life):
+            x[i] += vx[i] * k
+            y[i] += vy[i] * k
+            life[i] -= k
+            vy[i] += GRAVITY * k
+            if life[i] > 0:
+                i += 1
+                continue
+            # Swap-remove : la dernière particule (pas encore mise à jour)
+            # prend la place de la morte et sera traitée au prochain tour, sans avancer i
+            for column in self._columns:
+                column[i] = column[-1]
+                column.pop()
+
+    def visible(self):
+        for x, y, life, color in zip(self.x, self.y, self.life, self.color):
+            radius = int(life * MAX_RADIUS / LIFE)
+            if radius > 0:
+                yield int(x), int(y), radius, color
+
+
+def create_particle_pool(capacity=CAPACITY, seed=None):
+    """Pool NumPy si disponible, sinon la version en listes Python"""
+    if np is not None:
+        return ParticlePool(capacity, seed)
+    return ListParticlePool(capacity, seed)
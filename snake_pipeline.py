@@ -0,0 +1,232 @@
+# Ce fichier implémente la simulation sur un thread séparé (option --threaded) pour les modes
+# premium (snake_server.py) et local (snake_2players_local.py).
+# Sans l'option, la boucle principale fait tout à la suite : événements, ticks, particules,
+# dessin ; un dessin lent retarde le tick suivant et un tick lourd fait sauter des frames.
+# Avec --threaded :
+# - un thread de simulation exécute les ticks à la vitesse du niveau (FixedTimestep)
+# - après ses ticks, il publie une copie figée de la partie (snapshot) : les listes
+#   (corps, traînée, obstacles) et vecteurs sont copiés, y compris les vecteurs contenus
+#   dans les listes ; plus rien ne les modifie ensuite
+# - deux emplacements de publication (double tampon) : le snapshot suivant est écrit dans
+#   l'emplacement arrière, puis les deux sont échangés sous verrou
+# - le thread principal ne fait que les événements (sous le verrou de la partie) et le
+#   dessin du dernier snapshot publié, interpolé selon le temps écoulé depuis son tick
+# - les particules restent au thread de dessin : la simulation met ses gerbes en file
+#   (DeferredParticles) et le dessin les crée au début de sa frame
+# Aucune donnée partagée ne dépend du GIL (verrous explicites, snapshots immuables) :
+# avec un CPython sans GIL (free-threaded, python3.13t), les deux threads s'exécutent
+# réellement en parallèle.
+
+import contextlib  # Verrou vide du mode sans thread
+import copy  # Copies superficielles des objets du jeu (snapshots)
+import threading
+import time  # Horloge du thread de simulation
+
+from pygame.math import Vector2
+
+from snake_loop import FixedTimestep
+
+
+def freeze(obj):
+    """
+    Copie figée d'un objet du jeu : ses listes, leurs vecteurs (corps, traînée) et ses
+    vecteurs sont copiés ; les autres attributs (nombres, textes, thème...) sont partagés.
+    Les autres éléments des listes (obstacles...) restent partagés : les ticks ne doivent
+    jamais les modifier sur place.
+    """
+    frozen = copy.copy(obj)
+    for name, value in vars(obj).items():
+        if isinstance(value, list):
+            setattr(frozen, name, [Vector2(item) if isinstance(item, Vector2) else item
+                                   for item in value])
+        elif isinstance(value, Vector2):
+            setattr(frozen, name, Vector2(value))
+    return frozen
+
+
+def snapshot(game, parts):
+    """
+    Snapshot d'une partie
+    Args:
+        game: Partie (Game, TwoPlayerGame)
+        parts: Noms des objets modifiés par les ticks ('snake', 'food1'...), figés eux aussi
+    """
+    frozen = freeze(game)
+    for name in parts:
+        setattr(frozen, name, freeze(getattr(game, name)))
+    return frozen
+
+
+class InlineSimulation:
+    """
+    Simulation dans la boucle principale (comportement par défaut)
+    Même utilisation que SimulationThread :
+        with simulation.lock:
+            ... événements ...
+        frame, alpha = simulation.frame(elapsed_ms)
+        draw_frame(screen, frame, ..., alpha)
+    """
+
+    def __init__(self, step_ms, tick, game):
+        """
+        Args:
+            step_ms: Durée d'un tick (vitesse du niveau)
+            tick: Fonction sans argument qui simule un tick
+            game: Partie dessinée à chaque frame
+        """
+        self.timestep = FixedTimestep(step_ms)
+        self.tick = tick
+        self.game = game
+        self.lock = contextlib.nullcontext()
+
+    @property
+    def ticks(self):
+        """Numéro du prochain tick simulé"""
+        return self.timestep.ticks
+
+    def frame(self, elapsed_ms):
+        """
+        Simule les ticks écoulés pendant la frame précédente
+        Returns:
+            tuple: (partie à dessiner, alpha)
+        """
+        for _ in range(self.timestep.advance(elapsed_ms)):
+            self.tick()
+        return self.game, self.timestep.alpha
+
+    def stop(self):
+        pass
+
+
+class SimulationThread(threading.Thread):
+    """
+    Ticks exécutés sur un thread séparé, snapshots publiés en double tampon
+    Les ticks et les modifications de la partie par le thread principal (touches)
+    se font sous self.lock ; le dessin n'utilise que des snapshots, sans verrou.
+    """
+
+    def __init__(self, step_ms, tick, take_snapshot):
+        """
+        Args:
+            step_ms: Durée d'un tick (vitesse du niveau)
+            tick: Fonction sans argument qui simule un tick (appelée sous self.lock)
+            take_snapshot: Fonction sans argument qui renvoie une copie figée de la partie
+        """
+        super().__init__(name="simulation", daemon=True)
+        self.timestep = FixedTimestep(step_ms)
+        self.tick = tick
+        self.take_snapshot = take_snapshot
+        self.lock = threading.Lock()  # Partie en cours de modification
+        self._swap = threading.Lock()  # Échange des deux emplacements de publication
+        self._stopped = threading.Event()
+        # Emplacements (snapshot, instant de son tick en ns) ; _front : celui du dessin
+        self._buffers = [(take_snapshot(), time.perf_counter_ns()), None]
+        self._front = 0
+        self.published = 1  # Nombre de snapshots publiés (statistique)
+
+    @property
+    def ticks(self):
+        """Numéro du prochain tick simulé (lire sous self.lock pour dater une commande)"""
+        return self.timestep.ticks
+
+    def run(self):
+        step_ns = self.timestep.step_ms * 1_000_000
+        last = time.perf_counter_ns()
+        while not self._stopped.is_set():
+            now = time.perf_counter_ns()
+            elapsed_ms = (now - last) // 1_000_000
+            last += elapsed_ms * 1_000_000  # Le reste (< 1 ms) compte pour la prochaine fois
+            with self.lock:
+                steps = self.timestep.advance(elapsed_ms)
+                for _ in range(steps):
+                    self.tick()
+                frame = self.take_snapshot() if steps else None
+            if frame is not None:
+                # Instant du dernier tick : le temps non simulé (accumulateur) avant maintenant
+                self._publish(frame, last - self.timestep.accumulator * 1_000_000)
+            # Attente jusqu'au prochain tick (réveil immédiat par stop())
+            remaining = step_ns - self.timestep.accumulator * 1_000_000 - (now - last)
+            self._stopped.wait(max(remaining, 0) / 1e9)
+
+    def _publish(self, frame, tick_ns):
+        """Écrit le snapshot dans l'emplacement arrière puis échange les emplacements"""
+        back = 1 - self._front
+        self._buffers[back] = (frame, tick_ns)
+        with self._swap:
+            self._front = back
+        self.published += 1
+
+    def frame(self, elapsed_ms=0):
+        """
+        Dernier snapshot publié (elapsed_ms ignoré : les ticks suivent leur propre horloge)
+        Returns:
+            tuple: (snapshot à dessiner, alpha selon le temps écoulé depuis son tick)
+        """
+        with self._swap:
+            frame, tick_ns = self._buffers[self._front]
+        alpha = (time.perf_counter_ns() - tick_ns) / (self.timestep.step_ms * 1_000_000)
+        return frame, min(max(alpha, 0.0), 1.0)
+
+    def stop(self):
+        """Arrête le thread après son tick en cours (sans l'attendre)"""
+        self._stopped.set()
+
+
+class DeferredParticles:
+    """
+    Pool de particules partagé entre la simulation et le dessin (--threaded)
+    emit() (thread de simulation) ne fait que mettre la gerbe en file ;
+    update() (thread de dessin) crée les gerbes en attente puis fait avancer le pool.
+    draw(), bounds() et len() sont ceux du pool, utilisé uniquement par le thread de dessin.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.pool)
+
+    def emit(self, x, y, color, count):
+        with self._lock:
+            self._pending.append((x, y, color, count))
+        return count
+
+    def update(self, dt=1 / 60):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for x, y, color, count in pending:
+            self.pool.emit(x, y, color, count)
+        self.pool.update(dt)
+
+    def draw(self, screen):
+        self.pool.draw(screen)
+
+    def bounds(self):
+        return self.pool.bounds()
+
+
+def create_simulation(args, step_ms, tick, game, parts):
+    """
+    Simulation dans la boucle principale, ou sur un thread séparé avec --threaded
+    Args:
+        args: Options lues par argparse (voir add_threaded_argument)
+        step_ms: Durée d'un tick
+        tick: Fonction sans argument qui simule un tick
+        game: Partie
+        parts: Objets de la partie modifiés par les ticks (voir snapshot())
+    """
+    if not args.threaded:
+        return InlineSimulation(step_ms, tick, game)
+    if hasattr(game, 'particles'):
+        game.particles = DeferredParticles(game.particles)
+    simulation = SimulationThread(step_ms, tick, lambda: snapshot(game, parts))
+    simulation.start()
+    return simulation
+
+
+def add_threaded_argument(parser):
+    """Ajoute l'option --threaded à un argparse.ArgumentParser"""
+    parser.add_argument('--threaded', action='store_true',
+                        help="Simulation sur un thread séparé, le dessin utilise des copies figées")
@@ -0,0 +1,228 @@
+# Ce fichier implémente des bots pilotés par un petit réseau de neurones (MLP).
+# - Les observations de TOUS les bots d'une salle sont rassemblées dans un seul tableau NumPy
+# - Le passage avant (forward) est une chaîne de produits matriciels sur tout le lot,
+#   écrite dans des tampons préalloués (aucune allocation par tick)
+# - Les poids sont lus depuis un simple fichier .npz (W0, b0, W1, b1, ...)
+# - python snake_policy.py --bench : mesure le nombre de bots traités par milliseconde
+# NumPy est optionnel pour le reste du jeu : seul ce mode de bots en a besoin.
+
+import argparse  # Options de la ligne de commande (benchmark, export des poids)
+import time  # Chronomètre du benchmark
+
+try:
+    import numpy as np
+except ImportError:  # Le jeu fonctionne sans NumPy, seuls les bots "policy" sont indisponibles
+    np = None
+
+from snake_bot import DIRECTIONS
+
+# Observation d'un bot (12 valeurs) :
+# - 4 : case voisine bloquée (haut, bas, gauche, droite)
+# - 4 : direction actuelle (one-hot, même ordre)
+# - 4 : écart (dx, dy) vers chaque nourriture, normalisé par la taille de la grille
+OBSERVATION_SIZE = 12
+ACTION_COUNT = len(DIRECTIONS)
+# Index de la direction opposée (haut <-> bas, gauche <-> droite)
+REVERSE = (1, 0, 3, 2)
+
+
+def random_weights(hidden=(32,), seed=0):
+    """
+    Poids aléatoires (pour les essais et le benchmark)
+    Args:
+        hidden: Tailles des couches cachées
+        seed: Graine du générateur
+    Returns:
+        list: [(W, b), ...] de la première à la dernière couche
+    """
+    rng = np.random.default_rng(seed)
+    sizes = (OBSERVATION_SIZE,) + tuple(hidden) + (ACTION_COUNT,)
+    return [(rng.standard_normal((a, b)).astype(np.float32) / np.sqrt(a),
+             np.zeros(b, dtype=np.float32))
+            for a, b in zip(sizes, sizes[1:])]
+
+
+def load_weights(path):
+    """
+    Lit les poids d'un fichier .npz contenant W0, b0, W1, b1, ...
+    """
+    layers = []
+    with np.load(path) as data:
+        while f"W{len(layers)}" in data:
+            k = len(layers)
+            layers.append((data[f"W{k}"].astype(np.float32), data[f"b{k}"].astype(np.float32)))
+    if not layers:
+        raise ValueError(f"Aucune couche W0/b0 dans {path}")
+    if layers[0][0].shape[0] != OBSERVATION_SIZE or layers[-1][0].shape[1] != ACTION_COUNT:
+        raise ValueError(f"Dimensions attendues : {OBSERVATION_SIZE} entrées, {ACTION_COUNT} sorties")
+    return layers
+
+
+def save_weights(path, layers):
+    """Écrit les poids au format lu par load_weights()"""
+    arrays = {}
+    for k, (weights, bias) in enumerate(layers):
+        arrays[f"W{k}"] = weights
+        arrays[f"b{k}"] = bias
+    np.savez(path, **arrays)
+
+
+class PolicyRunner:
+    """
+    Évalue la politique pour tous les bots d'une salle en un seul lot
+    Les tampons grandissent (par doublement) avec le nombre de bots puis sont réutilisés
+    """
+
+    def __init__(self, layers=None, capacity=64):
+        """
+        Args:
+            layers: [(W, b), ...] ou None pour des poids aléatoires
+            capacity: Nombre de bots prévu (les tampons s'agrandissent si besoin)
+        """
+        if np is None:
+            raise ImportError("NumPy est nécessaire pour les bots 'policy' (pip install numpy)")
+        self.layers = layers if layers is not None else random_weights()
+        self.capacity = 0
+        self.grid = None  # Grille des cellules bloquées (réutilisée d'un tick à l'autre)
+        self.steps = np.array(DIRECTIONS, dtype=np.int64)  # (4, 2)
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Alloue les tampons pour capacity bots"""
+        self.capacity = capacity
+        self.observations = np.zeros((capacity, OBSERVATION_SIZE), dtype=np.float32)
+        self.heads = np.zeros((capacity, 2), dtype=np.int64)
+        self.direction_index = np.zeros(capacity, dtype=np.int64)
+        self.neighbor_x = np.zeros((capacity, ACTION_COUNT), dtype=np.int64)
+        self.neighbor_y = np.zeros((capacity, ACTION_COUNT), dtype=np.int64)
+        # Une sortie par couche : la sortie de la couche k est l'entrée de la couche k+1
+        self.buffers = [np.zeros((capacity, weights.shape[1]), dtype=np.float32)
+                        for weights, _ in self.layers]
+        self.mask = np.zeros((capacity, ACTION_COUNT), dtype=np.float32)
+        self.actions = np.zeros(capacity, dtype=np.int64)
+
+    def observe(self, heads, directions, blocked_cells, foods, grid_size):
+        """
+        Remplit self.observations[:n] pour n bots
+        Args:
+            heads: Liste des têtes (x, y)
+            directions: Liste des directions (dx, dy)
+            blocked_cells: Cellules (x, y) occupées (obstacles + corps)
+            foods: Exactement 2 positions de nourriture (x, y)
+            grid_size: Taille de la grille (torique)
+        Returns:
+            int: Nombre de bots n
+        """
+        n = len(heads)
+        if n > self.capacity:
+            capacity = max(self.capacity, 1)  # capacity=0 au départ : doubler 0 ne grandit jamais
+            while capacity < n:
+                capacity *= 2
+            self._allocate(capacity)
+        if self.grid is None or self.grid.shape[0] != grid_size:
+            self.grid = np.zeros((grid_size, grid_size), dtype=np.float32)
+        grid = self.grid
+        grid.fill(0.0)
+        if blocked_cells:
+            cells = np.array(list(blocked_cells), dtype=np.int64)
+            grid[cells[:, 1] % grid_size, cells[:, 0] % grid_size] = 1.0
+
+        obs = self.observations[:n]
+        head = self.heads[:n]
+        head[:] = heads
+        # Directions (dx, dy) -> index dans DIRECTIONS : haut 0, bas 1, gauche 2, droite 3
+        dirs = np.array(directions, dtype=np.int64).reshape(n, 2)
+        index = self.direction_index[:n]
+        index[:] = np.where(dirs[:, 0] == 0, (dirs[:, 1] > 0), 2 + (dirs[:, 0] > 0))
+
+        # Cases voisines (wraparound) et leur état bloqué
+        nx, ny = self.neighbor_x[:n], self.neighbor_y[:n]
+        np.add(head[:, 0:1], self.steps[:, 0], out=nx)
+        np.add(head[:, 1:2], self.steps[:, 1], out=ny)
+        nx %= grid_size
+        ny %= grid_size
+        obs[:, 0:4] = grid[ny, nx]
+
+        obs[:, 4:8] = 0.0
+        obs[np.arange(n), 4 + index] = 1.0
+
+        # Écart signé le plus court sur le tore, dans [-0.5, 0.5]
+        half = grid_size // 2
+        for k, food in enumerate(foods[:2]):
+            delta = (np.asarray(food, dtype=np.int64) - head + half) % grid_size - half
+            obs[:, 8 + 2 * k:10 + 2 * k] = delta / grid_size
+        return n
+
+    def forward(self, n):
+        """
+        Passage avant du MLP sur les n premières observations (ReLU entre les couches)
+        Returns:
+            np.ndarray: Logits (n, 4), vue sur un tampon interne
+        """
+        x = self.observations[:n]
+        last = len(self.layers) - 1
+        for k, (weights, bias) in enumerate(self.layers):
+            out = self.buffers[k][:n]
+            np.matmul(x, weights, out=out)
+            out += bias
+            if k < last:
+                np.maximum(out, 0.0, out=out)
+            x = out
+        return x
+
+    def act(self, heads, directions, blocked_cells, foods, grid_size):
+        """
+        Choisit une direction pour chaque bot
+        Les demi-tours sont interdits et les cases bloquées fortement pénalisées
+        Returns:
+            list: Directions (dx, dy), dans l'ordre de heads
+        """
+        n = self.observe(heads, directions, blocked_cells, foods, grid_size)
+        if n == 0:
+            return []
+        logits = self.forward(n)
+        mask = self.mask[:n]
+        np.multiply(self.observations[:n, 0:4], -1e6, out=mask)
+        mask[np.arange(n), np.take(REVERSE, self.direction_index[:n])] = -1e9
+        logits += mask
+        actions = self.actions[:n]
+        np.argmax(logits, axis=1, out=actions)
+        return [DIRECTIONS[a] for a in actions.tolist()]
+
+
+def benchmark(counts=(1, 10, 100, 1000, 10000), grid_size=200, repeats=20):
+    """
+    Mesure le débit (bots par milliseconde) en fonction du nombre de bots
+    Le temps inclut la construction des observations et le passage avant
+    """
+    rng = np.random.default_rng(1)
+    runner = PolicyRunner()
+    print(f"{'bots':>8} {'ms/tick':>10} {'bots/ms':>10}")
+    for n in counts:
+        heads = [tuple(p) for p in rng.integers(0, grid_size, (n, 2)).tolist()]
+        directions = [DIRECTIONS[i] for i in rng.integers(0, 4, n).tolist()]
+        blocked = set(heads)
+        foods = [(3, 4), (grid_size // 2, grid_size // 3)]
+        runner.act(heads, directions, blocked, foods, grid_size)  # Échauffement (allocation)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            runner.act(heads, directions, blocked, foods, grid_size)
+        elapsed = (time.perf_counter() - start) * 1000.0 / repeats
+        print(f"{n:>8} {elapsed:>10.3f} {n / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bots à réseau de neurones (évaluation par lots)")
+    parser.add_argument('--bench', action='store_true', help="Débit en bots/ms selon le nombre de bots")
+    parser.add_argument('--export', metavar='FICHIER.npz',
+                        help="Écrit des poids aléatoires au format attendu (point de départ)")
+    parser.add_argument('--hidden', type=int, nargs='+', default=[32], help="Tailles des couches cachées")
+    args = parser.parse_args()
+
+    if np is None:
+        raise SystemExit("NumPy est nécessaire : pip install numpy")
+    if args.export:
+        save_weights(args.export, random_weights(tuple(args.hidden)))
+        print(f"Poids écrits dans {args.export}")
+    if args.bench or not args.export:
+        benchmark()
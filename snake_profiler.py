@@ -0,0 +1,222 @@
+# Ce fichier implémente le profileur de frames commun à tous les modes de jeu (--profile).
+# - Chaque frame est découpée en phases (événements, update, fond, dessin, interface, affichage...)
+#   chronométrées avec time.perf_counter_ns() : un seul appel d'horloge par phase
+# - Option --cprofile : toute la partie est exécutée sous cProfile
+# - À la sortie du jeu (atexit, donc aussi après sys.exit()) :
+#   * résumé par phase (moyenne, p50, p95, p99, max) affiché et écrit dans PREFIX.summary.txt
+#   * piles "repliées" (collapsed stacks) pour les flame graphs (flamegraph.pl, speedscope...)
+#     PREFIX.phases.collapsed, et PREFIX.cprofile.collapsed + PREFIX.prof avec --cprofile
+
+import atexit  # Écriture des résultats à la fermeture du jeu
+import cProfile  # Profilage optionnel fonction par fonction
+import pstats  # Lecture des statistiques de cProfile
+import time  # Horloge monotone haute résolution
+
+# Phase du temps passé à attendre dans clock.tick() (exclue du temps de travail d'une frame)
+WAIT_PHASE = "wait"
+
+
+class NullProfiler:
+    """
+    Profileur désactivé : mêmes méthodes, ne fait rien
+    Permet d'appeler profiler.lap(...) sans test dans les boucles de jeu
+    """
+    enabled = False
+
+    def begin_frame(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def finish(self):
+        pass
+
+
+# Instance partagée, valeur par défaut des paramètres "profiler"
+NULL_PROFILER = NullProfiler()
+
+
+class FrameProfiler:
+    """
+    Mesure le temps de chaque phase de chaque frame
+    Utilisation dans une boucle :
+        profiler.begin_frame()
+        ... événements ...   profiler.lap('events')
+        game.update()        profiler.lap('update')
+        ...
+        profiler.end_frame()
+    lap(phase) attribue à phase le temps écoulé depuis le lap précédent ;
+    une phase peut apparaître plusieurs fois par frame (les durées s'additionnent).
+    """
+    enabled = True
+
+    def __init__(self, name, prefix=None, use_cprofile=False):
+        """
+        Args:
+            name: Nom du mode de jeu (racine des piles repliées)
+            prefix: Préfixe des fichiers de sortie (par défaut "profile_<name>")
+            use_cprofile: Exécute aussi la partie sous cProfile
+        """
+        self.name = name
+        self.prefix = prefix or f"profile_{name}"
+        self.phases = {}  # phase -> liste des durées (ns), une entrée par frame
+        self.frames = 0
+        self._current = {}  # Durées de la frame en cours
+        self._last = None
+        self._finished = False
+        self.cprofile = cProfile.Profile() if use_cprofile else None
+
+    def start(self):
+        """Démarre le profilage (et cProfile) ; les résultats seront écrits à la sortie"""
+        atexit.register(self.finish)
+        if self.cprofile is not None:
+            self.cprofile.enable()
+        return self
+
+    def begin_frame(self):
+        self._current = {}
+        self._last = time.perf_counter_ns()
+
+    def lap(self, phase):
+        now = time.perf_counter_ns()
+        if self._last is not None:
+            self._current[phase] = self._current.get(phase, 0) + now - self._last
+        self._last = now
+
+    def end_frame(self):
+        if self._last is None:
+            return
+        # Une phase absente de cette frame compte pour 0 (les listes restent alignées)
+        for phase in self._current.keys() - self.phases.keys():
+            self.phases[phase] = [0] * self.frames
+        for phase, values in self.phases.items():
+            values.append(self._current.get(phase, 0))
+        self.frames += 1
+        self._last = None
+
+    # ------------------------------------------------------------------
+    # Résultats
+    # ------------------------------------------------------------------
+
+    def frame_totals(self):
+        """Temps de travail de chaque frame (ns), attente de clock.tick() exclue"""
+        totals = [0] * self.frames
+        for phase, values in self.phases.items():
+            if phase == WAIT_PHASE:
+                continue
+            for i, value in enumerate(values):
+                totals[i] += value
+        return totals
+
+    def summary(self):
+        """
+        Returns:
+            str: Tableau des percentiles par phase (millisecondes)
+        """
+        lines = [f"Profil '{self.name}' : {self.frames} frames",
+                 f"{'phase':<14}{'moy.':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)"]
+        rows = sorted(self.phases.items(), key=lambda item: -sum(item[1]))
+        rows.append(("frame", self.frame_totals()))
+        for phase, values in rows:
+            if not values:
+                continue
+            ordered = sorted(values)
+
+            def pick(fraction):
+                return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] / 1e6
+
+            lines.append(f"{phase:<14}{sum(values) / len(values) / 1e6:>9.3f}{pick(0.50):>9.3f}"
+                         f"{pick(0.95):>9.3f}{pick(0.99):>9.3f}{ordered[-1] / 1e6:>9.3f}")
+        return "\n".join(lines)
+
+    def write_phase_stacks(self, path):
+        """Piles repliées des phases : "mode;phase microsecondes" par ligne"""
+        with open(path, 'w') as f:
+            for phase, values in sorted(self.phases.items()):
+                total_us = sum(values) // 1000
+                if total_us > 0:
+                    f.write(f"{self.name};{phase} {total_us}\n")
+
+    def write_cprofile_stacks(self, path):
+        """
+        Piles repliées reconstruites à partir du graphe d'appels de cProfile.
+        cProfile ne garde que les arcs appelant -> appelé : le temps cumulé d'une fonction
+        est réparti entre ses appelés au prorata des arcs (approximation habituelle).
+        """
+        stats = pstats.Stats(self.cprofile).stats
+        callees = {}
+        for func, (_, _, _, _, callers) in stats.items():
+            for caller, edge in callers.items():
+                callees.setdefault(caller, []).append((func, edge[3]))
+        roots = [func for func, entry in stats.items() if not entry[4]]
+        lines = {}
+
+        def label(func):
+            filename, line, name = func
+            return f"{name} ({filename.rsplit('/', 1)[-1]}:{line})"
+
+        def walk(func, stack, budget, depth):
+            if budget < 1e-6 or depth > 64:
+                return
+            total = stats[func][3] or 1e-12
+            children = 0.0
+            for callee, edge_time in callees.get(func, ()):
+                if callee in stack:
+                    continue  # Récursion : on coupe la boucle
+                share = budget * edge_time / total
+                children += share
+                walk(callee, stack + (callee,), share, depth + 1)
+            own = budget - children
+            if own > 0:
+                key = ";".join(label(f) for f in stack)
+                lines[key] = lines.get(key, 0.0) + own
+
+        for root in roots:
+            walk(root, (root,), stats[root][3], 0)
+        with open(path, 'w') as f:
+            for key, seconds in lines.items():
+                micros = int(seconds * 1e6)
+                if micros > 0:
+                    f.write(f"{self.name};{key} {micros}\n")
+
+    def finish(self):
+        """Arrête le profilage et écrit les résultats (une seule fois)"""
+        if self._finished:
+            return
+        self._finished = True
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        text = self.summary()
+        print(text)
+        with open(f"{self.prefix}.summary.txt", 'w') as f:
+            f.write(text + "\n")
+        self.write_phase_stacks(f"{self.prefix}.phases.collapsed")
+        if self.cprofile is not None:
+            self.cprofile.dump_stats(f"{self.prefix}.prof")
+            self.write_cprofile_stacks(f"{self.prefix}.cprofile.collapsed")
+        print(f"Profil écrit dans {self.prefix}.*")
+
+
+def add_profile_arguments(parser):
+    """Ajoute --profile, --cprofile et --profile-out à un argparse.ArgumentParser"""
+    parser.add_argument('--profile', action='store_true',
+                        help="Mesure chaque phase de chaque frame, résumé et flame graph à la sortie")
+    parser.add_argument('--cprofile', action='store_true',
+                        help="Exécute aussi la partie sous cProfile (implique --profile)")
+    parser.add_argument('--profile-out', metavar='PREFIXE',
+                        help="Préfixe des fichiers de profil (profile_<mode> par défaut)")
+
+
+def create_profiler(args, name):
+    """
+    Profileur selon les options de la ligne de commande
+    Returns:
+        FrameProfiler démarré, ou NULL_PROFILER sans --profile ni --cprofile
+    """
+    if not (args.profile or args.cprofile):
+        return NULL_PROFILER
+    return FrameProfiler(name, args.profile_out, args.cprofile).start()
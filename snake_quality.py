@@ -0,0 +1,124 @@
+# Ce fichier implémente les niveaux de qualité visuelle de la version premium (snake_server.py).
+# Les effets (lueur de la tête, traînée de 8 cases, lueur de la nourriture, particules,
+# pulsation) coûtent la même chose sur toutes les machines. Le contrôleur de qualité :
+# - mesure le temps de travail de chaque frame (sans l'attente de clock.tick())
+#   sur une fenêtre glissante de WINDOW frames
+# - descend d'un niveau quand la moyenne dépasse le budget de 60 FPS
+# - remonte d'un niveau quand il reste beaucoup de marge (hystérésis : les deux seuils
+#   sont éloignés, et la fenêtre est vidée après chaque changement)
+# - si une remontée fait de nouveau rater le budget, la remontée suivante attend deux fois
+#   plus longtemps (pas d'oscillation entre deux niveaux)
+# Option --quality : niveau fixe choisi par le joueur (auto par défaut).
+
+from collections import deque  # Fenêtre glissante des temps de frame
+
+from snake_hud import FRAME_BUDGET_MS
+from snake_particles import BURST
+from snake_sprites import TRAIL_LENGTH
+
+# Niveaux du plus beau au plus léger ; chaque niveau retire un effet de plus
+QUALITY_TIERS = [
+    # Tous les effets
+    {'name': 'high', 'particles': BURST, 'trail': TRAIL_LENGTH, 'glow': True, 'animated': True},
+    # Moins de particules par gerbe
+    {'name': 'medium', 'particles': 6, 'trail': TRAIL_LENGTH, 'glow': True, 'animated': True},
+    # Traînée plus courte
+    {'name': 'low', 'particles': 6, 'trail': 3, 'glow': True, 'animated': True},
+    # Sans lueur (tête et nourriture)
+    {'name': 'minimal', 'particles': 6, 'trail': 3, 'glow': False, 'animated': True},
+    # Image fixe : ni particules, ni traînée, ni pulsation de la nourriture
+    {'name': 'static', 'particles': 0, 'trail': 0, 'glow': False, 'animated': False},
+]
+TIER_NAMES = [tier['name'] for tier in QUALITY_TIERS]
+
+# Nombre de frames de la fenêtre glissante (une seconde à 60 FPS)
+WINDOW = 60
+# Seuils en fraction du budget : descente au-dessus, remontée en dessous
+DOWN_RATIO = 0.9
+UP_RATIO = 0.5
+# Attente minimale avant une remontée (frames), doublée à chaque oscillation, et son maximum
+UP_DELAY = 2 * WINDOW
+MAX_UP_DELAY = 64 * WINDOW
+
+
+class QualityController:
+    """
+    Choix automatique (ou fixe) du niveau de qualité
+    Utilisation dans une boucle de jeu :
+        game.quality = quality.tier
+        ... frame ...
+        quality.record(temps de travail de la frame en ms)
+    """
+
+    def __init__(self, tier=None, budget_ms=FRAME_BUDGET_MS, window=WINDOW):
+        """
+        Args:
+            tier: Nom d'un niveau de QUALITY_TIERS (fixe), ou None pour le mode automatique
+            budget_ms: Temps de travail maximal d'une frame (millisecondes)
+            window: Nombre de frames de la fenêtre glissante
+        """
+        self.auto = tier is None
+        self.index = 0 if tier is None else TIER_NAMES.index(tier)
+        self.budget_ms = budget_ms
+        self.frames = deque(maxlen=window)
+        self.up_delay = UP_DELAY
+        self.since_change = 0  # Frames depuis le dernier changement de niveau
+        self.last_step = 0  # -1 : dernière remontée, +1 : dernière descente
+        self.changes = 0  # Nombre de changements de niveau (statistique)
+
+    @property
+    def tier(self):
+        """Niveau courant (dictionnaire de QUALITY_TIERS)"""
+        return QUALITY_TIERS[self.index]
+
+    @property
+    def name(self):
+        return self.tier['name']
+
+    def record(self, work_ms):
+        """
+        Ajoute le temps de travail d'une frame et change de niveau si nécessaire
+        Returns:
+            bool: True si le niveau a changé
+        """
+        if not self.auto:
+            return False
+        self.frames.append(work_ms)
+        self.since_change += 1
+        if len(self.frames) < self.frames.maxlen:
+            return False
+
+        average = sum(self.frames) / len(self.frames)
+        if average > self.budget_ms * DOWN_RATIO and self.index < len(QUALITY_TIERS) - 1:
+            if self.last_step == -1 and self.since_change < self.up_delay + len(self.frames):
+                # La dernière remontée a fait rater le budget : attendre plus longtemps la prochaine
+                self.up_delay = min(self.up_delay * 2, MAX_UP_DELAY)
+            self.step(+1)
+            return True
+        if (average < self.budget_ms * UP_RATIO and self.index > 0
+                and self.since_change >= self.up_delay):
+            self.step(-1)
+            return True
+        return False
+
+    def step(self, direction):
+        """Change de niveau (+1 : plus léger, -1 : plus beau) et vide la fenêtre"""
+        self.index += direction
+        self.last_step = direction
+        self.since_change = 0
+        self.frames.clear()
+        self.changes += 1
+
+
+def create_quality_controller(args):
+    """
+    Returns:
+        QualityController automatique (--quality auto) ou fixé au niveau demandé
+    """
+    return QualityController(None if args.quality == 'auto' else args.quality)
+
+
+def add_quality_argument(parser):
+    """Ajoute l'option --quality à un argparse.ArgumentParser"""
+    parser.add_argument('--quality', choices=['auto'] + TIER_NAMES, default='auto',
+                        help="Niveau des effets visuels (auto : ajusté selon le temps de frame)")
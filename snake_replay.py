@@ -0,0 +1,254 @@
+# Ce fichier implémente l'export d'une partie de la version premium en images, sans fenêtre.
+# - La partie vient d'une session enregistrée (snake_server.py --record partie.json)
+#   ou d'une session scriptée jouée par le bot (--bot TICKS)
+# - Elle est re-simulée tick par tick avec le pilote SDL factice (SDL_VIDEODRIVER=dummy) :
+#   mêmes graines, mêmes commandes, donc exactement la même partie
+# - Chaque image est dessinée par le rendu premium (draw_frame de snake_server) à une
+#   cadence fixe (60 images par seconde par défaut), serpent interpolé entre les ticks
+# - Les images sont réparties en blocs entre plusieurs processus (ProcessPoolExecutor) :
+#   chaque processus re-simule la partie jusqu'au début de son bloc (quelques microsecondes
+#   par tick, sans dessin) puis dessine et écrit ses images ; le débit augmente avec le
+#   nombre de cœurs
+# - Sortie : images PNG numérotées (frame_000000.png...) ou un seul fichier RGB brut
+#   (frames.rgb) où chaque image est écrite à sa place, quel que soit le processus
+#
+# Utilisation :
+#   python snake_replay.py partie.json --out images/
+#   python snake_replay.py --bot 600 --level 3 --theme neon --format raw --out images/
+#   ffmpeg -framerate 60 -i images/frame_%06d.png clip.mp4
+#   ffmpeg -f rawvideo -pix_fmt rgb24 -s 550x550 -r 60 -i images/frames.rgb clip.mp4
+
+import os
+
+# Pilotes factices AVANT l'import de pygame (les modules de jeu appellent pygame.init())
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse  # Options de la ligne de commande
+import multiprocessing  # Processus lancés par "spawn" (aucun état SDL hérité)
+import random  # Graine de la partie
+import time  # Débit de l'export
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+from pygame.math import Vector2
+
+import snake_server
+from snake_bot import PathfindingBot, BotWorld, cell
+from snake_loop import FixedTimestep
+from snake_particles import create_particle_pool
+from snake_quality import QUALITY_TIERS, TIER_NAMES
+from snake_session import VERSION, load_session
+
+# Cadence des images exportées
+FPS = 60
+# Blocs d'images par processus (répartition de la charge : certains blocs ont plus de particules)
+CHUNKS_PER_WORKER = 4
+# Taille de l'écran de jeu (identique à la fenêtre de snake_server)
+SIZE = 2 * snake_server.OFFSET + snake_server.cell_size * snake_server.number_of_cells
+# Nom du fichier de sortie du format brut
+RAW_FILE = "frames.rgb"
+
+
+class Replay:
+    """
+    Re-simulation d'une session, image par image
+    Utilisation :
+        replay = Replay(session)
+        replay.draw(screen)          # image 0
+        replay.advance()             # image 1 (ticks et particules)
+        replay.draw(screen)
+    """
+
+    def __init__(self, session, fps=FPS, quality='high'):
+        """
+        Args:
+            session: Session enregistrée (snake_session) ou scriptée (scripted_session)
+            fps: Images par seconde de l'export
+            quality: Niveau de qualité des effets (fixe, voir snake_quality)
+        """
+        self.fps = fps
+        # Mêmes tirages aléatoires que la partie d'origine (obstacles, nourriture)
+        random.seed(session['seed'])
+        self.game = snake_server.Game(session['player'], session['level'], session['theme'])
+        # Particules reproductibles d'un processus à l'autre
+        self.game.particles = create_particle_pool(seed=session['seed'])
+        self.game.quality = QUALITY_TIERS[TIER_NAMES.index(quality)]
+        # Aucun rattrapage limité : le temps de l'export ne « prend jamais de retard »
+        self.timestep = FixedTimestep(session['step_ms'], max_steps=session['ticks'] + 1)
+        self.events = {}  # tick -> commandes à appliquer juste avant ce tick
+        for event in session['events']:
+            self.events.setdefault(event[0], []).append(event[1:])
+        self.frame = 0
+        self.now_ms = 0
+
+    def advance(self):
+        """Passe à l'image suivante : ticks écoulés (avec les commandes) et particules"""
+        self.frame += 1
+        now_ms = self.frame * 1000 // self.fps
+        elapsed = now_ms - self.now_ms
+        self.now_ms = now_ms
+        first = self.timestep.ticks
+        for tick in range(first, first + self.timestep.advance(elapsed)):
+            self.apply(tick)
+            self.game.update()
+        self.game.animate(elapsed / 1000.0)
+
+    def apply(self, tick):
+        """Commandes du joueur enregistrées pour ce tick"""
+        for command in self.events.get(tick, ()):
+            if command[0] == 'start':
+                self.game.state = "RUNNING"
+            elif command[0] == 'dir':
+                self.game.snake.direction = Vector2(command[1], command[2])
+
+    def draw(self, screen):
+        """Dessine l'image courante (horloge des animations = temps de la partie)"""
+        snake_server.draw_frame(screen, self.game, alpha=self.timestep.alpha, now_ms=self.now_ms)
+
+
+def frame_count(session, fps=FPS):
+    """Nombre d'images de la session (de l'instant 0 au dernier tick)"""
+    return session['ticks'] * session['step_ms'] * fps // 1000 + 1
+
+
+def scripted_session(ticks, level=3, theme_key='neon', seed=3, player_name="Bot"):
+    """
+    Session jouée par le bot (snake_bot), redémarrée aussitôt après chaque game over
+    Returns:
+        dict: Session au même format que celles de snake_session
+    """
+    session = {
+        'version': VERSION,
+        'mode': 'premium',
+        'player': player_name,
+        'level': level,
+        'theme': theme_key,
+        'seed': seed,
+        'step_ms': snake_server.LEVELS[level]['speed'],
+        'ticks': ticks,
+        'events': [],
+    }
+    random.seed(seed)
+    game = snake_server.Game(player_name, level, theme_key)
+    bot = PathfindingBot()
+    obstacles = {cell(obstacle.position) for obstacle in game.obstacles}
+    direction = (int(game.snake.direction.x), int(game.snake.direction.y))
+    for tick in range(ticks):
+        if game.state == "STOPPED":
+            game.state = "RUNNING"
+            session['events'].append([tick, 'start'])
+            direction = (int(game.snake.direction.x), int(game.snake.direction.y))
+        world = BotWorld(snake_server.number_of_cells,
+                         obstacles | {cell(segment) for segment in game.snake.snake_body},
+                         [game.food1.position, game.food2.position])
+        choice = tuple(bot.choose_direction(game.snake.snake_body[0], game.snake.direction,
+                                            len(game.snake.snake_body), world))
+        if choice != direction:
+            session['events'].append([tick, 'dir', choice[0], choice[1]])
+            direction = choice
+        game.snake.direction = Vector2(choice)
+        game.update()
+    return session
+
+
+def init_worker():
+    """Fenêtre factice du processus (les sprites sont convertis à son format)"""
+    pygame.display.set_mode((SIZE, SIZE))
+
+
+def render_chunk(session, start, end, out, fmt, fps, quality):
+    """
+    Dessine et écrit les images start..end-1 (exécuté dans un processus du pool)
+    Returns:
+        int: Nombre d'images écrites
+    """
+    screen = pygame.display.get_surface() or pygame.display.set_mode((SIZE, SIZE))
+    replay = Replay(session, fps, quality)
+    while replay.frame < start:
+        replay.advance()
+    raw = open(os.path.join(out, RAW_FILE), 'r+b') if fmt == 'raw' else None
+    try:
+        for frame in range(start, end):
+            if frame > start:
+                replay.advance()
+            replay.draw(screen)
+            if raw is None:
+                pygame.image.save(screen, os.path.join(out, f"frame_{frame:06d}.png"))
+            else:
+                # Chaque image à sa place dans le fichier : l'ordre ne dépend pas des processus
+                raw.seek(frame * SIZE * SIZE * 3)
+                raw.write(pygame.image.tobytes(screen, 'RGB'))
+    finally:
+        if raw is not None:
+            raw.close()
+    return end - start
+
+
+def split_frames(start, end, chunks):
+    """Découpe [start, end) en au plus chunks blocs contigus de tailles voisines"""
+    chunks = max(1, min(chunks, end - start))
+    bounds = [start + (end - start) * i // chunks for i in range(chunks + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def export(session, out, fmt='png', fps=FPS, quality='high', workers=None, start=0, end=None):
+    """
+    Exporte les images [start, end) de la session dans le dossier out
+    Args:
+        workers: Nombre de processus (None : un par cœur ; 1 : dans ce processus)
+    Returns:
+        int: Nombre d'images écrites
+    """
+    end = frame_count(session, fps) if end is None else min(end, frame_count(session, fps))
+    os.makedirs(out, exist_ok=True)
+    if fmt == 'raw':
+        # Fichier à la taille finale : les processus écrivent chacun à leur position
+        with open(os.path.join(out, RAW_FILE), 'ab') as raw:
+            raw.truncate(end * SIZE * SIZE * 3)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return sum(render_chunk(session, a, b, out, fmt, fps, quality)
+                   for a, b in split_frames(start, end, 1))
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=init_worker) as pool:
+        jobs = [pool.submit(render_chunk, session, a, b, out, fmt, fps, quality)
+                for a, b in split_frames(start, end, workers * CHUNKS_PER_WORKER)]
+        return sum(job.result() for job in jobs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake - export d'une partie premium en images")
+    parser.add_argument('session', nargs='?', help="Session enregistrée (snake_server.py --record)")
+    parser.add_argument('--bot', type=int, metavar='TICKS',
+                        help="Session scriptée : le bot joue TICKS ticks")
+    parser.add_argument('--level', type=int, choices=sorted(snake_server.LEVELS), default=3,
+                        help="Niveau de la session scriptée")
+    parser.add_argument('--theme', choices=sorted(snake_server.COLOR_THEMES), default='neon',
+                        help="Thème de la session scriptée")
+    parser.add_argument('--seed', type=int, default=3, help="Graine de la session scriptée")
+    parser.add_argument('--out', default="replay_frames", help="Dossier des images")
+    parser.add_argument('--format', choices=['png', 'raw'], default='png',
+                        help=f"Images PNG numérotées ou un fichier RGB brut ({RAW_FILE})")
+    parser.add_argument('--fps', type=int, default=FPS, help="Images par seconde")
+    parser.add_argument('--quality', choices=TIER_NAMES, default='high', help="Niveau des effets")
+    parser.add_argument('--workers', type=int, help="Nombre de processus (un par cœur par défaut)")
+    parser.add_argument('--start', type=int, default=0, help="Première image exportée")
+    parser.add_argument('--end', type=int, help="Image de fin (exclue)")
+    args = parser.parse_args()
+    if (args.session is None) == (args.bot is None):
+        parser.error("give either a session file or --bot TICKS")
+
+    if args.bot is not None:
+        session = scripted_session(args.bot, args.level, args.theme, args.seed)
+    else:
+        session = load_session(args.session)
+    begin = time.perf_counter()
+    frames = export(session, args.out, args.format, args.fps, args.quality,
+                    args.workers, args.start, args.end)
+    seconds = time.perf_counter() - begin
+    print(f"{frames} frames -> {args.out} in {seconds:.1f} s ({frames / max(seconds, 1e-9):.0f} frames/s)")
+
+
+if __name__ == "__main__":
+    main()
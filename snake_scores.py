@@ -0,0 +1,298 @@
+# Ce fichier implémente le stockage des meilleurs scores (mode solo snake_game.py et
+# version premium snake_server.py, un classement par niveau).
+# Avant, chaque nouveau record réécrivait tout scores.json (indent=4) et le démarrage
+# relisait tout le fichier ; deux parties lancées en même temps s'écrasaient l'une l'autre.
+# Maintenant :
+# - les scores sont dans une base SQLite (scores.db) en mode WAL : les lectures ne
+#   bloquent pas les écritures et plusieurs processus peuvent jouer en même temps
+# - un record est une seule requête (INSERT ... ON CONFLICT DO UPDATE) qui ne remplace
+#   le score que s'il est meilleur : atomique, aucune relecture du fichier
+# - index : clé primaire (mode, niveau, identifiant, nom) pour le record d'un joueur,
+#   index (mode, niveau, score) pour les classements
+# - au premier lancement, l'ancien scores.json est importé une fois (les records existants
+#   sont conservés, le fichier n'est plus modifié ensuite)
+# - une base de l'ancien format (sans mode ni niveau) est convertie à l'ouverture : ses
+#   records deviennent ceux du mode solo
+# - pendant la partie, les records sont écrits par un thread dédié (ScoreWriter) : le game
+#   over (dans le tick) ne fait que déposer le score, sans jamais attendre le disque ; les
+#   records arrivés ensemble sont regroupés en une seule transaction, et tout ce qui est en
+#   attente est écrit à la fermeture
+
+import atexit  # Records en attente écrits à la sortie du programme
+import json  # Ancien fichier de scores
+import os
+import sqlite3
+import threading  # Thread d'écriture des records
+import time  # Échéance du regroupement des records
+
+# Base de données des scores et ancien fichier JSON importé à sa création
+SCORES_DB = "scores.db"
+LEGACY_FILE = "scores.json"
+# Attente maximale quand un autre processus écrit en même temps (secondes)
+BUSY_TIMEOUT = 5.0
+# Délai de regroupement des records arrivés ensemble (secondes)
+COALESCE_SECONDS = 0.05
+# Délai avant de retenter une ouverture ou une écriture échouée (base verrouillée trop longtemps)
+RETRY_SECONDS = 1.0
+
+# Mode et niveau des records du mode solo (un seul niveau)
+SOLO = 'solo'
+SOLO_LEVEL = 0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    mode TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (mode, level, player_id, name)
+);
+CREATE INDEX IF NOT EXISTS scores_by_board ON scores (mode, level, score DESC);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Record enregistré seulement s'il dépasse le précédent
+UPSERT = """
+INSERT INTO scores (mode, level, player_id, name, score) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (mode, level, player_id, name) DO UPDATE SET score = excluded.score
+WHERE excluded.score > scores.score
+"""
+
+# Conversion de l'ancien format (clé primaire (identifiant, nom), mode solo uniquement)
+MIGRATE_V1 = f"""
+ALTER TABLE scores RENAME TO scores_v1;
+DROP INDEX IF EXISTS scores_by_score;
+{SCHEMA}
+INSERT INTO scores (mode, level, player_id, name, score)
+    SELECT '{SOLO}', {SOLO_LEVEL}, player_id, name, score FROM scores_v1;
+DROP TABLE scores_v1;
+"""
+
+
+class ScoreStore:
+    """
+    Meilleur score de chaque joueur (identifiant + nom)
+    Utilisation :
+        store = ScoreStore()
+        store.submit("12", "malek", 195)    # True si c'est un nouveau record
+        store.best("12", "malek")           # 195
+    """
+
+    def __init__(self, path=SCORES_DB, legacy_file=None):
+        """
+        Args:
+            path: Fichier de la base SQLite (créé si absent)
+            legacy_file: Ancien scores.json à importer une fois
+                         (None : scores.json du même dossier que la base)
+        """
+        self.path = path
+        if legacy_file is None:
+            legacy_file = os.path.join(os.path.dirname(path), LEGACY_FILE)
+        # isolation_level=None : chaque requête est validée aussitôt (transactions explicites)
+        self.connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL : pas de fsync à chaque record, la base reste cohérente après un crash
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.migrate()
+        self.connection.executescript(SCHEMA)
+        self.import_json(legacy_file)
+
+    def migrate(self):
+        """Convertit une base de l'ancien format (table scores sans mode ni niveau)"""
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            columns = [row[1] for row in connection.execute("PRAGMA table_info(scores)")]
+            if columns and 'mode' not in columns:
+                # Requête par requête (executescript validerait la transaction en cours)
+                for statement in MIGRATE_V1.split(';'):
+                    if statement.strip():
+                        connection.execute(statement)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def import_json(self, legacy_file):
+        """
+        Importe un ancien scores.json (une seule fois par base)
+        Returns:
+            int: Nombre de joueurs importés (0 si déjà fait ou fichier absent)
+        """
+        connection = self.connection
+        # BEGIN IMMEDIATE : un seul processus fait l'import si plusieurs démarrent ensemble
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if connection.execute("SELECT 1 FROM meta WHERE key = 'imported_json'").fetchone():
+                connection.execute("COMMIT")
+                return 0
+            rows = []
+            if os.path.exists(legacy_file):
+                with open(legacy_file, 'r') as f:
+                    rows = [(SOLO, SOLO_LEVEL, str(entry['id']), entry['name'], int(entry['score']))
+                            for entry in json.load(f).values()]
+            connection.executemany(UPSERT, rows)
+            connection.execute("INSERT INTO meta (key, value) VALUES ('imported_json', ?)",
+                               (legacy_file,))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def submit(self, player_id, name, score, mode=SOLO, level=SOLO_LEVEL):
+        """
+        Enregistre un score s'il bat le record du joueur (dans ce mode et ce niveau)
+        Returns:
+            bool: True si c'est un nouveau record
+        """
+        cursor = self.connection.execute(UPSERT, (mode, level, str(player_id), name, score))
+        return cursor.rowcount > 0
+
+    def submit_many(self, records):
+        """
+        Enregistre plusieurs records en une seule transaction (tous ou aucun)
+        Args:
+            records: Tuples (mode, niveau, identifiant, nom, score)
+        """
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(UPSERT, [(mode, level, str(player_id), name, score)
+                                            for mode, level, player_id, name, score in records])
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def best(self, player_id, name, mode=SOLO, level=SOLO_LEVEL):
+        """Record du joueur, ou None s'il n'a jamais joué"""
+        row = self.connection.execute(
+            "SELECT score FROM scores WHERE mode = ? AND level = ? AND player_id = ? AND name = ?",
+            (mode, level, str(player_id), name)
+        ).fetchone()
+        return row[0] if row else None
+
+    def top(self, limit=10, mode=SOLO, level=SOLO_LEVEL):
+        """
+        Meilleurs records, du plus haut au plus bas
+        Returns:
+            list: Tuples (identifiant, nom, score)
+        """
+        return self.connection.execute(
+            "SELECT player_id, name, score FROM scores WHERE mode = ? AND level = ? "
+            "ORDER BY score DESC LIMIT ?", (mode, level, limit)
+        ).fetchall()
+
+    def rows(self):
+        """
+        Tous les records (reconstruction des classements en mémoire, snake_leaderboard)
+        Returns:
+            list: Tuples (mode, niveau, identifiant, nom, score)
+        """
+        return self.connection.execute(
+            "SELECT mode, level, player_id, name, score FROM scores"
+        ).fetchall()
+
+    def close(self):
+        self.connection.close()
+
+
+class ScoreWriter(threading.Thread):
+    """
+    Écrit les records sur un thread dédié
+    submit() ne fait que noter le score (quelques microsecondes, sans accès disque) ;
+    le thread écrit tous les scores en attente dans une transaction.
+    Utilisation :
+        writer = ScoreWriter()
+        writer.submit("12", "malek", 195)   # depuis le game over
+        writer.close()                      # à la fermeture : écrit tout ce qui reste
+    """
+
+    def __init__(self, path=SCORES_DB):
+        super().__init__(name="score-writer", daemon=True)
+        self.path = path
+        self._pending = {}  # (mode, niveau, identifiant, nom) -> meilleur score en attente
+        self._condition = threading.Condition()
+        self._closed = False
+        self.batches = 0  # Transactions écrites (statistique)
+        self.start()
+        # Fenêtre fermée autrement que par la croix (sys.exit d'un menu, exception) :
+        # les records en attente sont quand même écrits
+        atexit.register(self.close)
+
+    def submit(self, player_id, name, score, mode=SOLO, level=SOLO_LEVEL):
+        """Note un score à écrire (seul le meilleur d'un joueur est gardé s'il en arrive plusieurs)"""
+        key = (mode, level, str(player_id), name)
+        with self._condition:
+            if score > self._pending.get(key, score - 1):
+                self._pending[key] = score
+            self._condition.notify()
+
+    def run(self):
+        # Connexion propre au thread : le thread principal n'attend jamais un verrou SQLite
+        store = self._open()
+        if store is None:
+            return
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._pending or self._closed)
+                    # Laisse arriver les autres records de la même rafale (submit réveille le
+                    # thread à chaque record : on attend jusqu'à l'échéance, pas le premier réveil)
+                    deadline = time.monotonic() + COALESCE_SECONDS
+                    while not self._closed and (left := deadline - time.monotonic()) > 0:
+                        self._condition.wait(left)
+                    batch, self._pending = self._pending, {}
+                    closed = self._closed
+                if batch:
+                    self._write(store, batch, retry=not closed)
+                if closed:
+                    with self._condition:
+                        if not self._pending:
+                            break
+        finally:
+            store.close()
+
+    def _open(self):
+        """
+        Ouvre la base du thread, en réessayant tant qu'elle reste verrouillée ou illisible
+        Returns:
+            ScoreStore, ou None si le jeu se ferme avant qu'elle ait pu être ouverte
+        """
+        while True:
+            try:
+                return ScoreStore(self.path)
+            except (sqlite3.Error, OSError) as error:
+                with self._condition:
+                    if self._closed:
+                        print(f"Scores not saved: {error}")
+                        return None
+                    print(f"Scores not saved yet: {error}")
+                    self._condition.wait(RETRY_SECONDS)
+
+    def _write(self, store, batch, retry):
+        try:
+            store.submit_many([(*key, score) for key, score in batch.items()])
+            self.batches += 1
+        except sqlite3.Error as error:
+            print(f"Scores not saved yet: {error}")
+            if retry:
+                # Remis en attente (sans écraser un meilleur score arrivé entre-temps)
+                with self._condition:
+                    for key, score in batch.items():
+                        if score > self._pending.get(key, score - 1):
+                            self._pending[key] = score
+                    self._condition.wait(RETRY_SECONDS)
+
+    def close(self, timeout=BUSY_TIMEOUT * 2):
+        """Écrit les records en attente puis arrête le thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
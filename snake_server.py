@@ -22,6 +22,45 @@ import json
 # Utilisé pour vérifier l'existence de fichiers
 
 import os
+# Gestionnaire d'images partagé (chargement unique, conversion, cache par taille)
+from snake_assets import assets
+# Lecture des options de la ligne de commande (--profile, ...)
+import argparse
+# Mesure du temps de travail de chaque frame (contrôleur de qualité)
+import time
+# Profileur de frames par phase (désactivé par défaut)
+from snake_profiler import NULL_PROFILER, add_profile_arguments, create_profiler
+# Overlay de performances (touche F3)
+from snake_hud import PerfOverlay, add_hud_argument
+# Cache des couches statiques (dégradé, bordure, obstacles, titre)
+from snake_background import BackgroundLayer, cells_key
+# Rendu par zones modifiées (option --dirty-rects)
+from snake_dirty import add_dirty_argument, create_dirty_rects
+# Polices chargées une seule fois et cache des textes rendus
+from snake_text import fonts
+# Moteur de particules (tableaux NumPy, ou listes Python sans NumPy)
+from snake_particles import create_particle_pool
+# Sprites du serpent précalculés par thème (tête, corps, traînée)
+from snake_sprites import GLOW, GRADIENT_STEPS, PULSE_MARGIN, TRAIL_LENGTH, food_pulse, snake_atlas
+# Simulation à pas de temps fixe et déplacement interpolé entre deux ticks
+from snake_loop import interpolate
+# Niveaux de qualité des effets, ajustés selon le temps de frame (option --quality)
+from snake_quality import QUALITY_TIERS, add_quality_argument, create_quality_controller
+# Menus pilotés par les événements (redessinés seulement quand ils changent)
+from snake_menu import MenuView
+# Fenêtre agrandie, le jeu étant dessiné à sa taille normale (--pixel-scale, --scaled)
+from snake_framebuffer import add_display_arguments, create_framebuffer
+# Sons décodés une fois, mixer à faible latence (importé avant pygame.init())
+from snake_audio import sounds
+# Enregistrement de la partie (--record), rejouable par snake_replay.py
+from snake_session import add_record_argument, create_recorder
+# Simulation dans la boucle principale ou sur un thread séparé (--threaded)
+from snake_pipeline import add_threaded_argument, create_simulation
+# Records par niveau (SQLite) et classement en mémoire (rang, top N)
+from snake_scores import SCORES_DB
+from snake_leaderboard import Scoreboard
+# Historique de toutes les parties terminées (écrit par lots, --no-history pour le désactiver)
+from snake_history import add_history_argument, create_history
 # Initialise tous les modules de pygame
 # DOIT être appelé avant d'utiliser toute fonctionnalité pygame
 
@@ -149,101 +188,6 @@ FOOD_TYPES = {
 }
 
 
-class ParticleEffect:
-
-    """
-    Classe pour créer de beaux effets de particules lorsque le serpent mange
-    Les particules s'envolent dans toutes les directions avec de la physique
-    """
-    def __init__(self, x, y, color):
-        """
-        Constructeur de l'effet de particules
-        Args:
-            x: Position X du centre de l'effet
-            y: Position Y du centre de l'effet
-            color: Couleur des particules
-        """
-        self.particles = []
-        # Liste pour stocker toutes les particules individuelles
-         # Crée 15 particules
-
-        for _ in range(15):
-            # Angle aléatoire en degrés (0-360) pour la direction de la particule
-            angle = random.uniform(0, 360)
-            # Vitesse aléatoire entre 2 et 6 pixels par frame
-            speed = random.uniform(2, 6)
-            self.particles.append({
-                # Ajoute une particule avec ses propriétés
-                'x': x,  # Position X initiale
-                'y': y,  # Position Y initiale
-                'vx': speed * pygame.math.Vector2(1, 0).rotate(angle).x,
-                # Vitesse horizontale calculée avec trigonométrie
-                # Vector2(1, 0) est un vecteur unitaire horizontal
-                # rotate(angle) le fait tourner
-                # .x récupère la composante X
-                
-                'vy': speed * pygame.math.Vector2(1, 0).rotate(angle).y,
-                # Vitesse verticale (même calcul pour Y)
-                
-                'life': 30,  # Durée de vie en frames (30 frames ≈ 0.5 seconde à 60 FPS)
-                'color': color  # Couleur de la particule
-            })
-    
-    def update(self):
-        """
-        Met à jour toutes les particules à chaque frame
-        Applique le mouvement et la gravité
-        """
-        for p in self.particles:
-            # Pour chaque particule
-            
-            p['x'] += p['vx']
-            # Déplace la particule horizontalement selon sa vitesse
-            
-            p['y'] += p['vy']
-            # Déplace la particule verticalement selon sa vitesse
-            
-            p['life'] -= 1
-            # Réduit la durée de vie (la particule va disparaître)
-            
-            p['vy'] += 0.2  # Gravité
-            # Ajoute une accélération vers le bas (effet de gravité)
-            # Fait tomber les particules progressivement
-        
-        self.particles = [p for p in self.particles if p['life'] > 0]
-        # Filtre la liste: garde seulement les particules encore vivantes
-        # Supprime les particules dont life <= 0
-    
-    def draw(self, screen):
-        """
-        Dessine toutes les particules à l'écran
-        Args:
-            screen: Surface pygame où dessiner
-        """
-        for p in self.particles:
-            # Pour chaque particule vivante
-            
-            alpha = int(255 * (p['life'] / 30))
-            # Calcule la transparence basée sur la durée de vie restante
-            # Plus la particule est proche de mourir, plus elle est transparente
-            # 255 = opaque, 0 = invisible
-            
-            size = int(4 * (p['life'] / 30))
-            # Calcule la taille basée sur la durée de vie
-            # Les particules rétrécissent en mourant
-            
-            if size > 0:
-                # Ne dessine que si la taille est visible
-                
-                color = (*p['color'][:3], alpha) if len(p['color']) > 3 else p['color']
-                # Ajoute la transparence à la couleur si nécessaire
-                # (*p['color'][:3], alpha) = (R, G, B, alpha)
-                
-                pygame.draw.circle(screen, color, (int(p['x']), int(p['y'])), size)
-                # Dessine un cercle pour représenter la particule
-
-
-
 class Food:
     """
     Classe représentant la nourriture que le serpent doit manger
@@ -274,101 +218,46 @@ class Food:
         
         self.load_image()
         # Charge l'image correspondant au type de nourriture
-        
-        self.pulse = 0  # Animation
-        # Variable pour l'animation de pulsation (breathing effect)
   
     def load_image(self):
         """
-        Charge l'image de la nourriture depuis un fichier
-        Crée une image de secours si le fichier n'existe pas
+        Récupère l'image de la nourriture depuis le gestionnaire d'images partagé
+        L'image n'est chargée et convertie qu'une seule fois pour toutes les instances
+        Un cercle de couleur (lui aussi mis en cache) sert de secours si le fichier manque
         """
-        try:
-            # Tente de charger l'image
-            
-            image_path = FOOD_TYPES[self.food_type]['image']
-            # Récupère le chemin du fichier image depuis le dictionnaire FOOD_TYPES
-            
-            self.surface = pygame.image.load(image_path)
-            # Charge l'image dans une Surface pygame
-            
-            self.surface = pygame.transform.scale(self.surface, (cell_size, cell_size))
-            # Redimensionne l'image pour qu'elle corresponde exactement à la taille d'une cellule
-            
-        except:
-            # Si le chargement échoue (fichier manquant, corrompu, etc.)
-            
-            self.surface = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
-            # Crée une surface vide transparente de la bonne taille
-            # pygame.SRCALPHA permet la transparence
-            
-            color = RED if self.food_type == 'apple' else ORANGE
-            # Choisit la couleur: rouge pour pomme, orange pour champignon
-            
-            pygame.draw.circle(self.surface, color, (cell_size//2, cell_size//2), cell_size//2)
-            # Dessine un cercle simple comme image de secours
-            # Centre: (cell_size//2, cell_size//2) = centre de la cellule
-            # Rayon: cell_size//2 = le cercle remplit la cellule
+        color = RED if self.food_type == 'apple' else ORANGE
+        # Choisit la couleur de secours: rouge pour pomme, orange pour champignon
+        
+        self.surface = assets.food(FOOD_TYPES[self.food_type]['image'], color, cell_size)
+        # Surface partagée: ne jamais la modifier directement
 
-    def draw(self, screen):
+        self.glow_color = (255, 255, 100, 50) if self.food_type == 'apple' else (255, 150, 50, 50)
+        # Couleur de la lueur avec transparence (dernière valeur = alpha)
+        # Jaune pour pomme, orange pour champignon
+
+    def draw(self, screen, now_ms=None, glow=True):
         """
         Dessine la nourriture à l'écran avec une animation de pulsation
         Args:
             screen: Surface pygame où dessiner
+            now_ms: Instant de l'animation en millisecondes (pygame.time.get_ticks() si None)
+            glow: Lueur autour de la nourriture (niveau de qualité)
         """
         # === ANIMATION DE PULSATION ===
-        self.pulse = (self.pulse + 0.1) % (2 * 3.14159)
-        # Incrémente la variable pulse (0.1 par frame)
-        # % (2 * π) fait une boucle de 0 à 2π (un cycle complet)
-        # Utilisé pour créer une animation cyclique
-        
-        scale = 1 + 0.1 * abs(pygame.math.Vector2(0, 1).rotate(self.pulse * 50).y)
-        # Calcule le facteur d'échelle pour l'animation
-        # 1 = taille normale
-        # +/- 0.1 = variation de 10%
-        # abs(...) assure que l'échelle est toujours positive
-        # rotate(self.pulse * 50) crée une oscillation sinusoïdale
-        
-        size = int(cell_size * scale)
-        # Calcule la taille actuelle en pixels (varie entre 90% et 110% de cell_size)
-        
-        offset_adjust = (cell_size - size) // 2
-        # Calcule le décalage pour centrer l'image redimensionnée
-        # Si size < cell_size, on doit décaler pour recentrer
-        
-        scaled_surface = pygame.transform.scale(self.surface, (size, size))
-        # Redimensionne l'image à la taille actuelle de l'animation
-        
-        food_rec = pygame.Rect(
-            OFFSET + self.position.x * cell_size + offset_adjust,
-            OFFSET + self.position.y * cell_size + offset_adjust,
-            size, size
-        )
-        # Crée un rectangle définissant la position et la taille de la nourriture
-        # OFFSET + position * cell_size = conversion grille → pixels
-        # + offset_adjust = centrage
-        
-        # === EFFET DE LUEUR (GLOW) ===
-        glow_size = size + 6
-        # La lueur est légèrement plus grande que la nourriture
-        
-        glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-        # Crée une surface transparente pour la lueur
-        
-        glow_color = (255, 255, 100, 50) if self.food_type == 'apple' else (255, 150, 50, 50)
-        # Couleur de la lueur avec transparence (dernière valeur = alpha)
-        # Jaune pour pomme, orange pour champignon
-        # 50 = assez transparent
-        
-        pygame.draw.circle(glow_surf, glow_color, (glow_size//2, glow_size//2), glow_size//2)
-        # Dessine un cercle flou pour la lueur
+        if now_ms is None:
+            now_ms = pygame.time.get_ticks()
+        # L'image dépend de l'heure (et non du nombre de frames dessinées) :
+        # la vitesse de pulsation ne varie pas avec le FPS
         
-        screen.blit(glow_surf, (food_rec.x - 3, food_rec.y - 3))
-        # Dessine la lueur légèrement décalée derrière la nourriture
-        # -3 pour centrer la lueur (puisqu'elle est +6 pixels plus grande)
+        glow_color = self.glow_color if glow else None
+        frame = food_pulse(self.food_type, self.surface, glow_color, cell_size).frame(now_ms)
+        # Image du cycle (nourriture de 100 % à 110 % + lueur), précalculée une fois par type
+        # et partagée par toutes les nourritures de ce type (voir snake_sprites.py)
         
-        screen.blit(scaled_surface, food_rec)
-        # Dessine l'image de la nourriture par-dessus la lueur
+        screen.blit(frame, (OFFSET + self.position.x * cell_size - PULSE_MARGIN,
+                            OFFSET + self.position.y * cell_size - PULSE_MARGIN))
+        # Un seul blit, aucune allocation
+        # L'image déborde de PULSE_MARGIN pixels autour de la case (taille 110 % + lueur)
 
     def generate_random_cell(self):
         """
@@ -432,20 +321,9 @@ class Obstacle:
         self.position = position
         # Stocke la position de l'obstacle
         
-        try:
-            # Tente de charger l'image de brique
-            
-            self.brick_image = pygame.image.load('barier.png')
-            # Charge l'image du fichier
-            
-            self.brick_image = pygame.transform.scale(self.brick_image, (cell_size, cell_size))
-            # Redimensionne l'image à la taille d'une cellule
-            
-        except:
-            # Si le chargement échoue
-            
-            self.brick_image = None
-            # Pas d'image (on dessinera un rectangle simple)
+        self.brick_image = assets.obstacle(cell_size)
+        # Image de brique partagée par tous les obstacles (barier.png chargée une seule fois)
+        # Si le fichier est absent, le motif de briques procédural est dessiné une fois et réutilisé
     
     def draw(self, screen):
         """
@@ -459,39 +337,8 @@ class Obstacle:
         y = OFFSET + self.position.y * cell_size
         # Calcule la position Y en pixels
         
-        if self.brick_image:
-            # Si l'image a été chargée avec succès
-            
-            screen.blit(self.brick_image, (x, y))
-            # Dessine l'image de brique
-            
-        else:
-            # Si pas d'image de brique chargée, dessine un rectangle avec texture de briques
-            BRICK_RED = (192, 57, 43) # Couleur rouge brique
-            BRICK_DARK = (169, 50, 38) # Couleur foncée pour les ombres
-            BRICK_LIGHT = (205, 97, 85)  # Couleur claire pour les reflets
-            
-            # Crée un rectangle pour l'obstacle
-            obstacle_rect = pygame.Rect(x, y, cell_size, cell_size)
-            # Dessine le fond de la brique avec coins arrondis
-            pygame.draw.rect(screen, BRICK_RED, obstacle_rect, border_radius=4)
-            # Hauteur d'une rangée de briques (cellule divisée en 3 horizontalement)
-            brick_height = cell_size // 3
-            # Largeur d'une brique (cellule divisée en 2 verticalement)
-            brick_width = cell_size // 2
-            # Dessine le motif de briques (3 rangées)
-            # Brique supérieure gauche
-            pygame.draw.rect(screen, BRICK_DARK, (x, y, brick_width - 1, brick_height - 1))
-            # Brique supérieure droite
-            pygame.draw.rect(screen, BRICK_DARK, (x + brick_width, y, brick_width - 1, brick_height - 1))
-            # Rangée du milieu (couleur claire) - brique entière
-            pygame.draw.rect(screen, BRICK_LIGHT, (x, y + brick_height, cell_size, brick_height - 1))
-            # Brique inférieure gauche
-            pygame.draw.rect(screen, BRICK_DARK, (x, y + 2 * brick_height, brick_width - 1, brick_height))
-            # Brique inférieure droite
-            pygame.draw.rect(screen, BRICK_DARK, (x + brick_width, y + 2 * brick_height, brick_width - 1, brick_height))
-            # Dessine une bordure autour de l'obstacle (largeur 2 pixels)
-            pygame.draw.rect(screen, BRICK_DARK, obstacle_rect, 2, border_radius=4)
+        screen.blit(self.brick_image, (x, y))
+        # Un seul blit d'une surface déjà convertie au format de l'écran
 
 
 class Snake:
@@ -510,6 +357,9 @@ class Snake:
         # Position [0] = tête (6, 9)
         # Positions [1] et [2] = corps (5, 9) et (4, 9)
         # Le serpent démarre orienté vers la droite
+
+        self.prev_body = list(self.snake_body)
+        # Corps au tick précédent : le dessin glisse de ces cases vers les cases actuelles
         
         self.direction = Vector2(1, 0)
         # Direction initiale: (1, 0) = vers la droite
@@ -525,122 +375,51 @@ class Snake:
         self.trail = []  # Trail effect
         # Liste pour stocker les positions de la traînée visuelle
         # Crée un effet de "queue fantôme" derrière le serpent
-        
-        try:
-            # Tente de charger les effets sonores
-            
-            self.eat_sound = pygame.mixer.Sound("snake_eat.wav")
-            # Son joué quand le serpent mange
-            
-            self.wall_hit_sound = pygame.mixer.Sound("snake_collision.wav")
-            # Son joué lors d'une collision (game over)
-            
-        except:
-            # Si les fichiers son n'existent pas
-            
-            self.eat_sound = None
-            self.wall_hit_sound = None
-            # Pas de son (le jeu continue sans audio)
+        # Les sons (manger, collision) sont dans la banque partagée snake_audio.sounds
    
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0, trail_length=TRAIL_LENGTH, glow=True):
         """
         Dessine le serpent à l'écran avec tous les effets visuels
+        Chaque case est un sprite de l'atlas du thème (un seul blit par case)
         Args:
             screen: Surface pygame où dessiner
+            alpha: Avancement entre le tick précédent et le tick courant (1 : sur les cases)
+            trail_length: Nombre de cases de traînée affichées (niveau de qualité)
+            glow: Lueur autour de la tête (niveau de qualité)
         """
+        atlas = snake_atlas(self.theme, cell_size, glow)
+        # Sprites construits une seule fois par thème (voir snake_sprites.py)
+
+        blits = []
+        # Liste (sprite, position) dessinée en un seul appel à screen.blits()
         
-        # === DESSINER L'EFFET DE TRAÎNÉE ===
-        for i, pos in enumerate(self.trail):
-            # Pour chaque position dans la traînée
-            # i = index (0 = plus récente, len-1 = plus ancienne)
-            # pos = position Vector2
-            
-            alpha = int(100 * (1 - i / len(self.trail)))
-            # Calcule la transparence: 100 pour la plus récente, 0 pour la plus ancienne
-            # Crée un effet de fondu progressif
-            
-            trail_surf = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
-            # Crée une surface transparente pour dessiner la traînée
-            
-            color = (*self.theme['trail'], alpha)
-            # Ajoute la transparence à la couleur du thème
-            # (*color, alpha) = (R, G, B, A)
-            
-            pygame.draw.circle(trail_surf, color, (cell_size//2, cell_size//2), cell_size//3)
-            # Dessine un cercle pour la traînée (plus petit que la tête)
-            
-            screen.blit(trail_surf, (OFFSET + pos.x * cell_size, OFFSET + pos.y * cell_size))
-            # Affiche la traînée à la position calculée
+        # === TRAÎNÉE ===
+        trail = self.trail[:trail_length]
+        # Les cases les plus récentes (la traînée est raccourcie aux niveaux de qualité bas)
+        for tile, pos in zip(atlas.trail[len(trail)], trail):
+            # Sprite de la case i d'une traînée de len(trail) cases
+            # (transparence de 100 pour la plus récente à ~0 pour la plus ancienne)
+            blits.append((tile, (OFFSET + pos.x * cell_size, OFFSET + pos.y * cell_size)))
         
-        # === DESSINER LE CORPS DU SERPENT ===
-        for i, seg in enumerate(self.snake_body):
-            # Pour chaque segment du corps
-            # i = 0 pour la tête, i > 0 pour le corps
-            
-            seg_rect = pygame.Rect(OFFSET + seg.x * cell_size,
-                                   OFFSET + seg.y * cell_size, 
-                                   cell_size, cell_size)
-            # Crée un rectangle pour ce segment
-            # Convertit position grille → pixels
-            
-            if i == 0:  # HEAD (TÊTE)
-                # === EFFET DE LUEUR AUTOUR DE LA TÊTE ===
-                glow_surf = pygame.Surface((cell_size + 10, cell_size + 10), pygame.SRCALPHA)
-                # Surface plus grande pour la lueur (10 pixels de plus)
-                
-                pygame.draw.circle(glow_surf, (*self.theme['snake_head'], 80), 
-                                 ((cell_size + 10)//2, (cell_size + 10)//2), (cell_size + 10)//2)
-                # Dessine un cercle semi-transparent pour la lueur
-                # 80 = alpha (assez transparent)
-                
-                screen.blit(glow_surf, (seg_rect.x - 5, seg_rect.y - 5))
-                # Affiche la lueur centrée sur la tête
-                
-                # === DESSINER LA TÊTE ===
-                pygame.draw.rect(screen, self.theme['snake_head'], seg_rect, border_radius=8)
-                # Rectangle avec coins arrondis pour la tête
-                
-                # === DESSINER LES YEUX ===
-                eye_size = 4
-                # Rayon des yeux en pixels
-                
-                eye_offset = 5
-                # Distance entre les yeux et le centre
-                
-                # Yeux blancs (sclère)
-                pygame.draw.circle(screen, WHITE, (seg_rect.centerx - eye_offset, seg_rect.centery - 3), eye_size)
-                # Œil gauche
-                
-                pygame.draw.circle(screen, WHITE, (seg_rect.centerx + eye_offset, seg_rect.centery - 3), eye_size)
-                # Œil droit
-                
-                # Pupilles noires
-                pygame.draw.circle(screen, BLACK, (seg_rect.centerx - eye_offset, seg_rect.centery - 3), 2)
-                # Pupille gauche
-                
-                pygame.draw.circle(screen, BLACK, (seg_rect.centerx + eye_offset, seg_rect.centery - 3), 2)
-                # Pupille droite
-                
-            else:  # BODY (CORPS)
-                # === DÉGRADÉ DE COULEUR SUR LE CORPS ===
-                ratio = i / len(self.snake_body)
-                # Calcule le ratio de position: 0 (proche de la tête) à 1 (bout de la queue)
-                
-                color = tuple(int(self.theme['snake'][j] + (self.theme['trail'][j] - self.theme['snake'][j]) * ratio) for j in range(3))
-                # Interpolation linéaire entre la couleur du serpent et la couleur de la traînée
-                # Crée un dégradé progressif du corps vers la queue
-                # Pour chaque composante RGB (j in range(3))
-                
-                pygame.draw.rect(screen, color, seg_rect, border_radius=7)
-                # Dessine le segment du corps avec la couleur calculée
-                
-                # === EFFET DE BRILLANCE (HIGHLIGHT) ===
-                highlight = pygame.Rect(seg_rect.x + 2, seg_rect.y + 2, cell_size - 4, cell_size - 4)
-                # Rectangle plus petit à l'intérieur du segment
-                
-                pygame.draw.rect(screen, (*color, 50), highlight, border_radius=5)
-                # Dessine un rectangle semi-transparent pour simuler une brillance
-                # 50 = alpha (très transparent)
+        body = interpolate(self.prev_body, self.snake_body, alpha)
+        # Positions en cases, entre le tick précédent et le tick courant
+
+        # === TÊTE (lueur, tête et yeux orientés dans la direction) ===
+        head_x, head_y = body[0]
+        blits.append((atlas.head(self.direction),
+                      (round(OFFSET + head_x * cell_size) - GLOW, round(OFFSET + head_y * cell_size) - GLOW)))
+        # La lueur déborde de GLOW pixels autour de la case
+        
+        # === CORPS (dégradé de la couleur du serpent vers celle de la traînée) ===
+        length = len(body)
+        body_tiles = atlas.body
+        for i in range(1, length):
+            x, y = body[i]
+            blits.append((body_tiles[i * GRADIENT_STEPS // length],
+                          (round(OFFSET + x * cell_size), round(OFFSET + y * cell_size))))
+            # i / length : 0 près de la tête, presque 1 au bout de la queue
+
+        screen.blits(blits, doreturn=False)
 
 
     def update(self):
@@ -649,6 +428,9 @@ class Snake:
         Gère le mouvement et la croissance
         """
         
+        self.prev_body = list(self.snake_body)
+        # Mémorise le corps avant le déplacement (interpolation du dessin)
+
         # === METTRE À JOUR LA TRAÎNÉE ===
         if len(self.snake_body) > 0:
             # Si le serpent existe
@@ -657,7 +439,7 @@ class Snake:
             # Ajoute la position du dernier segment (queue) au début de la traînée
             # copy() crée une copie pour éviter les références
             
-            if len(self.trail) > 8:
+            if len(self.trail) > TRAIL_LENGTH:
                 # Si la traînée est trop longue
                 
                 self.trail.pop()
@@ -701,6 +483,9 @@ class Snake:
         """
         self.snake_body = [Vector2(6, 9), Vector2(5, 9), Vector2(4, 9)]
         # Repositionne le serpent à sa position de départ (3 segments)
+
+        self.prev_body = list(self.snake_body)
+        # Pas de glissement depuis l'ancienne position
         
         self.direction = Vector2(1, 0)
         # Réinitialise la direction vers la droite
@@ -756,6 +541,12 @@ class Game:
         self.theme = COLOR_THEMES[theme_key]
         # Récupère le thème de couleurs choisi
         # Ex: COLOR_THEMES['neon'] = {'name': 'Neon Cyber', 'bg_start': ...}
+
+        self.theme_key = theme_key
+        # Clé du thème (sert de clé au cache de l'arrière-plan)
+
+        sounds.load()
+        # Décode les sons une seule fois (les parties suivantes réutilisent la banque)
         
         self.snake = Snake(self.theme)
         # Crée l'objet serpent avec le thème
@@ -765,9 +556,26 @@ class Game:
         
         self.score = 0
         # Score initial à 0
+
+        self.scoreboard = None
+        # Records et classement du niveau (Scoreboard de snake_leaderboard.py), branché par main()
+        # None : scores non enregistrés (replay, benchmark, images de référence)
+
+        self.standing = None
+        # Place au classement après le dernier game over : (rang, joueurs classés, percentile)
+
+        self.history = None
+        # Journal des parties terminées (HistoryLog de snake_history.py), branché par main()
+
+        self.ticks = 0
+        # Ticks joués dans la partie en cours (durée enregistrée dans l'historique)
         
-        self.particles = []
-        # Liste pour stocker les effets de particules actifs
+        self.particles = create_particle_pool()
+        # Pool unique pour toutes les particules de la partie (voir snake_particles.py)
+
+        self.quality = QUALITY_TIERS[0]
+        # Niveau de qualité des effets (tous les effets par défaut)
+        # Modifié à chaque frame par le contrôleur de qualité de main()
         
         # === GÉNÉRATION DES OBSTACLES ===
         self.obstacles = self.generate_obstacles(self.level_config['obstacles'])
@@ -830,31 +638,36 @@ class Game:
         return obstacles
         # Retourne la liste complète des obstacles générés
 
-    def draw(self, screen):
+    def draw(self, screen, now_ms=None, alpha=1.0):
         """
         Dessine tous les éléments du jeu à l'écran
         Args:
             screen: Surface pygame où dessiner
+            now_ms: Instant des animations en millisecondes (horloge de pygame si None)
+            alpha: Avancement entre les deux derniers ticks (déplacement interpolé du serpent)
         """
-        self.snake.draw(screen)
+        quality = self.quality
+        # Effets activés au niveau de qualité courant (voir snake_quality.py)
+
+        self.snake.draw(screen, alpha, quality['trail'], quality['glow'])
         # Dessine le serpent (corps, tête, yeux, traînée)
+
+        if not quality['animated']:
+            now_ms = 0
+            # Image fixe : la nourriture ne pulse plus
         
-        self.food1.draw(screen)
+        self.food1.draw(screen, now_ms, quality['glow'])
         # Dessine la première nourriture (pomme)
         
-        self.food2.draw(screen)
+        self.food2.draw(screen, now_ms, quality['glow'])
         # Dessine la deuxième nourriture (champignon)
+
+        # Les obstacles ne bougent pas : ils font partie de l'arrière-plan en cache
+        # (voir paint_background)
         
-        for obstacle in self.obstacles:
-            # Pour chaque obstacle
-            obstacle.draw(screen)
-            # Dessine l'obstacle
-        
-        # === DESSINER LES EFFETS DE PARTICULES ===
-        for particle in self.particles:
-            # Pour chaque effet de particules actif
-            particle.draw(screen)
-            # Dessine l'effet
+        # === DESSINER LES PARTICULES ===
+        self.particles.draw(screen)
+        # Toutes les particules en un seul appel (un sprite par couleur et rayon)
 
     def update(self):
         """
@@ -863,6 +676,9 @@ class Game:
         """
         if self.state == "RUNNING":
             # Si le jeu est en cours (pas en game over)
+
+            self.ticks += 1
+            # Un tick de plus dans cette partie
             
             self.snake.update()
             # Met à jour la position du serpent
@@ -876,19 +692,17 @@ class Game:
             if self.snake.check_collision_with_obstacles(self.obstacles):
                 # Vérifie si le serpent a touché un obstacle
                 
-                self.game_over()
+                self.game_over('obstacle')
                 # Déclenche le game over
-        
-        # === METTRE À JOUR LES PARTICULES ===
-        for particle in self.particles:
-            # Pour chaque effet de particules
-            
-            particle.update()
-            # Met à jour l'animation (mouvement, gravité, vie)
-        
-        self.particles = [p for p in self.particles if len(p.particles) > 0]
-        # Filtre: garde seulement les effets qui ont encore des particules vivantes
-        # Supprime les effets terminés
+
+    def animate(self, dt):
+        """
+        Met à jour les animations indépendantes du tick du serpent (appelé à chaque frame)
+        Args:
+            dt: Temps écoulé depuis la frame précédente (secondes)
+        """
+        self.particles.update(dt)
+        # Mouvement, gravité et vie de toutes les particules (vectorisé)
 
     def check_collision_with_food(self):
         """
@@ -909,8 +723,8 @@ class Game:
             y = OFFSET + head_pos.y * cell_size + cell_size // 2
             # Position Y du centre de la cellule (en pixels)
             
-            self.particles.append(ParticleEffect(x, y, RED))
-            # Crée un effet de particules rouges
+            self.particles.emit(x, y, RED, self.quality['particles'])
+            # Crée une gerbe de particules rouges (plus petite aux niveaux de qualité bas)
             
             # === REPOSITIONNER LA NOURRITURE ===
             self.food1.position = self.food1.generate_random_pos(self.snake.snake_body)
@@ -922,11 +736,8 @@ class Game:
             self.score += self.food1.get_points()
             # Ajoute les points au score (10 pour une pomme)
             
-            if self.snake.eat_sound:
-                # Si le son existe
-                
-                self.snake.eat_sound.play()
-                # Joue le son de manger
+            sounds.play('eat')
+            # Joue le son (rien si la banque est muette)
         
         # === VÉRIFIER COLLISION AVEC FOOD2 (CHAMPIGNON) ===
         if head_pos == self.food2.position:
@@ -934,7 +745,7 @@ class Game:
             
             x = OFFSET + head_pos.x * cell_size + cell_size // 2
             y = OFFSET + head_pos.y * cell_size + cell_size // 2
-            self.particles.append(ParticleEffect(x, y, ORANGE))
+            self.particles.emit(x, y, ORANGE, self.quality['particles'])
             # Particules oranges pour le champignon
             
             self.food2.position = self.food2.generate_random_pos(self.snake.snake_body)
@@ -942,14 +753,33 @@ class Game:
             self.score += self.food2.get_points()
             # 15 points pour un champignon
             
-            if self.snake.eat_sound:
-                self.snake.eat_sound.play()
+            sounds.play('eat')
 
-    def game_over(self):
+    def game_over(self, cause):
         """
         Gère la logique du game over
         Réinitialise le jeu et joue le son de collision
+        Args:
+            cause: Cause de la fin de partie ('obstacle' ou 'tail'), notée dans l'historique
         """
+        if self.scoreboard is not None:
+            self.scoreboard.submit("", self.player_name, self.score)
+            # Record du joueur pour ce niveau (classement mis à jour sur place,
+            # base écrite par le thread de ScoreWriter : le tick n'attend pas le disque)
+
+            self.standing = self.scoreboard.standing("", self.player_name)
+            # Tuple calculé ici : le dessin (éventuellement sur un autre thread) ne fait que le lire
+
+        if self.history is not None:
+            self.history.append(mode='premium', level=self.level, theme=self.theme_key,
+                                player_id="", name=self.player_name, score=self.score,
+                                length=len(self.snake.snake_body), ticks=self.ticks,
+                                duration_ms=self.ticks * self.level_config['speed'], cause=cause)
+            # Partie ajoutée au journal (écrite plus tard, par lot)
+
+        self.ticks = 0
+        # La partie suivante repart de zéro
+
         self.snake.reset()
         # Réinitialise le serpent à sa position de départ
         
@@ -965,11 +795,8 @@ class Game:
         self.score = 0
         # Réinitialise le score à 0
         
-        if self.snake.wall_hit_sound:
-            # Si le son de collision existe
-            
-            self.snake.wall_hit_sound.play()
-            # Joue le son
+        sounds.play('hit')
+        # Son de collision (rien si la banque est muette)
 
     def check_collision_with_tail(self):
         """
@@ -982,7 +809,7 @@ class Game:
         if self.snake.snake_body[0] in headless_body:
             # Si la position de la tête est dans le reste du corps
             
-            self.game_over()
+            self.game_over('tail')
             # Le serpent s'est mordu → game over
    
     def draw_game_over(self, screen):
@@ -993,7 +820,8 @@ class Game:
         """
         
         # === CRÉER UN OVERLAY SEMI-TRANSPARENT ===
-        overlay = pygame.Surface((cell_size * number_of_cells, cell_size * number_of_cells), pygame.SRCALPHA)
+        overlay = assets.track(pygame.Surface((cell_size * number_of_cells, cell_size * number_of_cells),
+                                              pygame.SRCALPHA))
         # Crée une surface de la taille du terrain de jeu avec support de transparence
         # SRCALPHA permet d'avoir un canal alpha (transparence)
         
@@ -1006,7 +834,7 @@ class Game:
         # Affiche l'overlay à la position du terrain de jeu
         
         # === TEXTE "GAME OVER" ===
-        font = pygame.font.Font(None, 80)
+        font = fonts.get(80)
         # Police grande taille (80 pixels)
         
         text = font.render('GAME OVER', True, RED)
@@ -1031,7 +859,7 @@ class Game:
         # Puis le texte par-dessus
         
         # === AFFICHAGE DU NOM DU JOUEUR ===
-        name_font = pygame.font.Font(None, 40)
+        name_font = fonts.get(40)
         # Police moyenne (40 pixels)
         
         name_text = name_font.render(f'Player: {self.player_name}', True, WHITE)
@@ -1043,9 +871,21 @@ class Game:
         
         screen.blit(name_text, name_rect)
         # Affiche le nom
+
+        # === PLACE AU CLASSEMENT DU NIVEAU ===
+        if self.standing:
+            rank, players, percentile = self.standing
+            rank_font = fonts.get(32)
+            rank_text = rank_font.render(f'Rang {rank}/{players} - centile {percentile:.0f}',
+                                         True, WHITE)
+            # Rang du record du joueur et part des joueurs classés qui ont fait moins
+
+            rank_rect = rank_text.get_rect(center=(OFFSET + number_of_cells * cell_size // 2,
+                                                   OFFSET + number_of_cells * cell_size // 2 + 30))
+            screen.blit(rank_text, rank_rect)
         
         # === INSTRUCTION DE REDÉMARRAGE ===
-        restart_font = pygame.font.Font(None, 36)
+        restart_font = fonts.get(36)
         restart_text = restart_font.render('Press Any Key to Continue', True, GOLD)
         # Texte en or pour attirer l'attention
         
@@ -1069,8 +909,8 @@ def select_theme():
     pygame.display.set_caption("🎨 Choose Your Snake Color")
     # Définit le titre de la fenêtre
     
-    clock = pygame.time.Clock()
-    # Horloge pour contrôler le FPS
+    view = MenuView()
+    # Attente des événements : l'écran n'est redessiné que si la sélection change
     
     selected = 0
     # Index du thème actuellement sélectionné (0-5)
@@ -1100,7 +940,7 @@ def select_theme():
             # Dessine une ligne horizontale avec cette couleur
         
         # === TITRE ===
-        title_font = pygame.font.Font(None, 70)
+        title_font = fonts.get(70)
         title = title_font.render("Choose Your Snake Style", True, WHITE)
         title_rect = title.get_rect(center=(450, 60))
         # Centre le titre à 60 pixels du haut
@@ -1148,7 +988,7 @@ def select_theme():
             # Bordure avec la couleur de la tête
             
             # === NOM DU THÈME ===
-            name_font = pygame.font.Font(None, 48)
+            name_font = fonts.get(48)
             name_text = name_font.render(theme_data['name'], True, WHITE)
             # Ex: "Neon Cyber", "Sunset Vibes", etc.
             
@@ -1157,7 +997,7 @@ def select_theme():
             
             # === FLÈCHE POUR LE THÈME SÉLECTIONNÉ ===
             if i == selected:
-                arrow_font = pygame.font.Font(None, 60)
+                arrow_font = fonts.get(60)
                 arrow = arrow_font.render("→", True, theme_data['accent'])
                 # Flèche de la couleur d'accent
                 
@@ -1165,7 +1005,7 @@ def select_theme():
                 # Affiche à droite
         
         # === INSTRUCTIONS ===
-        inst_font = pygame.font.Font(None, 32)
+        inst_font = fonts.get(32)
         inst = inst_font.render("↑↓ Select  |  ENTER Confirm", True, WHITE)
         inst_rect = inst.get_rect(center=(450, 550))
         screen.blit(inst, inst_rect)
@@ -1174,8 +1014,9 @@ def select_theme():
         # Met à jour l'affichage
         
         # === GESTION DES ÉVÉNEMENTS ===
-        for event in pygame.event.get():
-            # Pour chaque événement
+        for event in view.events(lambda: selected):
+            # Bloque jusqu'aux prochains événements ; la boucle se termine (et l'écran
+            # est redessiné) quand le thème sélectionné change
             
             if event.type == pygame.QUIT:
                 # Si le joueur ferme la fenêtre
@@ -1199,9 +1040,6 @@ def select_theme():
                     # Touche Entrée
                     return themes_list[selected]
                     # Retourne la clé du thème sélectionné et quitte la fonction
-        
-        clock.tick(60)
-        # Limite à 60 FPS
 
 
 def select_level():
@@ -1217,7 +1055,8 @@ def select_level():
     pygame.display.set_caption("🎯 Choose Difficulty Level")
     # Titre de la fenêtre
     
-    clock = pygame.time.Clock()
+    view = MenuView()
+    # Attente des événements : l'écran n'est redessiné que si la sélection change
     selected = 1
     # Niveau initial sélectionné = 1 (Débutant)
     
@@ -1242,7 +1081,7 @@ def select_level():
             # Dessine la ligne
         
         # === TITRE ===
-        title_font = pygame.font.Font(None, 70)
+        title_font = fonts.get(70)
         title = title_font.render("Select Difficulty", True, WHITE)
         title_rect = title.get_rect(center=(450, 60))
         
@@ -1300,7 +1139,7 @@ def select_level():
             # Bordure de 3 pixels avec la couleur du niveau
             
             # === NUMÉRO DU NIVEAU ===
-            num_font = pygame.font.Font(None, 100)
+            num_font = fonts.get(100)
             # Grande police pour le numéro
             
             num_text = num_font.render(str(level_num), True, LEVELS[level_num]['color'])
@@ -1312,7 +1151,7 @@ def select_level():
             screen.blit(num_text, num_rect)
             
             # === NOM DU NIVEAU ===
-            name_font = pygame.font.Font(None, 40)
+            name_font = fonts.get(40)
             name = name_font.render(LEVELS[level_num]['name'], True, WHITE)
             # "Débutant", "Intermédiaire" ou "Expert"
             
@@ -1320,7 +1159,7 @@ def select_level():
             screen.blit(name, name_rect)
             
             # === DESCRIPTION ===
-            desc_font = pygame.font.Font(None, 24)
+            desc_font = fonts.get(24)
             desc = desc_font.render(LEVELS[level_num]['description'], True, (200, 200, 200))
             # "Facile - Vitesse normale", etc.
             
@@ -1328,7 +1167,7 @@ def select_level():
             screen.blit(desc, desc_rect)
             
             # === STATISTIQUES ===
-            stats_font = pygame.font.Font(None, 26)
+            stats_font = fonts.get(26)
             
             speed_text = f"Vitesse: {200 - LEVELS[level_num]['speed']}%"
             # Calcule un pourcentage de vitesse
@@ -1349,7 +1188,7 @@ def select_level():
             # Affiche le nombre de murs
         
         # === INSTRUCTIONS ===
-        inst_font = pygame.font.Font(None, 32)
+        inst_font = fonts.get(32)
         inst = inst_font.render("←→ Select  |  ENTER Confirm", True, WHITE)
         inst_rect = inst.get_rect(center=(450, 550))
         screen.blit(inst, inst_rect)
@@ -1357,7 +1196,8 @@ def select_level():
         pygame.display.flip()
         
         # === GESTION DES ÉVÉNEMENTS ===
-        for event in pygame.event.get():
+        for event in view.events(lambda: selected):
+            # Bloque jusqu'à ce que le niveau sélectionné change
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -1377,8 +1217,6 @@ def select_level():
                     # Entrée
                     return selected
                     # Retourne le niveau sélectionné
-        
-        clock.tick(60)
 
 
 def get_player_name():
@@ -1393,16 +1231,17 @@ def get_player_name():
     
     pygame.display.set_caption("Enter Your Name")
     
-    font = pygame.font.Font(None, 48)
+    font = fonts.get(48)
     # Police pour le titre
     
-    small_font = pygame.font.Font(None, 32)
+    small_font = fonts.get(32)
     # Police pour le texte saisi
     
     player_name = ""
     # Chaîne vide pour stocker le nom
     
-    clock = pygame.time.Clock()
+    view = MenuView(blink=True)
+    # Attente des événements, avec un réveil à chaque clignotement du curseur
     
     while True:
         # === ARRIÈRE-PLAN DÉGRADÉ ===
@@ -1438,9 +1277,8 @@ def get_player_name():
         # Affiche avec un petit décalage depuis le bord
         
         # === CURSEUR CLIGNOTANT ===
-        if pygame.time.get_ticks() % 1000 < 500:
-            # Si le nombre de millisecondes depuis le démarrage modulo 1000 < 500
-            # Crée un effet de clignotement: visible 500ms, invisible 500ms
+        if view.cursor_visible():
+            # Effet de clignotement: visible 500ms, invisible 500ms
             
             cursor_x = 120 + text_surface.get_width() + 5
             # Position X du curseur = après le texte + 5 pixels
@@ -1456,7 +1294,8 @@ def get_player_name():
         pygame.display.flip()
         
         # === GESTION DES ÉVÉNEMENTS ===
-        for event in pygame.event.get():
+        for event in view.events(lambda: (player_name, view.cursor_visible())):
+            # Bloque jusqu'à ce que le nom saisi ou l'état du curseur change
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -1481,121 +1320,29 @@ def get_player_name():
                     
                     player_name += event.unicode
                     # Ajoute le caractère au nom
-        
-        clock.tick(60)
-
-
-# === APPEL DES FONCTIONS DE SÉLECTION ===
-player_name = get_player_name()
-# Obtient le nom du joueur
-
-theme_key = select_theme()
-# Obtient le thème choisi ('neon', 'sunset', etc.)
-
-level = select_level()
-# Obtient le niveau choisi (1, 2 ou 3)
-
-# === CRÉATION DE LA FENÊTRE DE JEU ===
-screen = pygame.display.set_mode((2*OFFSET + cell_size * number_of_cells, 
-                                  2*OFFSET + cell_size * number_of_cells))
-# Taille de la fenêtre:
-# 2*OFFSET = marges haut et bas (2 * 75 = 150)
-# cell_size * number_of_cells = terrain (20 * 20 = 400)
-# Total: 550x550 pixels
-
-pygame.display.set_caption(f"Snake Game - {LEVELS[level]['name']}")
-# Titre de la fenêtre: "Snake Game - Débutant" par exemple
-
-# === CRÉATION DE L'OBJET JEU ===
-game = Game(player_name, level, theme_key)
-# Crée une instance du jeu avec les paramètres choisis
-
-clock = pygame.time.Clock()
-# Horloge pour contrôler le FPS
-
-running = True
-# Flag pour la boucle principale
 
-# === CONFIGURATION DE L'ÉVÉNEMENT DE MOUVEMENT ===
-SNAKE_MOVE_EVENT = pygame.USEREVENT + 1
-# Crée un type d'événement personnalisé
-# pygame.USEREVENT est le premier ID d'événement personnalisé
-# +1 pour éviter les conflits
 
-pygame.time.set_timer(SNAKE_MOVE_EVENT, LEVELS[level]['speed'])
-# Crée un timer qui génère SNAKE_MOVE_EVENT toutes les X millisecondes
-# X = vitesse du niveau (200, 150 ou 100 ms)
-# Plus le nombre est petit, plus le serpent va vite
+# Couches statiques de l'écran de jeu, dessinées une seule fois par partie
+background = BackgroundLayer()
 
 
-# ===== LIGNES 719-740: BOUCLE PRINCIPALE - GESTION DES ÉVÉNEMENTS =====
-
-while running:
-    # Boucle principale du jeu
-    
-    for event in pygame.event.get():
-        # Pour chaque événement dans la file d'événements
-        
-        # === ÉVÉNEMENT DE MOUVEMENT DU SERPENT ===
-        if event.type == SNAKE_MOVE_EVENT:
-            # Si c'est notre timer personnalisé
-            
-            game.update()
-            # Met à jour la logique du jeu (mouvement, collisions, etc.)
-
-        # === REDÉMARRAGE APRÈS GAME OVER ===
-        if event.type == pygame.KEYDOWN:
-            # Si une touche est pressée
-            
-            if game.state == "STOPPED":
-                # Si le jeu est en état game over
-                
-                game.state = "RUNNING"
-                # Redémarre le jeu
-                # (le serpent a déjà été réinitialisé par game_over())
-
-        # === CONTRÔLES DU SERPENT ===
-        if event.type == pygame.KEYDOWN:
-            # Si une touche est pressée
-            
-            if event.key == pygame.K_UP and game.snake.direction != Vector2(0, 1):
-                # Flèche HAUT ET le serpent ne va PAS vers le bas
-                # (empêche de faire demi-tour à 180°)
-                
-                game.snake.direction = Vector2(0, -1)
-                # Change la direction vers le haut
-                # Y négatif = vers le haut (système de coordonnées pygame)
-                
-            if event.key == pygame.K_DOWN and game.snake.direction != Vector2(0, -1):
-                # Flèche BAS ET le serpent ne va PAS vers le haut
-                
-                game.snake.direction = Vector2(0, 1)
-                # Change la direction vers le bas
-                
-            if event.key == pygame.K_LEFT and game.snake.direction != Vector2(1, 0):
-                # Flèche GAUCHE ET le serpent ne va PAS vers la droite
-                
-                game.snake.direction = Vector2(-1, 0)
-                # Change la direction vers la gauche
-                
-            if event.key == pygame.K_RIGHT and game.snake.direction != Vector2(-1, 0):
-                # Flèche DROITE ET le serpent ne va PAS vers la gauche
-                
-                game.snake.direction = Vector2(1, 0)
-                # Change la direction vers la droite
-
-        # === FERMETURE DE LA FENÊTRE ===
-        if event.type == pygame.QUIT:
-            # Si le joueur clique sur X
-            
-            pygame.quit()
-            # Ferme pygame
-            
-            sys.exit()
-            # Quitte le programme
+def background_key(game):
+    """
+    Clé du cache de l'arrière-plan : tout ce que dessine paint_background()
+    Args:
+        game: Partie en cours
+    """
+    return (game.theme_key, game.level, cells_key(game.obstacles_positions))
 
 
-# ===== LIGNES 742-756: BOUCLE PRINCIPALE - RENDU GRAPHIQUE =====
+def paint_background(screen, game):
+    """
+    Dessine les couches qui ne changent pas pendant une partie
+    (dégradé, bordure lumineuse, obstacles et titre)
+    Args:
+        screen: Surface de la couche en cache (pas la fenêtre)
+        game: Partie en cours
+    """
 
     # === ARRIÈRE-PLAN DÉGRADÉ ===
     theme = game.theme
@@ -1630,27 +1377,17 @@ while running:
     pygame.draw.rect(screen, border_color, border_rect, 3, border_radius=10)
     # Dessine la bordure de 3 pixels
 
+    # === OBSTACLES ===
+    for obstacle in game.obstacles:
+        obstacle.draw(screen)
 
-# ===== LIGNES 757-782: BOUCLE PRINCIPALE - AFFICHAGE DU JEU ET UI =====
-
-    game.draw(screen)
-    # Dessine tous les éléments du jeu (serpent, nourriture, obstacles, particules)
-
-    if game.state == "STOPPED":
-        # Si le jeu est en game over
-        
-        game.draw_game_over(screen)
-        # Affiche l'écran de game over par-dessus
-
-    # === INTERFACE UTILISATEUR ===
-    # TITRE
-    title_font = pygame.font.Font(None, 60)
-    score_font = pygame.font.Font(None, 50)
+    # === TITRE ===
+    title_font = fonts.get(60)
     
-    title = title_font.render(f"Level {level}: {LEVELS[level]['name']}", True, WHITE)
+    title = title_font.render(f"Level {game.level}: {LEVELS[game.level]['name']}", True, WHITE)
     # Ex: "Level 2: Intermédiaire"
     
-    shadow_title = title_font.render(f"Level {level}: {LEVELS[level]['name']}", True, BLACK)
+    shadow_title = title_font.render(f"Level {game.level}: {LEVELS[game.level]['name']}", True, BLACK)
     # Ombre noire
     
     screen.blit(shadow_title, (OFFSET-3, 18))
@@ -1658,6 +1395,78 @@ while running:
     
     screen.blit(title, (OFFSET-5, 15))
     # Dessine le titre
+
+
+# Zones redessinées à chaque frame par-dessus l'arrière-plan (rendu --dirty-rects)
+BOARD_RECT = pygame.Rect(OFFSET, OFFSET, cell_size * number_of_cells, cell_size * number_of_cells)
+# Terrain : voile et textes du game over
+UI_RECT = pygame.Rect(0, OFFSET + cell_size * number_of_cells,
+                      2*OFFSET + cell_size * number_of_cells, OFFSET)
+# Bande du bas : score et nom du joueur
+
+
+def mark_dirty(dirty, game):
+    """
+    Déclare toutes les zones que draw_frame() dessine par-dessus l'arrière-plan
+    Args:
+        dirty: DirtyRects de la boucle de jeu
+        game: Partie en cours
+    """
+    dirty.add_cells(game.snake.trail, cell_size, OFFSET)
+    for body in (game.snake.prev_body, game.snake.snake_body):
+        # Un segment qui glisse couvre une partie de sa case précédente et de sa case actuelle
+        dirty.add_cells(body[:1], cell_size, OFFSET, margin=5)
+        # La lueur de la tête déborde de 5 pixels
+        dirty.add_cells(body[1:], cell_size, OFFSET)
+    dirty.add_cells((game.food1.position, game.food2.position), cell_size, OFFSET, margin=4)
+    # Pulsation (jusqu'à 110 %) et lueur de la nourriture
+    dirty.add(game.particles.bounds())
+    if game.state == "STOPPED":
+        dirty.add(BOARD_RECT)
+    dirty.add(UI_RECT)
+
+
+def draw_frame(screen, game, profiler=NULL_PROFILER, dirty=None, alpha=1.0, now_ms=None):
+    """
+    Dessine une image complète du jeu (sans mettre à jour l'affichage)
+    Args:
+        screen: Surface de la fenêtre
+        game: Partie en cours
+        profiler: Profileur de frames (phases 'background', 'draw', 'ui')
+        dirty: DirtyRects (--dirty-rects) : seules les zones de la frame précédente
+               sont effacées, celles de la frame courante sont enregistrées
+        alpha: Avancement entre les deux derniers ticks (FixedTimestep.alpha)
+        now_ms: Instant des animations (horloge de pygame si None ; fixé par snake_replay)
+    """
+    # ===== RENDU GRAPHIQUE =====
+
+    # === ARRIÈRE-PLAN (un seul blit, redessiné seulement si la clé change) ===
+    if dirty is None:
+        background.blit(screen, background_key(game), lambda surface: paint_background(surface, game))
+    else:
+        layer = background.get(background_key(game), screen.get_size(),
+                               lambda surface: paint_background(surface, game))
+        dirty.restore(screen, layer)
+        # Efface seulement les zones dessinées à la frame précédente
+        mark_dirty(dirty, game)
+    profiler.lap('background')
+
+
+    # ===== AFFICHAGE DU JEU ET UI =====
+
+    game.draw(screen, now_ms, alpha)
+    # Dessine tous les éléments du jeu (serpent, nourriture, obstacles, particules)
+
+    if game.state == "STOPPED":
+        # Si le jeu est en game over
+        
+        game.draw_game_over(screen)
+        # Affiche l'écran de game over par-dessus
+    profiler.lap('draw')
+
+    # === INTERFACE UTILISATEUR ===
+    # (le titre fait partie de l'arrière-plan en cache)
+    score_font = fonts.get(50)
     
     # === SCORE AVEC FOND ===
     score_bg = pygame.Rect(OFFSET-10, OFFSET + cell_size*number_of_cells+10, 250, 55)
@@ -1676,17 +1485,232 @@ while running:
     # Affiche le score
     
     # === NOM DU JOUEUR ===
-    name_font = pygame.font.Font(None, 35)
-    name = name_font.render(f"Player: {player_name}", True, WHITE)
+    name_font = fonts.get(35)
+    name = name_font.render(f"Player: {game.player_name}", True, WHITE)
     screen.blit(name, (OFFSET + 270, OFFSET + cell_size*number_of_cells+25))
     # Affiche le nom à droite du score
+    profiler.lap('ui')
+
+
+def main():
+    """
+    Point d'entrée : menus de sélection puis boucle principale du jeu
+    """
+    # === OPTIONS DE LA LIGNE DE COMMANDE ===
+    parser = argparse.ArgumentParser(description="Snake - version premium")
+    add_profile_arguments(parser)
+    add_hud_argument(parser)
+    add_dirty_argument(parser)
+    add_quality_argument(parser)
+    add_display_arguments(parser)
+    add_record_argument(parser)
+    add_threaded_argument(parser)
+    add_history_argument(parser)
+    args = parser.parse_args()
+    profiler = PerfOverlay(create_profiler(args, "snake_server"), visible=args.hud)
+    # Overlay de performances (F3) : reçoit les mesures de chaque phase
+    # et les transmet au profileur (NULL_PROFILER sans --profile : aucun coût)
+
+    dirty = create_dirty_rects(args)
+    # Suivi des zones modifiées (None sans --dirty-rects : rendu complet)
+
+    quality = create_quality_controller(args)
+    # Niveau des effets : automatique (selon le temps de frame) ou fixé par --quality
+
+    # === APPEL DES FONCTIONS DE SÉLECTION ===
+    player_name = get_player_name()
+    # Obtient le nom du joueur
+
+    theme_key = select_theme()
+    # Obtient le thème choisi ('neon', 'sunset', etc.)
+
+    level = select_level()
+    # Obtient le niveau choisi (1, 2 ou 3)
+
+    # === CRÉATION DE LA FENÊTRE DE JEU ===
+    display = create_framebuffer(args, (2*OFFSET + cell_size * number_of_cells,
+                                        2*OFFSET + cell_size * number_of_cells))
+    # Taille logique de l'écran de jeu:
+    # 2*OFFSET = marges haut et bas (2 * 75 = 150)
+    # cell_size * number_of_cells = terrain (20 * 20 = 400)
+    # Total: 550x550 pixels (fenêtre N fois plus grande avec --pixel-scale N)
+
+    screen = display.surface
+    # Surface où tout le jeu est dessiné (la fenêtre elle-même sans agrandissement)
+
+    pygame.display.set_caption(f"Snake Game - {LEVELS[level]['name']}")
+    # Titre de la fenêtre: "Snake Game - Débutant" par exemple
+
+    # === CRÉATION DE L'OBJET JEU ===
+    recorder = create_recorder(args, player_name, level, theme_key, LEVELS[level]['speed'])
+    # Enregistreur de la partie (None sans --record)
+
+    if recorder is not None:
+        recorder.seed_random()
+        # Graine connue : obstacles et nourriture seront identiques au replay
+
+    game = Game(player_name, level, theme_key)
+    # Crée une instance du jeu avec les paramètres choisis
+
+    game.scoreboard = Scoreboard(SCORES_DB, 'premium', level)
+    # Records de ce niveau (scores.db) et classement en mémoire reconstruit au démarrage
+
+    game.history = create_history(args)
+    # Historique des parties (None avec --no-history)
+
+    clock = pygame.time.Clock()
+    # Horloge pour contrôler le FPS
+
+    running = True
+    # Flag pour la boucle principale
+
+    elapsed = 0
+    # Durée de la frame précédente (millisecondes)
+
+    # === SIMULATION À PAS DE TEMPS FIXE ===
+    simulation = create_simulation(args, LEVELS[level]['speed'], game.update, game,
+                                   ('snake', 'food1', 'food2'))
+    # Le serpent avance d'une case toutes les X millisecondes
+    # X = vitesse du niveau (200, 150 ou 100 ms)
+    # Plus le nombre est petit, plus le serpent va vite
+    # Contrairement à un timer pygame, les ticks ne sont jamais retardés ni groupés :
+    # après une frame lente, les ticks manqués sont simulés à la frame suivante
+    # Avec --threaded, les ticks tournent sur leur propre thread et le dessin utilise
+    # la dernière copie figée de la partie (voir snake_pipeline.py)
 
-    pygame.display.update()
-    # Met à jour l'affichage (affiche tout ce qui a été dessiné)
+
+    # ===== BOUCLE PRINCIPALE - GESTION DES ÉVÉNEMENTS =====
+
+    while running:
+        # Boucle principale du jeu
+        profiler.begin_frame()
+        frame_start = time.perf_counter()
+        # Début du travail de la frame (l'attente de clock.tick() n'est pas comptée)
+
+        with simulation.lock:
+            # Touches appliquées à la partie entre deux ticks (sans effet sans --threaded)
+
+            game.quality = quality.tier
+            # Effets du niveau de qualité courant
+
+            if recorder is not None:
+                recorder.begin_frame(game)
+                # État avant les touches de cette frame
     
-    clock.tick(60)
-    # Limite le jeu à 60 FPS
-    # Si la boucle s'exécute plus vite, attend pour maintenir 60 FPS
+            for event in pygame.event.get():
+                # Pour chaque événement dans la file d'événements
+
+                if profiler.handle_event(event):
+                    continue
+                # F3 : affiche/masque l'overlay de performances
+
+                if dirty is not None:
+                    dirty.handle_event(event)
+                # Fenêtre réaffichée : la prochaine frame sera complète
+        
+                # === REDÉMARRAGE APRÈS GAME OVER ===
+                if event.type == pygame.KEYDOWN:
+                    # Si une touche est pressée
+            
+                    if game.state == "STOPPED":
+                        # Si le jeu est en état game over
+                
+                        game.state = "RUNNING"
+                        # Redémarre le jeu
+                        # (le serpent a déjà été réinitialisé par game_over())
+
+                # === CONTRÔLES DU SERPENT ===
+                if event.type == pygame.KEYDOWN:
+                    # Si une touche est pressée
+            
+                    if event.key == pygame.K_UP and game.snake.direction != Vector2(0, 1):
+                        # Flèche HAUT ET le serpent ne va PAS vers le bas
+                        # (empêche de faire demi-tour à 180°)
+                
+                        game.snake.direction = Vector2(0, -1)
+                        # Change la direction vers le haut
+                        # Y négatif = vers le haut (système de coordonnées pygame)
+                
+                    if event.key == pygame.K_DOWN and game.snake.direction != Vector2(0, -1):
+                        # Flèche BAS ET le serpent ne va PAS vers le haut
+                
+                        game.snake.direction = Vector2(0, 1)
+                        # Change la direction vers le bas
+                
+                    if event.key == pygame.K_LEFT and game.snake.direction != Vector2(1, 0):
+                        # Flèche GAUCHE ET le serpent ne va PAS vers la droite
+                
+                        game.snake.direction = Vector2(-1, 0)
+                        # Change la direction vers la gauche
+                
+                    if event.key == pygame.K_RIGHT and game.snake.direction != Vector2(-1, 0):
+                        # Flèche DROITE ET le serpent ne va PAS vers la gauche
+                
+                        game.snake.direction = Vector2(1, 0)
+                        # Change la direction vers la droite
+
+                # === FERMETURE DE LA FENÊTRE ===
+                if event.type == pygame.QUIT:
+                    # Si le joueur clique sur X
+
+                    if recorder is not None:
+                        recorder.save(simulation.ticks)
+                        # Écrit la session enregistrée (--record)
+            
+                    simulation.stop()
+                    # Arrête le thread de simulation (--threaded)
+
+                    game.scoreboard.close()
+                    # Écrit les records en attente (thread d'écriture des scores)
+
+                    if game.history is not None:
+                        game.history.close()
+                        # Écrit les parties en attente (avec fsync)
+
+                    pygame.quit()
+                    # Ferme pygame
+            
+                    sys.exit()
+                    # Quitte le programme
+
+            if recorder is not None:
+                recorder.record(simulation.ticks, game)
+                # Commandes de cette frame, datées du prochain tick simulé
+
+        profiler.lap('events')
+
+        # === TICKS DU SERPENT ===
+        frame, alpha = simulation.frame(elapsed)
+        # Met à jour la logique du jeu (mouvement, collisions, etc.) pour les ticks écoulés
+        # frame : partie à dessiner (avec --threaded, dernière copie publiée par la simulation)
+
+        frame.animate(elapsed / 1000.0)
+        # Particules : avancent à chaque frame, pas seulement au tick du serpent
+        profiler.lap('update')
+
+        draw_frame(screen, frame, profiler, dirty, alpha)
+        # Dessine l'arrière-plan, le terrain, le jeu et l'interface
+        # (la nourriture pulse à chaque frame : ce mode est toujours redessiné)
+
+        display.show(profiler, dirty, particles=len(frame.particles), quality=quality)
+        # Agrandit l'image dans la fenêtre (si --pixel-scale), dessine l'overlay de performances
+        # (nombre de particules vivantes, niveau de qualité) puis met à jour l'affichage
+        # (seulement les zones modifiées avec --dirty-rects)
+        profiler.lap('display')
+
+        quality.record((time.perf_counter() - frame_start) * 1000)
+        # Temps de travail de la frame : descend ou remonte d'un niveau si nécessaire
+    
+        elapsed = clock.tick(60)
+        # Limite le jeu à 60 FPS
+        # Si la boucle s'exécute plus vite, attend pour maintenir 60 FPS
+        # elapsed = durée réelle de la frame (ms), utilisée par la simulation et les animations
+        profiler.lap('wait')
+        profiler.end_frame()
+
+
+if __name__ == "__main__":
+    main()
 
 
 # RÉSUMÉ DU FONCTIONNEMENT:
@@ -1697,7 +1721,7 @@ while running:
 #    - pygame.init() pour initialiser pygame
 #
 # 2. CLASSES:
-#    - ParticleEffect: Effets visuels de particules
+#    - Particules: pool unique de snake_particles (créé par Game)
 #    - Food: Gestion de la nourriture (position, affichage, animation)
 #    - Obstacle: Murs sur le terrain
 #    - Snake: Le serpent (mouvement, affichage, collisions)
@@ -1709,12 +1733,13 @@ while running:
 #    - select_level(): Choix du niveau de difficulté
 #
 # 4. BOUCLE PRINCIPALE:
-#    - Gestion des événements (clavier, timer, fermeture)
-#    - Mise à jour de la logique (game.update())
+#    - Gestion des événements (clavier, fermeture)
+#    - Mise à jour de la logique (game.update()) à pas de temps fixe (snake_loop)
 #    - Rendu graphique (arrière-plan, bordures, jeu, UI)
 #    - Contrôle du FPS (60 images par seconde)
 #
-# Le jeu utilise un système d'événements avec un timer pour contrôler
-# la vitesse du serpent selon le niveau choisi. Les graphismes sont
+# Le jeu utilise un accumulateur de temps (pas fixe) pour contrôler
+# la vitesse du serpent selon le niveau choisi, et dessine le serpent
+# entre deux cases pour un mouvement fluide. Les graphismes sont
 # rendus avec des dégradés, des effets de lueur et des animations
 # pour créer une expérience visuelle moderne et attractive.
@@ -0,0 +1,108 @@
+# Ce fichier implémente l'enregistrement des parties de la version premium (option --record).
+# Une partie est entièrement déterminée par :
+# - sa configuration (niveau, thème, nom du joueur)
+# - la graine du module random au début de la partie (obstacles, nourriture)
+# - les commandes du joueur, datées en ticks de simulation (changement de direction,
+#   redémarrage après un game over)
+# Le fichier JSON enregistré est donc minuscule, et snake_replay.py peut rejouer la partie
+# tick par tick, sans fenêtre, pour en exporter les images.
+
+import json  # Format du fichier de session
+import random  # Graine de la partie
+
+# Version du format de fichier
+VERSION = 1
+
+
+class SessionRecorder:
+    """
+    Enregistre les commandes d'une partie
+    Utilisation dans une boucle de jeu :
+        recorder.begin_frame(game)              # avant les événements
+        ... événements (touches) ...
+        recorder.record(timestep.ticks, game)   # avant les ticks de la frame
+        ...
+        recorder.save(timestep.ticks)           # à la fermeture
+    """
+
+    def __init__(self, path, player_name, level, theme_key, step_ms, seed=None):
+        """
+        Args:
+            path: Fichier JSON de la session
+            player_name, level, theme_key: Configuration de la partie (choix des menus)
+            step_ms: Durée d'un tick (vitesse du niveau)
+            seed: Graine du module random (tirée au hasard si None)
+        """
+        self.path = path
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.session = {
+            'version': VERSION,
+            'mode': 'premium',
+            'player': player_name,
+            'level': level,
+            'theme': theme_key,
+            'seed': self.seed,
+            'step_ms': step_ms,
+            'ticks': 0,
+            'events': [],  # [tick, 'dir', dx, dy] ou [tick, 'start']
+        }
+        self._state = None
+        self._direction = None
+
+    def seed_random(self):
+        """Fixe la graine du module random : à appeler juste avant de créer la partie"""
+        random.seed(self.seed)
+
+    def begin_frame(self, game):
+        """Mémorise l'état de la partie avant les événements de la frame"""
+        self._state = game.state
+        self._direction = (int(game.snake.direction.x), int(game.snake.direction.y))
+
+    def record(self, tick, game):
+        """
+        Enregistre ce que les événements de la frame ont changé
+        Args:
+            tick: Numéro du prochain tick simulé (FixedTimestep.ticks)
+            game: Partie en cours
+        """
+        events = self.session['events']
+        if self._state == "STOPPED" and game.state == "RUNNING":
+            events.append([tick, 'start'])
+        direction = (int(game.snake.direction.x), int(game.snake.direction.y))
+        if direction != self._direction:
+            events.append([tick, 'dir', direction[0], direction[1]])
+
+    def save(self, ticks):
+        """Écrit la session (ticks : nombre de ticks simulés pendant la partie)"""
+        self.session['ticks'] = ticks
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.session, f)
+
+
+def load_session(path):
+    """
+    Lit une session enregistrée
+    Returns:
+        dict: Session (voir SessionRecorder)
+    """
+    with open(path, encoding='utf-8') as f:
+        session = json.load(f)
+    if session.get('version') != VERSION:
+        raise ValueError(f"Unsupported session version: {session.get('version')}")
+    return session
+
+
+def create_recorder(args, player_name, level, theme_key, step_ms):
+    """
+    Returns:
+        SessionRecorder avec --record, sinon None (aucun enregistrement)
+    """
+    if not args.record:
+        return None
+    return SessionRecorder(args.record, player_name, level, theme_key, step_ms)
+
+
+def add_record_argument(parser):
+    """Ajoute l'option --record à un argparse.ArgumentParser"""
+    parser.add_argument('--record', metavar='FICHIER',
+                        help="Enregistre la partie (rejouable avec snake_replay.py)")
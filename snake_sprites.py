@@ -0,0 +1,193 @@
+# Ce fichier implémente les sprites précalculés de la version premium (snake_server.py).
+#
+# === ATLAS DU SERPENT ===
+# Avant, Snake.draw créait à chaque frame une Surface SRCALPHA par case de traînée et une
+# pour la lueur de la tête, et recalculait la couleur du dégradé de chaque segment.
+# L'atlas est construit UNE fois par thème de COLOR_THEMES et contient :
+# - la tête avec sa lueur et ses yeux, dans les 4 orientations
+# - les cases de traînée pour chaque longueur et chaque position (paliers d'alpha)
+# - une table (LUT) de GRADIENT_STEPS cases du dégradé du corps
+# Dessiner un segment revient alors à un seul blit.
+#
+# === PULSATION DE LA NOURRITURE ===
+# Avant, Food.draw redimensionnait l'image et créait une Surface de lueur à chaque frame.
+# Le cycle de pulsation est rendu une fois par type de nourriture en PULSE_FRAMES images
+# (lueur comprise), partagées par toutes les instances et choisies selon l'heure.
+#
+# Les sprites sont créés par le gestionnaire d'images (snake_assets) : ils sont
+# convertis au format de l'affichage et ne doivent jamais être modifiés.
+
+import math  # Cosinus du cycle de pulsation
+
+import pygame
+
+from snake_assets import assets
+
+# Nombre de teintes précalculées pour le dégradé du corps (tête -> queue)
+GRADIENT_STEPS = 64
+# Longueur maximale de la traînée (nombre de cases)
+TRAIL_LENGTH = 8
+# Débordement de la lueur autour de la case de la tête (pixels)
+GLOW = 5
+WHITE = (236, 240, 241)
+BLACK = (0, 0, 0)
+# Pulsation de la nourriture : nombre d'images et durée d'un cycle (millisecondes)
+PULSE_FRAMES = 24
+PULSE_PERIOD_MS = 600
+# Débordement maximal (taille 110 % + lueur de 3 pixels) autour de la case
+PULSE_MARGIN = 4
+# Position des yeux (décalage depuis le centre de la case) selon la direction (dx, dy)
+EYES = {
+    (0, -1): ((-5, -3), (5, -3)),   # Haut
+    (0, 1): ((-5, 3), (5, 3)),      # Bas
+    (-1, 0): ((-3, -5), (-3, 5)),   # Gauche
+    (1, 0): ((3, -5), (3, 5)),      # Droite
+}
+
+
+class SnakeAtlas:
+    """
+    Sprites précalculés du serpent pour un thème et une taille de case
+    Utiliser snake_atlas(theme, cell_size) pour partager l'atlas entre les parties
+    """
+
+    def __init__(self, theme, cell_size, glow=True):
+        """
+        Args:
+            theme: Thème de COLOR_THEMES
+            cell_size: Taille d'une case en pixels
+            glow: Lueur autour de la tête (sans lueur, le sprite garde la même taille)
+        """
+        self.cell_size = cell_size
+        self.glow = glow
+        key = ('snake', theme['name'])
+        head, snake, trail = theme['snake_head'], theme['snake'], theme['trail']
+
+        # Tête : lueur semi-transparente + tête + yeux, décalée de GLOW pixels
+        self.heads = {}
+        for direction, eyes in EYES.items():
+            self.heads[direction] = assets.generated(
+                key + ('head', direction, glow), (cell_size + 2 * GLOW, cell_size + 2 * GLOW),
+                lambda surface, eyes=eyes: self.paint_head(surface, head, eyes))
+
+        # Corps : une case par palier du dégradé (couleur du serpent -> couleur de la traînée)
+        self.body = []
+        for step in range(GRADIENT_STEPS):
+            ratio = step / GRADIENT_STEPS
+            color = tuple(int(snake[j] + (trail[j] - snake[j]) * ratio) for j in range(3))
+            self.body.append(assets.generated(key + ('body', color), (cell_size, cell_size),
+                                              lambda surface, color=color: self.paint_body(surface, color)))
+
+        # Traînée : trail[n][i] = case i d'une traînée de n cases (alpha de 100 à ~0)
+        self.trail = [[]]
+        for length in range(1, TRAIL_LENGTH + 1):
+            tiles = []
+            for i in range(length):
+                alpha = int(100 * (1 - i / length))
+                tiles.append(assets.generated(key + ('trail', alpha), (cell_size, cell_size),
+                                              lambda surface, alpha=alpha: pygame.draw.circle(
+                                                  surface, (*trail, alpha),
+                                                  (cell_size // 2, cell_size // 2), cell_size // 3)))
+            self.trail.append(tiles)
+
+    def paint_head(self, surface, color, eyes):
+        """Lueur (alpha 80), tête arrondie et yeux orientés"""
+        size = surface.get_width()
+        if self.glow:
+            pygame.draw.circle(surface, (*color, 80), (size // 2, size // 2), size // 2)
+        rect = pygame.Rect(GLOW, GLOW, self.cell_size, self.cell_size)
+        pygame.draw.rect(surface, color, rect, border_radius=8)
+        for dx, dy in eyes:
+            center = (rect.centerx + dx, rect.centery + dy)
+            pygame.draw.circle(surface, WHITE, center, 4)
+            pygame.draw.circle(surface, BLACK, center, 2)
+
+    def paint_body(self, surface, color):
+        """Segment arrondi de la couleur du palier"""
+        # L'ancien "reflet" (même teinte, alpha ignoré sur l'écran) ne changeait aucun pixel
+        pygame.draw.rect(surface, color, surface.get_rect(), border_radius=7)
+
+    def head(self, direction):
+        """Sprite de la tête pour une direction (dx, dy) ; vers la droite par défaut"""
+        return self.heads.get((int(direction[0]), int(direction[1])), self.heads[(1, 0)])
+
+
+# Atlas déjà construits : (nom du thème, taille de case, lueur) -> SnakeAtlas
+_atlases = {}
+
+
+def snake_atlas(theme, cell_size, glow=True):
+    """
+    Atlas partagé pour un thème de COLOR_THEMES
+    À appeler après pygame.display.set_mode() (les cases sont converties à la création)
+    """
+    key = (theme['name'], cell_size, glow)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = SnakeAtlas(theme, cell_size, glow)
+        _atlases[key] = atlas
+    return atlas
+
+
+def pulse_scale(phase):
+    """
+    Facteur d'échelle de la nourriture (1.0 à 1.1) à une phase du cycle
+    Args:
+        phase: Position dans le cycle, de 0 (inclus) à 1 (exclu)
+    """
+    return 1 + 0.1 * abs(math.cos(math.pi * phase))
+
+
+class FoodPulse:
+    """
+    Images du cycle de pulsation d'un type de nourriture (image + lueur)
+    Utiliser food_pulse(...) pour partager les images entre toutes les nourritures du type
+    """
+
+    def __init__(self, key, image, glow_color, cell_size):
+        """
+        Args:
+            key: Clé du type de nourriture (par exemple 'apple')
+            image: Surface de la nourriture à la taille d'une case
+            glow_color: Couleur RGBA de la lueur (None : sans lueur)
+            cell_size: Taille d'une case en pixels
+        """
+        self.cell_size = cell_size
+        frame_size = (cell_size + 2 * PULSE_MARGIN, cell_size + 2 * PULSE_MARGIN)
+        self.frames = []
+        for k in range(PULSE_FRAMES):
+            size = int(cell_size * pulse_scale(k / PULSE_FRAMES))
+            # Une même taille (20, 21 ou 22 pixels) n'est dessinée qu'une fois
+            self.frames.append(assets.generated(
+                ('food_pulse', key, size, glow_color), frame_size,
+                lambda surface, size=size: self.paint(surface, image, glow_color, size)))
+
+    def paint(self, surface, image, glow_color, size):
+        """Lueur puis image redimensionnée, centrées comme l'ancien rendu"""
+        corner = PULSE_MARGIN + (self.cell_size - size) // 2
+        if glow_color is not None:
+            glow_size = size + 6
+            glow = assets.track(pygame.Surface((glow_size, glow_size), pygame.SRCALPHA))
+            pygame.draw.circle(glow, glow_color, (glow_size // 2, glow_size // 2), glow_size // 2)
+            surface.blit(glow, (corner - 3, corner - 3))
+        surface.blit(assets.track(pygame.transform.scale(image, (size, size))), (corner, corner))
+
+    def frame(self, now_ms):
+        """Image du cycle à l'instant now_ms (millisecondes)"""
+        return self.frames[int(now_ms) * PULSE_FRAMES // PULSE_PERIOD_MS % PULSE_FRAMES]
+
+
+# Pulsations déjà construites : (type de nourriture, taille de case, lueur) -> FoodPulse
+_pulses = {}
+
+
+def food_pulse(key, image, glow_color, cell_size):
+    """
+    Pulsation partagée d'un type de nourriture
+    À appeler après pygame.display.set_mode() (les images sont converties à la création)
+    """
+    pulse = _pulses.get((key, cell_size, glow_color))
+    if pulse is None:
+        pulse = FoodPulse(key, image, glow_color, cell_size)
+        _pulses[(key, cell_size, glow_color)] = pulse
+    return pulse
@@ -0,0 +1,117 @@
+# Ce fichier implémente le registre de polices et le cache de textes partagés par tous les modes.
+# - Chaque police (nom, taille) n'est chargée qu'UNE fois : fonts.get(60) au lieu de
+#   pygame.font.Font(None, 60), qui relisait le fichier de police à chaque frame
+# - Les textes rendus sont gardés dans un cache LRU (le moins récemment utilisé est
+#   retiré en premier) indexé par police, taille, texte et couleurs : un score,
+#   un titre ou un nom n'est re-rendu que lorsque son contenu change
+# - La taille du cache est bornée en octets de pixels, pas en nombre d'entrées
+# Comme pour snake_assets, les Surfaces renvoyées sont partagées : ne jamais les modifier.
+# Après pygame.quit() puis pygame.init() (client réseau : fenêtre de connexion puis jeu),
+# les polices chargées avant ne sont plus utilisables : appeler fonts.reload().
+
+from collections import OrderedDict  # Ordre d'utilisation des entrées (LRU)
+
+import pygame
+
+# Mémoire maximale occupée par les textes en cache (octets de pixels)
+MAX_CACHE_BYTES = 4 * 1024 * 1024
+
+
+class CachedFont:
+    """
+    Police du registre : même utilisation qu'une pygame.font.Font,
+    mais render() passe par le cache de textes
+    """
+
+    def __init__(self, registry, name, size):
+        self.registry = registry
+        self.name = name
+        self.size_px = size
+        self.load()
+
+    def load(self):
+        self.font = pygame.font.Font(self.name, self.size_px)
+
+    def render(self, text, antialias, color, background=None):
+        """Surface du texte (partagée, rendue seulement si absente du cache)"""
+        return self.registry.render(self, text, antialias, color, background)
+
+    def __getattr__(self, attribute):
+        # size(), get_height(), get_linesize()... : délégués à la vraie police
+        return getattr(self.font, attribute)
+
+
+class FontRegistry:
+    """
+    Polices chargées une seule fois et cache LRU des textes rendus
+    Statistiques : hits (textes trouvés), misses (textes rendus), bytes (mémoire occupée)
+    """
+
+    def __init__(self, max_bytes=MAX_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._fonts = {}  # (nom, taille) -> CachedFont
+        self._texts = OrderedDict()  # clé -> Surface, de la moins à la plus récemment utilisée
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, size, name=None):
+        """
+        Police partagée
+        Args:
+            size: Taille en pixels
+            name: Fichier de police (None : police par défaut de pygame)
+        """
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = CachedFont(self, name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, font, text, antialias, color, background=None):
+        """
+        Texte rendu avec font, pris dans le cache si possible
+        Args:
+            font: CachedFont du registre
+            text: Texte à afficher
+            antialias: Lissage des bords
+            color: Couleur du texte
+            background: Couleur de fond (None : fond transparent)
+        """
+        key = (font.name, font.size_px, text, antialias, tuple(color),
+               tuple(background) if background is not None else None)
+        surface = self._texts.get(key)
+        if surface is not None:
+            self._texts.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.font.render(text, antialias, color, background)
+        self._texts[key] = surface
+        self.bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        # Retire les textes les moins récemment utilisés (en gardant toujours le dernier)
+        while self.bytes > self.max_bytes and len(self._texts) > 1:
+            _, old = self._texts.popitem(last=False)
+            self.bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+        return surface
+
+    def clear(self):
+        """Vide le cache de textes (les polices restent chargées)"""
+        self._texts.clear()
+        self.bytes = 0
+
+    def reload(self):
+        """
+        Recharge toutes les polices et vide le cache de textes (après pygame.quit() puis
+        pygame.init() : rendre avec une police chargée avant le quit fait planter pygame)
+        Les CachedFont déjà distribuées restent valables : seule la vraie police est remplacée.
+        """
+        self.clear()
+        for font in self._fonts.values():
+            font.load()
+
+
+# Registre unique partagé par tous les modes, menus et overlays
+fonts = FontRegistry()